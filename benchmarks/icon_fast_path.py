@@ -0,0 +1,59 @@
+"""Cost of getting a cached icon image: `get_image` vs. constructing an icon.
+
+Both paths return the same cached `PhotoImage`; the benchmark measures the
+per-call overhead once the image is in the render cache, which is what hot
+loops (e.g. filling a Treeview) pay for every row.
+
+    python benchmarks/icon_fast_path.py
+"""
+
+import timeit
+import tkinter as tk
+
+from ttkbootstrap_icons import BootstrapIcon, get_image
+from ttkbootstrap_icons.bootstrap import BootstrapFontProvider
+
+NAMES = ["house", "gear", "folder", "file-earmark", "trash", "star-fill", "search", "person"]
+SIZE = 16
+COLOR = "#333333"
+NUMBER = 20_000
+
+
+def construct():
+    for name in NAMES:
+        BootstrapIcon(name, SIZE, COLOR).image
+
+
+def fast_path(provider):
+    for name in NAMES:
+        get_image(provider, name, SIZE, COLOR)
+
+
+def image_name(provider):
+    for name in NAMES:
+        str(get_image(provider, name, SIZE, COLOR))
+
+
+def per_call_us(func, *args):
+    seconds = min(timeit.repeat(lambda: func(*args), number=NUMBER // len(NAMES), repeat=5))
+    return seconds / NUMBER * 1e6
+
+
+def main():
+    root = tk.Tk()
+    root.withdraw()
+    provider = BootstrapFontProvider.shared()
+
+    for name in NAMES:
+        assert get_image(provider, name, SIZE, COLOR) is BootstrapIcon(name, SIZE, COLOR).image
+
+    baseline = per_call_us(construct)
+    print(f"{'BootstrapIcon(...).image':<28}{baseline:>8.2f} us/call")
+    for label, func in (("get_image(...)", fast_path), ("str(get_image(...))", image_name)):
+        cost = per_call_us(func, provider)
+        print(f"{label:<28}{cost:>8.2f} us/call {baseline / cost:>6.1f}x")
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
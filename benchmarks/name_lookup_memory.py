@@ -0,0 +1,104 @@
+"""Memory used by provider name lookups: compact index vs. nested dicts.
+
+Builds every style's name lookup for each installed provider and reports the
+bytes allocated (tracemalloc) by the compact `StyleIndex` tables compared with
+the previous representation of three dictionary keys per glyph per style.
+
+    python benchmarks/name_lookup_memory.py
+"""
+
+import importlib
+import tracemalloc
+
+from ttkbootstrap_icons.name_index import GlyphTable, StyleIndex
+
+PROVIDERS = {
+    "bootstrap": "ttkbootstrap_icons.bootstrap:BootstrapFontProvider",
+    "devicon": "ttkbootstrap_icons_devicon.provider:DeviconFontProvider",
+    "eva": "ttkbootstrap_icons_eva.provider:EvaFontProvider",
+    "fa": "ttkbootstrap_icons_fa.provider:FontAwesomeFontProvider",
+    "fluent": "ttkbootstrap_icons_fluent.provider:FluentSystemFontProvider",
+    "gmi": "ttkbootstrap_icons_gmi.provider:GoogleMaterialIconFontProvider",
+    "ion": "ttkbootstrap_icons_ion.provider:IonFontProvider",
+    "lucide": "ttkbootstrap_icons_lucide.provider:LucideFontProvider",
+    "mat": "ttkbootstrap_icons_mat.provider:MaterialDesignFontProvider",
+    "meteocons": "ttkbootstrap_icons_meteocons.provider:MeteoconsFontProvider",
+    "remix": "ttkbootstrap_icons_remix.provider:RemixFontProvider",
+    "rpga": "ttkbootstrap_icons_rpga.provider:RPGAFontProvider",
+    "simple": "ttkbootstrap_icons_simple.provider:SimpleFontProvider",
+    "typicons": "ttkbootstrap_icons_typicons.provider:TypiconsFontProvider",
+    "weather": "ttkbootstrap_icons_weather.provider:WeatherFontProvider",
+}
+
+
+def load_provider(spec):
+    module, cls = spec.split(":")
+    try:
+        return getattr(importlib.import_module(module), cls).shared()
+    except ImportError:
+        return None
+
+
+def styles_of(provider):
+    return provider.style_list if provider.has_styles else (None,)
+
+
+def glyphmaps_of(provider):
+    return [provider.load_glyphmap(style) for style in styles_of(provider)]
+
+
+def build_dicts(provider, glyphmaps):
+    """The previous representation: formatted, raw and `-<style>` keys per glyph."""
+    lookup = {}
+    for style, glyphmap in zip(styles_of(provider), glyphmaps):
+        pred = provider.style_map.get(style, {}).get("predicate") if style else None
+        style_lookup = {}
+        for n in list(glyphmap.keys()):
+            if pred is not None and not pred(n):
+                continue
+            style_lookup[provider.format_glyph_name(n)] = n
+            style_lookup[n] = n
+            if style and f"-{style}" not in n.lower():
+                style_lookup[f"{n}-{style}"] = n
+        lookup[style or "base"] = style_lookup
+    return lookup
+
+
+def build_index(provider, glyphmaps):
+    tables = {}
+    lookup = {}
+    for style, glyphmap in zip(styles_of(provider), glyphmaps):
+        table = tables.get(id(glyphmap))
+        if table is None:
+            table = tables[id(glyphmap)] = GlyphTable.for_glyphmap(glyphmap)
+        pred = provider.style_map.get(style, {}).get("predicate") if style else None
+        lookup[style or "base"] = StyleIndex.build(table, style, provider.format_glyph_name, pred)
+    return lookup
+
+
+def measure(build, provider, glyphmaps):
+    tracemalloc.start()
+    result = build(provider, glyphmaps)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main():
+    print(f"{'provider':<12}{'glyphs':>8}{'dicts (KB)':>14}{'index (KB)':>14}{'saved':>8}")
+    for name, spec in PROVIDERS.items():
+        provider = load_provider(spec)
+        if provider is None:
+            continue
+        glyphmaps = glyphmaps_of(provider)
+        unique = {id(g): g for g in glyphmaps}
+        glyphs = sum(len(g) for g in unique.values())
+        before = measure(build_dicts, provider, glyphmaps)
+        after = measure(build_index, provider, glyphmaps)
+        saved = 100 * (1 - after / before) if before else 0.0
+        print(f"{name:<12}{glyphs:>8}{before / 1024:>14.1f}{after / 1024:>14.1f}{saved:>7.0f}%")
+
+
+if __name__ == "__main__":
+    main()
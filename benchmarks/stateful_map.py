@@ -0,0 +1,100 @@
+"""Cost of `StatefulIconMixin.map()` on a button with four mapped states.
+
+Compares building a child style the way the mixin used to (one icon instance
+per state image, kept here as a `_render_icon` override) with the batched
+path that renders every state from one glyph mask, plus a repeat mapping of
+an already built style, which is served from the mixin's memo.
+
+Every parent style has its own state colors, so each mapping renders new
+images in both variants.
+
+    python benchmarks/stateful_map.py
+"""
+
+import time
+import tkinter as tk
+from tkinter import ttk
+
+from ttkbootstrap_icons import BootstrapIcon
+from ttkbootstrap_icons.stateful_icon_mixin import StatefulIconMixin
+
+STATES = ("pressed", "hover", "focus", "disabled")
+NAME = "house"
+SIZE = 16
+NUMBER = 200
+
+
+class PerStateIcon(BootstrapIcon):
+    """Renders each state image by constructing a sibling icon."""
+
+    def _render_icon(self, name, size, color):
+        return type(self)(name, size, color).image
+
+
+def define_styles(style, prefix):
+    """Create `NUMBER` parent button styles with four state colors each."""
+    names = []
+    for i in range(NUMBER):
+        name = f"{prefix}{i}.TButton"
+        shade = f"#{i % 256:02x}{(i * 7) % 256:02x}"
+        style.configure(name, foreground=f"{shade}10")
+        style.map(name, foreground=[(state, f"{shade}{40 + 40 * j:02x}") for j, state in enumerate(STATES)])
+        names.append(name)
+    return names
+
+
+def reset():
+    StatefulIconMixin._style_memo.clear()
+    StatefulIconMixin._themed_images.clear()
+    StatefulIconMixin._child_maps.clear()
+    StatefulIconMixin._widget_styles.clear()
+    StatefulIconMixin._child_refs.clear()
+
+
+def per_call_us(root, icon_cls, parent_styles):
+    """Map one icon onto a fresh button of each parent style.
+
+    Returns microseconds per `map()` and the buttons, which the caller
+    destroys: destroying the last button of a child style releases it and
+    its memo entry.
+    """
+    icon = icon_cls(NAME, SIZE)
+    buttons = [ttk.Button(root, style=name) for name in parent_styles]
+    start = time.perf_counter()
+    for button in buttons:
+        icon.map(button)
+    elapsed = time.perf_counter() - start
+    return elapsed / len(buttons) * 1e6, buttons
+
+
+def destroy(buttons):
+    for button in buttons:
+        button.destroy()
+
+
+def main():
+    root = tk.Tk()
+    root.withdraw()
+    style = ttk.Style(root)
+
+    # Load the font and rasterize the glyph mask outside the measurements
+    BootstrapIcon(NAME, SIZE)
+
+    reset()
+    before, buttons = per_call_us(root, PerStateIcon, define_styles(style, "PerState"))
+    destroy(buttons)
+    reset()
+    after, first = per_call_us(root, BootstrapIcon, define_styles(style, "Batched"))
+    # The first batch stays alive so its child styles remain memoized
+    repeat, buttons = per_call_us(root, BootstrapIcon, [f"Batched{i}.TButton" for i in range(NUMBER)])
+    destroy(buttons)
+    destroy(first)
+
+    print(f"{'map(), instance per state':<34}{before:>9.1f} us/call")
+    print(f"{'map(), batched from one mask':<34}{after:>9.1f} us/call {before / after:>6.1f}x")
+    print(f"{'map(), repeat (memoized)':<34}{repeat:>9.1f} us/call {before / repeat:>6.1f}x")
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -27,7 +27,7 @@ class DevIcon(Icon):
     """
 
     def __init__(self, name: str, size: int = 24, color: str = "black", style: DevStyles | None = None):
-        prov = DeviconFontProvider()
+        prov = DeviconFontProvider.shared()
         DevIcon.initialize_with_provider(prov)
         resolved = prov.resolve_icon_name(name, style)
         super().__init__(resolved, size, color)
@@ -14,6 +14,8 @@ try:
         glyphmap_from_ttf,
         glyphmap_from_css,
         write_glyphmap,
+        write_name_indexes,
+        write_glyph_metrics,
         ensure_dir,
     )
 except Exception:  # pragma: no cover - fallback path loader
@@ -31,10 +33,14 @@ except Exception:  # pragma: no cover - fallback path loader
         glyphmap_from_ttf = mod.glyphmap_from_ttf
         glyphmap_from_css = mod.glyphmap_from_css
         write_glyphmap = mod.write_glyphmap
+        write_name_indexes = mod.write_name_indexes
+        write_glyph_metrics = mod.write_glyph_metrics
         ensure_dir = mod.ensure_dir
     else:
         raise RuntimeError("Unable to load ttkbootstrap_icons.tooling module")
 
+from ttkbootstrap_icons_devicon.provider import DeviconFontProvider
+
 
 PRESETS = {
     # Devicon upstream raw files
@@ -173,6 +179,10 @@ def main(argv=None):
 
     write_glyphmap(pkg_root / "glyphmap.json", mapping)
     print(f"Wrote: {pkg_root / 'glyphmap.json'}")
+    for path in write_name_indexes(DeviconFontProvider(), pkg_root):
+        print(f"Wrote: {path}")
+    for path in write_glyph_metrics(DeviconFontProvider(), pkg_root):
+        print(f"Wrote: {path}")
     print(f"Font at: {font_path}")
 
 
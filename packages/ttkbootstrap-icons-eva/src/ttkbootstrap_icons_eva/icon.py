@@ -26,7 +26,7 @@ class EvaIcon(Icon):
     """
 
     def __init__(self, name: str, size: int = 24, color: str = "black", style: EvaStyles | None = None):
-        prov = EvaFontProvider()
+        prov = EvaFontProvider.shared()
         EvaIcon.initialize_with_provider(prov)
         resolved = prov.resolve_icon_name(name, style)
         super().__init__(resolved, size, color)
@@ -9,8 +9,11 @@ from ttkbootstrap_icons.tooling import (
     glyphmap_from_ttf,
     glyphmap_from_css,
     write_glyphmap,
+    write_name_indexes,
+    write_glyph_metrics,
     ensure_dir,
 )
+from ttkbootstrap_icons_eva.provider import EvaFontProvider
 from urllib.parse import urljoin
 import re
 
@@ -131,6 +134,10 @@ def main(argv=None):
     # Write a single combined glyphmap
     write_glyphmap(pkg_root / "glyphmap.json", mapping)
     print(f"Wrote: {pkg_root / 'glyphmap.json'}")
+    for path in write_name_indexes(EvaFontProvider(), pkg_root):
+        print(f"Wrote: {path}")
+    for path in write_glyph_metrics(EvaFontProvider(), pkg_root):
+        print(f"Wrote: {path}")
     print(f"Font at: {font_path}")
 
 
@@ -25,7 +25,7 @@ class FAIcon(Icon):
     """
 
     def __init__(self, name: str, size: int = 24, color: str = "black", style: FAStyles | None = None):
-        prov = FontAwesomeFontProvider()
+        prov = FontAwesomeFontProvider.shared()
         # Resolve the style from the name if not explicitly provided
         resolved_style = prov.resolve_icon_style(name, style)
         FAIcon.initialize_with_provider(prov, resolved_style)
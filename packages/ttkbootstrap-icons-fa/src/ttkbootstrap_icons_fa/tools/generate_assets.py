@@ -9,8 +9,11 @@ from ttkbootstrap_icons.tooling import (
     glyphmap_from_metadata,
     glyphmap_from_ttf,
     write_glyphmap,
+    write_name_indexes,
+    write_glyph_metrics,
     ensure_dir,
 )
+from ttkbootstrap_icons_fa.provider import FontAwesomeFontProvider
 
 
 PRESETS = {
@@ -93,6 +96,10 @@ def main(argv=None):
 
     write_glyphmap(glyphmap_path, mapping)
     print(f"Wrote: {glyphmap_path}")
+    for path in write_name_indexes(FontAwesomeFontProvider(), pkg_root):
+        print(f"Wrote: {path}")
+    for path in write_glyph_metrics(FontAwesomeFontProvider(), pkg_root):
+        print(f"Wrote: {path}")
     print(f"Font at: {font_path}")
 
 
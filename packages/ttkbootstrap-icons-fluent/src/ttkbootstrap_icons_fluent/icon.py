@@ -26,7 +26,7 @@ class FluentIcon(Icon):
     """
 
     def __init__(self, name: str, size: int = 24, color: str = "black", style: FluentStyles | None = None):
-        prov = FluentSystemFontProvider()
+        prov = FluentSystemFontProvider.shared()
         resolved_style = prov.resolve_icon_style(name, style)
         FluentIcon.initialize_with_provider(prov, resolved_style)
         resolved = prov.resolve_icon_name(name, style)
@@ -9,8 +9,11 @@ from ttkbootstrap_icons.tooling import (
     glyphmap_from_metadata,
     glyphmap_from_ttf,
     write_glyphmap,
+    write_name_indexes,
+    write_glyph_metrics,
     ensure_dir,
 )
+from ttkbootstrap_icons_fluent.provider import FluentSystemFontProvider
 from urllib.error import HTTPError, URLError
 
 """
@@ -172,6 +175,10 @@ def main(argv=None):
     out_map = args.out_map or "glyphmap.json"
     write_glyphmap(pkg_root / out_map, mapping)
     print(f"Wrote: {pkg_root / out_map}")
+    for path in write_name_indexes(FluentSystemFontProvider(), pkg_root):
+        print(f"Wrote: {path}")
+    for path in write_glyph_metrics(FluentSystemFontProvider(), pkg_root):
+        print(f"Wrote: {path}")
     print(f"Font at: {font_path}")
 
 
@@ -25,7 +25,7 @@ class GMatIcon(Icon):
     """
 
     def __init__(self, name: str, size: int = 24, color: str = "black", style: GMatStyles | None = None):
-        prov = GoogleMaterialIconFontProvider()
+        prov = GoogleMaterialIconFontProvider.shared()
         # Resolve the style from the name if not explicitly provided
         resolved_style = prov.resolve_icon_style(name, style)
         GMatIcon.initialize_with_provider(prov, resolved_style)
@@ -8,8 +8,11 @@ from ttkbootstrap_icons.tooling import (
     load_text,
     glyphmap_from_ttf,
     write_glyphmap,
+    write_name_indexes,
+    write_glyph_metrics,
     ensure_dir,
 )
+from ttkbootstrap_icons_gmi.provider import GoogleMaterialIconFontProvider
 
 
 def parse_codepoints_text(text: str) -> dict[str, int]:
@@ -135,6 +138,10 @@ def main(argv=None):
         glyphmap_path = pkg_root / f"glyphmap-{style}.json"
         write_glyphmap(glyphmap_path, mapping)
         print(f"Wrote: {glyphmap_path}")
+    for path in write_name_indexes(GoogleMaterialIconFontProvider(), pkg_root):
+        print(f"Wrote: {path}")
+    for path in write_glyph_metrics(GoogleMaterialIconFontProvider(), pkg_root):
+        print(f"Wrote: {path}")
 
     print("\nDownloaded fonts:")
     for label, p in (
@@ -18,7 +18,7 @@ class IonIcon(Icon):
     """
 
     def __init__(self, name: str, size: int = 24, color: str = "black", **kwargs):
-        prov = IonFontProvider()
+        prov = IonFontProvider.shared()
         IonIcon.initialize_with_provider(prov)
         resolved = prov.resolve_icon_name(name, **kwargs)
         super().__init__(resolved, size, color)
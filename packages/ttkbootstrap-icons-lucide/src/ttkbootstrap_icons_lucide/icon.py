@@ -18,7 +18,7 @@ class LucideIcon(Icon):
     """
 
     def __init__(self, name: str, size: int = 24, color: str = "black", **kwargs):
-        prov = LucideFontProvider()
+        prov = LucideFontProvider.shared()
         LucideIcon.initialize_with_provider(prov)
         resolved = prov.resolve_icon_name(name, **kwargs)
         super().__init__(resolved, size, color)
@@ -26,7 +26,7 @@ class MatIcon(Icon):
     """
 
     def __init__(self, name: str, size: int = 24, color: str = "black", style: MatStyles | None = None):
-        prov = MaterialDesignFontProvider()
+        prov = MaterialDesignFontProvider.shared()
         MatIcon.initialize_with_provider(prov)
         resolved = prov.resolve_icon_name(name, style)
         super().__init__(resolved, size, color)
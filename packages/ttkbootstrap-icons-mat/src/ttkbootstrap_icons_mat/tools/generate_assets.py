@@ -11,8 +11,11 @@ from ttkbootstrap_icons.tooling import (
     glyphmap_from_ttf,
     glyphmap_from_css,
     write_glyphmap,
+    write_name_indexes,
+    write_glyph_metrics,
     ensure_dir,
 )
+from ttkbootstrap_icons_mat.provider import MaterialDesignFontProvider
 
 
 PRESETS = {
@@ -113,6 +116,10 @@ def main(argv=None):
 
     write_glyphmap(pkg_root / "glyphmap.json", mapping)
     print(f"Wrote: {pkg_root / 'glyphmap.json'}")
+    for path in write_name_indexes(MaterialDesignFontProvider(), pkg_root):
+        print(f"Wrote: {path}")
+    for path in write_glyph_metrics(MaterialDesignFontProvider(), pkg_root):
+        print(f"Wrote: {path}")
     print(f"Font at: {font_path}")
 
 
@@ -19,7 +19,7 @@ class MeteoIcon(Icon):
     """
 
     def __init__(self, name: str, size: int = 24, color: str = "black", **kwargs):
-        prov = MeteoconsFontProvider()
+        prov = MeteoconsFontProvider.shared()
         MeteoIcon.initialize_with_provider(prov)
         resolved = prov.resolve_icon_name(name, **kwargs)
         super().__init__(resolved, size, color)
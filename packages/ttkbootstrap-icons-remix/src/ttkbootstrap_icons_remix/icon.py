@@ -26,7 +26,7 @@ class RemixIcon(Icon):
     """
 
     def __init__(self, name: str, size: int = 24, color: str = "black", style: RemixStyles | None = None):
-        prov = RemixFontProvider()
+        prov = RemixFontProvider.shared()
         RemixIcon.initialize_with_provider(prov)
         resolved = prov.resolve_icon_name(name, style)
         super().__init__(resolved, size, color)
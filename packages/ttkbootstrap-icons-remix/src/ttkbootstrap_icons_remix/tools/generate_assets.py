@@ -9,8 +9,11 @@ from ttkbootstrap_icons.tooling import (
     glyphmap_from_metadata,
     glyphmap_from_ttf,
     write_glyphmap,
+    write_name_indexes,
+    write_glyph_metrics,
     ensure_dir,
 )
+from ttkbootstrap_icons_remix.provider import RemixFontProvider
 
 
 PRESETS = {
@@ -63,6 +66,10 @@ def main(argv=None):
 
     write_glyphmap(pkg_root / "glyphmap.json", mapping)
     print(f"Wrote: {pkg_root / 'glyphmap.json'}")
+    for path in write_name_indexes(RemixFontProvider(), pkg_root):
+        print(f"Wrote: {path}")
+    for path in write_glyph_metrics(RemixFontProvider(), pkg_root):
+        print(f"Wrote: {path}")
     print(f"Font at: {font_path}")
 
 
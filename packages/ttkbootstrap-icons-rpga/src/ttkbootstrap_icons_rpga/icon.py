@@ -18,7 +18,7 @@ class RPGAIcon(Icon):
     """
 
     def __init__(self, name: str, size: int = 24, color: str = "black", **kwargs):
-        prov = RPGAFontProvider()
+        prov = RPGAFontProvider.shared()
         RPGAIcon.initialize_with_provider(prov)
         resolved = prov.resolve_icon_name(name, **kwargs)
         super().__init__(resolved, size, color)
@@ -15,7 +15,7 @@ class SimpleIcon(Icon):
     """
 
     def __init__(self, name: str, size: int = 24, color: str = "black", **kwargs):
-        prov = SimpleFontProvider()
+        prov = SimpleFontProvider.shared()
         SimpleIcon.initialize_with_provider(prov)
         resolved = prov.resolve_icon_name(name, **kwargs)
         super().__init__(resolved, size, color)
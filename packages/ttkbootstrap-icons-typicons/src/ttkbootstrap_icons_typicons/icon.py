@@ -11,7 +11,7 @@ class TypiconsIcon(Icon):
     """
 
     def __init__(self, name: str, size: int = 24, color: str = "black", **kwargs):
-        prov = TypiconsFontProvider()
+        prov = TypiconsFontProvider.shared()
         TypiconsIcon.initialize_with_provider(prov)
         resolved = prov.resolve_icon_name(name, **kwargs)
         super().__init__(resolved, size, color)
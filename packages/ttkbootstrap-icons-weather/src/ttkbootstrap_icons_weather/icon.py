@@ -18,7 +18,7 @@ class WeatherIcon(Icon):
     """
 
     def __init__(self, name: str, size: int = 24, color: str = "black", **kwargs):
-        prov = WeatherFontProvider()
+        prov = WeatherFontProvider.shared()
         WeatherIcon.initialize_with_provider(prov)
         resolved = prov.resolve_icon_name(name, **kwargs)
         super().__init__(resolved, size, color)
@@ -1,12 +1,20 @@
 from ttkbootstrap_icons.bootstrap import BootstrapIcon
-from ttkbootstrap_icons.icon import Icon
+from ttkbootstrap_icons.icon import Icon, get_image, rasterize
 from ttkbootstrap_icons._pyinstaller import get_hook_dirs
+from ttkbootstrap_icons.manifest import preload, start_recording, stop_recording
+from ttkbootstrap_icons.prerender import PrerenderQueue
 from ttkbootstrap_icons.registry import ProviderRegistry, load_external_providers
 
 __all__ = [
     "BootstrapIcon",
     "Icon",
+    "get_image",
+    "rasterize",
     "get_hook_dirs",
+    "PrerenderQueue",
+    "preload",
+    "start_recording",
+    "stop_recording",
     "ProviderRegistry",
     "load_external_providers",
 ]
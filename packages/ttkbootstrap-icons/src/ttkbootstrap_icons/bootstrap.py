@@ -49,7 +49,7 @@ class BootstrapIcon(Icon):
     """
 
     def __init__(self, name: str, size: int = 24, color: str = "black", style: BootstrapStyles | None = None):
-        prov = BootstrapFontProvider()
+        prov = BootstrapFontProvider.shared()
         BootstrapIcon.initialize_with_provider(prov)
         resolved = prov.resolve_icon_name(name, style)
         super().__init__(resolved, size, color)
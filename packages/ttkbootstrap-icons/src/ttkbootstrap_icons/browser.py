@@ -14,6 +14,9 @@ from ttkbootstrap_icons.bootstrap import BootstrapFontProvider
 from ttkbootstrap_icons.icon import Icon
 from ttkbootstrap_icons.registry import ProviderRegistry, load_external_providers
 
+# Cache namespace of the icons shown in the grid
+GRID_NAMESPACE = "ttkbootstrap_icons.browser-grid"
+
 
 class SimpleIconGrid:
     def __init__(self, parent, provider, icon_names, icon_size=32, icon_color="black", icon_style=None, on_select=None):
@@ -105,7 +108,8 @@ class SimpleIconGrid:
             try:
                 Icon.initialize_with_provider(self.provider, style=self.icon_style)
                 resolved_name = self.provider.resolve_icon_name(name, style=self.icon_style)
-                icon_obj = Icon(resolved_name, size=self.icon_size, color=self.icon_color)
+                with Icon.cache_namespace(GRID_NAMESPACE):
+                    icon_obj = Icon(resolved_name, size=self.icon_size, color=self.icon_color)
                 img = self.canvas.create_image(x, y, image=icon_obj.image)
                 canvas_items.append(img)
 
@@ -130,10 +134,10 @@ class SimpleIconGrid:
             self.visible_items[idx] = (canvas_items, icon_obj)
 
     def change_icon_set(self, provider, icon_names):
+        Icon.invalidate(provider=self.provider, namespace=GRID_NAMESPACE)
         self.provider = provider
         self.all_icon_names = list(icon_names)
         self.filtered = list(icon_names)
-        Icon._cache.clear()
         for items, _ in list(self.visible_items.values()):
             for it in items:
                 self.canvas.delete(it)
@@ -156,9 +160,10 @@ class SimpleIconGrid:
         self._render_visible()
 
     def update_icon_settings(self, size, color):
+        if (size, color) != (self.icon_size, self.icon_color):
+            Icon.invalidate(size=self.icon_size, color=self.icon_color, namespace=GRID_NAMESPACE)
         self.icon_size = size
         self.icon_color = color
-        Icon._cache.clear()
         for items, _ in list(self.visible_items.values()):
             for it in items:
                 self.canvas.delete(it)
@@ -166,8 +171,13 @@ class SimpleIconGrid:
         self._render_visible()
 
     def update_style(self, style):
+        if style != self.icon_style:
+            Icon.invalidate(
+                provider=self.provider,
+                style=self.icon_style or self.provider.default_style,
+                namespace=GRID_NAMESPACE,
+            )
         self.icon_style = style
-        Icon._cache.clear()
         for items, _ in list(self.visible_items.values()):
             for it in items:
                 self.canvas.delete(it)
@@ -193,7 +203,7 @@ class IconPreviewerApp:
         self._build_ui()
 
     def _load_icon_data(self):
-        providers = {"bootstrap": BootstrapFontProvider()}
+        providers = {"bootstrap": BootstrapFontProvider.shared()}
         registry = ProviderRegistry()
         load_external_providers(registry)
         for name in registry.names():
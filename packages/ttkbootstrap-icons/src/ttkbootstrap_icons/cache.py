@@ -0,0 +1,204 @@
+"""Bounded caches used by the icon renderer.
+
+`LRUCache` is a small least-recently-used mapping that can be bounded by entry
+count and by an approximate byte total. The renderer uses it for rendered
+`PhotoImage` objects so long-running applications do not accumulate images
+without limit. Every operation holds the cache's lock, so a cache can be
+shared by threads that rasterize icons in the background.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from typing import Any, Generic, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# Sentinel used by `set_limits` to tell "leave unchanged" apart from `None` (no limit)
+_UNSET: Any = object()
+
+
+class LRUCache(Generic[K, V]):
+    """Least-recently-used mapping bounded by entry count and approximate bytes.
+
+    Entries are evicted oldest-first whenever an insert (or a change of limits)
+    leaves the cache above `max_entries` or `max_bytes`. Dropping the cache's
+    reference is all eviction does; resources held by a value are released by
+    its own finalizer once nothing else references it.
+
+    Args:
+        max_entries: Maximum number of entries, or `None` for no limit.
+        max_bytes: Maximum total of `sizeof(value)` over all entries, or `None`
+            for no limit.
+        sizeof: Callable returning the approximate size in bytes of a value.
+            When omitted, every value counts as zero bytes.
+        on_evict: Optional callback invoked with `(key, value)` for each entry
+            removed to satisfy the limits. It runs with the cache's lock held.
+    """
+
+    __slots__ = (
+        "_data", "_sizes", "_bytes", "_max_entries", "_max_bytes",
+        "_sizeof", "_on_evict", "_lock", "hits", "misses", "evictions",
+    )
+
+    def __init__(
+            self,
+            max_entries: Optional[int] = None,
+            max_bytes: Optional[int] = None,
+            sizeof: Optional[Callable[[V], int]] = None,
+            on_evict: Optional[Callable[[K, V], None]] = None,
+    ) -> None:
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._sizes: dict[K, int] = {}
+        self._bytes = 0
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._on_evict = on_evict
+        # Reentrant so eviction callbacks may use the cache
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # -----------------------------
+    # Mapping protocol
+    # -----------------------------
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self.keys())
+
+    def __getitem__(self, key: K) -> V:
+        with self._lock:
+            value = self._data[key]
+            self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self.put(key, value)
+
+    def __delitem__(self, key: K) -> None:
+        with self._lock:
+            del self._data[key]
+            self._bytes -= self._sizes.pop(key, 0)
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Return the value for `key` and mark it most recently used."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        """Insert or replace `key`, then evict least-recently-used entries."""
+        nbytes = self._sizeof(value) if self._sizeof is not None else 0
+        with self._lock:
+            if key in self._data:
+                del self[key]
+            self._data[key] = value
+            self._sizes[key] = nbytes
+            self._bytes += nbytes
+            self._evict()
+
+    def pop(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Remove `key` and return its value (or `default` when missing)."""
+        with self._lock:
+            if key not in self._data:
+                return default
+            value = self._data.pop(key)
+            self._bytes -= self._sizes.pop(key, 0)
+            return value
+
+    def keys(self) -> list[K]:
+        with self._lock:
+            return list(self._data.keys())
+
+    def values(self) -> list[V]:
+        with self._lock:
+            return list(self._data.values())
+
+    def items(self) -> list[tuple[K, V]]:
+        with self._lock:
+            return list(self._data.items())
+
+    def clear(self) -> None:
+        """Remove every entry. Hit/miss counters are preserved."""
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self._bytes = 0
+
+    # -----------------------------
+    # Limits and statistics
+    # -----------------------------
+    @property
+    def total_bytes(self) -> int:
+        """Approximate number of bytes held by the cached values."""
+        return self._bytes
+
+    @property
+    def max_entries(self) -> Optional[int]:
+        return self._max_entries
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        return self._max_bytes
+
+    def set_limits(self, max_entries: Optional[int] = _UNSET, max_bytes: Optional[int] = _UNSET) -> None:
+        """Change the limits and evict immediately if the cache is now over them.
+
+        Args:
+            max_entries: New entry limit, `None` for no limit, or omitted to keep it.
+            max_bytes: New byte limit, `None` for no limit, or omitted to keep it.
+        """
+        with self._lock:
+            if max_entries is not _UNSET:
+                self._max_entries = max_entries
+            if max_bytes is not _UNSET:
+                self._max_bytes = max_bytes
+            self._evict()
+
+    def info(self) -> dict[str, Optional[int]]:
+        """Return a snapshot of size, limits and hit/miss/eviction counters."""
+        with self._lock:
+            return {
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "max_entries": self._max_entries,
+                "max_bytes": self._max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _over_limit(self) -> bool:
+        if self._max_entries is not None and len(self._data) > self._max_entries:
+            return True
+        if self._max_bytes is not None and self._bytes > self._max_bytes:
+            return True
+        return False
+
+    def _evict(self) -> None:
+        while self._data and self._over_limit():
+            key, value = self._data.popitem(last=False)
+            self._bytes -= self._sizes.pop(key, 0)
+            self.evictions += 1
+            if self._on_evict is not None:
+                try:
+                    self._on_evict(key, value)
+                except Exception:
+                    # Eviction callbacks must never break rendering
+                    pass
@@ -0,0 +1,169 @@
+"""Immutable per-(provider, style) render contexts.
+
+A `RenderContext` bundles everything the renderer needs for one provider style:
+the font, the parsed glyph map and the provider's render parameters. Contexts
+are built once and shared by every icon rendered with that provider style, so
+switching between providers is a dictionary lookup rather than a re-parse of
+the provider's glyph map.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+from .glyphmap import CompiledGlyphmap
+from .metrics import GlyphMetrics
+
+_font_digests: dict[str, bytes] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class RenderContext:
+    """Read-only render state for one provider style.
+
+    Attributes:
+        icon_set_id: Identifier of the provider style, e.g. `"bootstrap:default"`.
+        provider_name: Name of the provider that produced this context.
+        provider_id: `module:qualname` of the provider class, used to find the
+            provider again (e.g. when preloading a usage manifest).
+        style: Provider style, or `None` for the provider default.
+        font_key: Stable identifier of the font file; styles sharing a font
+            file share a key.
+        font: The font as a filesystem path, or its bytes when the provider
+            package is not installed as regular files.
+        icon_map: Read-only mapping of glyph name -> glyph character.
+        pad_factor: Padding factor for icon rendering (0.0-1.0).
+        y_bias: Vertical bias adjustment for icon rendering.
+        scale_to_fit: Whether to scale down glyphs that exceed the available space.
+        uniform_scale: Whether `scale_to_fit` uses one factor per size for the
+            whole style instead of one per glyph.
+        metrics: Precomputed glyph metrics of the font, or `None` when the
+            provider ships none (glyphs are then measured with FreeType).
+    """
+    icon_set_id: str
+    provider_name: str
+    style: Optional[str]
+    font_key: str
+    font: str | bytes
+    icon_map: Mapping[str, str]
+    provider_id: str = ""
+    pad_factor: float = 0.10
+    y_bias: float = 0.0
+    scale_to_fit: bool = True
+    uniform_scale: bool = False
+    metrics: Optional[GlyphMetrics] = None
+
+    def glyph(self, name: str) -> Optional[str]:
+        """Return the glyph character for `name`, or `None` when unknown."""
+        return self.icon_map.get(name)
+
+    def font_file(self) -> str | io.BytesIO:
+        """Return an argument suitable for `ImageFont.truetype`.
+
+        In-memory fonts get a fresh buffer per call because FreeType reads the
+        stream to the end when a font is opened.
+        """
+        if isinstance(self.font, bytes):
+            return io.BytesIO(self.font)
+        return self.font
+
+    def font_digest(self) -> bytes:
+        """Return the digest of the font's contents (see `font_digest`)."""
+        return font_digest(self.font_key, self.font)
+
+
+def font_digest(font_key: str, font: str | bytes) -> bytes:
+    """Return a 16-byte blake2b digest of a font given as a path or bytes.
+
+    Identifies the font by content rather than location, for caches and
+    sidecar files that outlive the process. Memoized per `font_key`.
+    """
+    digest = _font_digests.get(font_key)
+    if digest is None:
+        hasher = hashlib.blake2b(digest_size=16)
+        if isinstance(font, bytes):
+            hasher.update(font)
+        else:
+            with open(font, "rb") as fh:
+                for chunk in iter(lambda: fh.read(1 << 20), b""):
+                    hasher.update(chunk)
+        digest = _font_digests[font_key] = hasher.digest()
+    return digest
+
+
+def _to_char(code: Any) -> str:
+    codepoint = int(code, 16) if isinstance(code, str) else int(code)
+    return chr(codepoint)
+
+
+def parse_icon_map(icon_map: Mapping[str, Any] | list[dict[str, Any]]) -> Mapping[str, str]:
+    """Normalize a glyph map into a read-only mapping of name -> glyph character.
+
+    Supported formats:
+      - `CompiledGlyphmap`: wrapped in a lazy view without copying
+      - Flat dict (Bootstrap): `{"house": "F425", ...}`
+      - Dict of dicts (Lucide): `{"house": {"unicode": "EA01"}, ...}`
+      - List of dicts (Lucide): `[{"name": "house", "unicode": "EA01"}, ...]`
+
+    Malformed entries are skipped.
+
+    Raises:
+        TypeError: If `icon_map` is neither a list nor a dict.
+    """
+    if isinstance(icon_map, CompiledGlyphmap):
+        return icon_map.chars()
+
+    mapping: dict[str, str] = {}
+
+    if isinstance(icon_map, list):
+        # Lucide-style: list of dicts with fields like {"name": "...", "unicode": "EA01"}
+        for entry in icon_map:
+            if not isinstance(entry, dict):
+                continue
+            name = str(entry.get("name", "")).strip()
+            if not name:
+                continue
+            uni = entry.get("unicode")
+            if uni is None:
+                continue
+            try:
+                mapping[name] = _to_char(uni)
+            except Exception:
+                # Skip malformed entries
+                continue
+
+    elif isinstance(icon_map, Mapping):
+        # Could be: {'house': 'EA01', ...} (Bootstrap) OR {'house': {'unicode': '...'}, ...} (Lucide dict-of-dicts)
+        # Detect dict-of-dicts by sampling the first value
+        try:
+            sample_val = next(iter(icon_map.values()))
+        except StopIteration:
+            sample_val = None
+
+        if isinstance(sample_val, dict):
+            # Lucide-style dict of dicts
+            for name, detail in icon_map.items():
+                if not isinstance(detail, dict):
+                    continue
+                uni = detail.get("unicode")
+                if uni is None:
+                    continue
+                try:
+                    mapping[str(name)] = _to_char(uni)
+                except Exception:
+                    continue
+        else:
+            # Bootstrap flat dict
+            for name, code in icon_map.items():
+                try:
+                    mapping[str(name)] = _to_char(code)
+                except Exception:
+                    continue
+    else:
+        raise TypeError("icon_map must be a list[dict] or dict")
+
+    return MappingProxyType(mapping)
@@ -0,0 +1,269 @@
+"""Opt-in persistent cache of rasterized glyph masks.
+
+Rasterizing a glyph through FreeType is the expensive part of rendering an
+icon, and the in-memory caches start empty in every process. `DiskMaskCache`
+stores the 8-bit alpha masks produced by the renderer in a directory so a
+later process can skip font loading and rasterization for icons it has seen
+before. Masks are color independent (tinting a mask is cheap), so one entry
+serves every color of a glyph.
+
+Entries are keyed by a digest of the font's content (never its path), the
+glyph, the size and the provider's render parameters. The directory is
+namespaced by the entry format version and the Pillow version, since the
+rasterizer's output may change between releases.
+
+Layout:
+
+    <directory>/v<FORMAT_VERSION>-pil<version>/<font digest>/<key digest>.mask
+
+Each file holds a small header (magic `b"TBMK"`, format version, width,
+height) followed by the raw mask bytes. Files are written to a temporary name
+and moved into place with `os.replace`, so concurrent processes only ever see
+complete entries. A hit touches the entry's modification time, so when the
+namespace grows beyond `max_bytes`, the least recently used entries are
+removed until it is back under 90% of the limit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import PIL
+from PIL import Image
+
+from .context import RenderContext
+
+FORMAT_VERSION = 1
+
+_MAGIC = b"TBMK"
+_HEADER = struct.Struct("<4sHHHH")
+_SUFFIX = ".mask"
+_TMP_PREFIX = ".tmp-"
+# Temporary files older than this were left behind by a process that died mid-write
+_STALE_TMP_SECONDS = 300
+_LOW_WATER = 0.9
+
+
+def default_cache_dir() -> Path:
+    """Return the platform's per-user cache directory for ttkbootstrap-icons."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "ttkbootstrap-icons"
+
+
+class DiskMaskCache:
+    """Directory-backed cache of glyph masks shared between processes.
+
+    I/O errors never propagate: a failed read is a miss and a failed write is
+    skipped, so a read-only or full disk only costs the rasterization. The
+    cache may be used from several threads.
+
+    Args:
+        directory: Cache directory, or `None` for `default_cache_dir()`.
+        max_bytes: Approximate limit for the entries of the current namespace,
+            or `None` for no limit.
+    """
+
+    __slots__ = ("_root", "_max_bytes", "_bytes", "_trimming", "_lock", "hits", "misses", "writes", "evictions")
+
+    def __init__(self, directory: Optional[str | os.PathLike] = None, max_bytes: Optional[int] = 64 * 1024 * 1024):
+        base = Path(directory) if directory is not None else default_cache_dir()
+        self._root = base / f"v{FORMAT_VERSION}-pil{PIL.__version__}"
+        self._max_bytes = max_bytes
+        # Total size of the namespace; scanned on first write
+        self._bytes: Optional[int] = None
+        # Set while a write trims the namespace, so concurrent writes don't trim it again
+        self._trimming = False
+        # Guards the counters and size accounting; directory scans and file I/O run unlocked
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    @property
+    def directory(self) -> Path:
+        """Namespace directory holding this cache's entries."""
+        return self._root
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        return self._max_bytes
+
+    # -----------------------------
+    # Keys
+    # -----------------------------
+    def _path(self, ctx: RenderContext, glyph: str, size: int) -> Path:
+        # A uniform scale factor depends on every glyph of the style
+        scale_group = ctx.icon_set_id if ctx.scale_to_fit and ctx.uniform_scale else None
+        params = repr((glyph, size, ctx.pad_factor, ctx.y_bias, ctx.scale_to_fit, scale_group))
+        name = hashlib.blake2b(params.encode("utf-8"), digest_size=16).hexdigest()
+        return self._root / ctx.font_digest().hex() / f"{name}{_SUFFIX}"
+
+    # -----------------------------
+    # Entries
+    # -----------------------------
+    def get(self, ctx: RenderContext, glyph: str, size: int) -> Optional[Image.Image]:
+        """Return the cached mask of `glyph` at `size` for the context's font, or `None`."""
+        try:
+            path = self._path(ctx, glyph, size)
+            mask = _decode(path.read_bytes())
+        except (OSError, ValueError):
+            mask = None
+        if mask is not None:
+            try:
+                # Pruning removes the entries with the oldest modification time first
+                os.utime(path)
+            except OSError:
+                pass
+        with self._lock:
+            if mask is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return mask
+
+    def put(self, ctx: RenderContext, glyph: str, size: int, mask: Image.Image) -> None:
+        """Store `mask` for `glyph` at `size`, then trim the namespace if it is over the limit."""
+        try:
+            path = self._path(ctx, glyph, size)
+            data = _encode(mask)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(prefix=_TMP_PREFIX, dir=path.parent)
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    fh.write(data)
+                os.replace(tmp, path)
+            except BaseException:
+                _remove(Path(tmp))
+                raise
+        except (OSError, ValueError):
+            return
+        with self._lock:
+            self.writes += 1
+            if self._bytes is not None:
+                self._bytes += len(data)
+            if self._max_bytes is None or self._trimming:
+                return
+            # The size is unknown until the first write scans the namespace
+            if self._bytes is not None and self._bytes <= self._max_bytes:
+                return
+            self._trimming = True
+        try:
+            self._prune()
+        finally:
+            with self._lock:
+                self._trimming = False
+
+    def clear(self) -> None:
+        """Remove every entry of this cache's namespace."""
+        for path, _, _ in self._entries():
+            _remove(path)
+        with self._lock:
+            self._bytes = 0
+
+    def set_limit(self, max_bytes: Optional[int]) -> None:
+        """Change the size limit and trim the namespace immediately if it is now over it."""
+        with self._lock:
+            self._max_bytes = max_bytes
+        if max_bytes is not None:
+            self._prune()
+
+    def info(self) -> dict[str, object]:
+        """Return the directory, approximate size, limit and hit/miss/write/eviction counters."""
+        return {
+            "directory": str(self._root),
+            "bytes": self._scan_bytes(),
+            "max_bytes": self._max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+        }
+
+    # -----------------------------
+    # Size management
+    # -----------------------------
+    def _entries(self) -> list[tuple[Path, int, float]]:
+        """Return `(path, size, mtime)` of every entry, removing abandoned temporary files."""
+        entries = []
+        now = time.time()
+        try:
+            font_dirs = list(self._root.iterdir())
+        except OSError:
+            return entries
+        for font_dir in font_dirs:
+            try:
+                children = list(font_dir.iterdir())
+            except OSError:
+                continue
+            for path in children:
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                if path.name.startswith(_TMP_PREFIX):
+                    if now - st.st_mtime > _STALE_TMP_SECONDS:
+                        _remove(path)
+                elif path.name.endswith(_SUFFIX):
+                    entries.append((path, st.st_size, st.st_mtime))
+        return entries
+
+    def _scan_bytes(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _prune(self) -> None:
+        # Runs without the lock; only the resulting size and eviction count are published under it.
+        # Other processes write to the same directory, so measure it again
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        max_bytes = self._max_bytes
+        evicted = 0
+        if max_bytes is not None and total > max_bytes:
+            target = int(max_bytes * _LOW_WATER)
+            entries.sort(key=lambda e: e[2])
+            for path, size, _ in entries:
+                if total <= target:
+                    break
+                if _remove(path):
+                    total -= size
+                    evicted += 1
+        with self._lock:
+            self._bytes = total
+            self.evictions += evicted
+
+
+def _encode(mask: Image.Image) -> bytes:
+    if mask.mode != "L":
+        raise ValueError("Only 8-bit masks can be cached.")
+    return _HEADER.pack(_MAGIC, FORMAT_VERSION, 0, mask.width, mask.height) + mask.tobytes()
+
+
+def _decode(data: bytes) -> Optional[Image.Image]:
+    if len(data) < _HEADER.size:
+        return None
+    magic, version, _, width, height = _HEADER.unpack_from(data, 0)
+    if magic != _MAGIC or version != FORMAT_VERSION or len(data) != _HEADER.size + width * height:
+        return None
+    return Image.frombytes("L", (width, height), data[_HEADER.size:])
+
+
+def _remove(path: Path) -> bool:
+    try:
+        path.unlink()
+        return True
+    except OSError:
+        # Already removed by another process, or still open elsewhere (Windows)
+        return False
@@ -0,0 +1,192 @@
+"""Compact binary glyph maps.
+
+Provider packages ship `glyphmap*.json` files mapping glyph names to unicode
+codepoints. Large sets (Material Design Icons, Fluent) make parsing those files
+and holding the resulting dicts a noticeable part of startup time and resident
+memory. The asset tools therefore also emit a compiled `glyphmap*.bin` next to
+each JSON file, which is memory-mapped at runtime and searched in place.
+
+File layout (all integers little-endian unsigned 32-bit unless noted):
+
+    magic         4 bytes  b"TBGM"
+    version       u16
+    reserved      u16
+    count         number of glyphs
+    names_size    size of the names blob in bytes
+    offsets       (count + 1) offsets into the names blob
+    codepoints    count codepoints, in name order
+    names         UTF-8 glyph names, sorted by their encoded bytes
+
+Lookups binary-search the name table, so no per-glyph Python objects are
+created until a name is actually requested.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import struct
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Any, Optional
+
+MAGIC = b"TBGM"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHHII")
+_U32 = struct.Struct("<I")
+
+
+def compiled_glyphmap_name(json_name: str) -> str:
+    """Return the compiled file name for a JSON glyph map name (`.json` -> `.bin`)."""
+    stem = json_name[:-5] if json_name.endswith(".json") else json_name
+    return f"{stem}.bin"
+
+
+def write_compiled_glyphmap(path: Path, mapping: Mapping[str, int]) -> None:
+    """Write *mapping* (glyph name -> codepoint) as a compiled glyph map file."""
+    entries = sorted((str(name).encode("utf-8"), int(code)) for name, code in mapping.items())
+
+    offsets = [0]
+    for name, _ in entries:
+        offsets.append(offsets[-1] + len(name))
+    names_blob = b"".join(name for name, _ in entries)
+
+    count = len(entries)
+    out = bytearray(_HEADER.pack(MAGIC, VERSION, 0, count, len(names_blob)))
+    out += struct.pack(f"<{count + 1}I", *offsets)
+    out += struct.pack(f"<{count}I", *(code for _, code in entries))
+    out += names_blob
+    Path(path).write_bytes(bytes(out))
+
+
+class CompiledGlyphmap(Mapping[str, int]):
+    """Read-only mapping of glyph name -> codepoint backed by a compiled buffer.
+
+    The buffer is usually an `mmap` of the packaged file, so the glyph table is
+    shared with the OS page cache instead of being copied into Python objects.
+
+    Args:
+        buffer: Bytes-like object holding a compiled glyph map.
+
+    Raises:
+        ValueError: If the buffer is not a compiled glyph map of a supported version.
+    """
+
+    __slots__ = ("_buf", "_count", "_offsets_at", "_codes_at", "_names_at", "_digest")
+
+    def __init__(self, buffer: Any):
+        if len(buffer) < _HEADER.size:
+            raise ValueError("Compiled glyphmap is truncated.")
+        magic, version, _, count, names_size = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a compiled glyphmap of a supported version.")
+        offsets_at = _HEADER.size
+        codes_at = offsets_at + 4 * (count + 1)
+        names_at = codes_at + 4 * count
+        if len(buffer) < names_at + names_size:
+            raise ValueError("Compiled glyphmap is truncated.")
+
+        self._buf = buffer
+        self._count = count
+        self._offsets_at = offsets_at
+        self._codes_at = codes_at
+        self._names_at = names_at
+        self._digest: Optional[bytes] = None
+
+    def _name_bytes(self, index: int) -> bytes:
+        start = _U32.unpack_from(self._buf, self._offsets_at + 4 * index)[0]
+        end = _U32.unpack_from(self._buf, self._offsets_at + 4 * index + 4)[0]
+        return self._buf[self._names_at + start:self._names_at + end]
+
+    def _index_of(self, name: str) -> int:
+        try:
+            target = name.encode("utf-8")
+        except (AttributeError, UnicodeEncodeError):
+            return -1
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            probe = self._name_bytes(mid)
+            if probe < target:
+                lo = mid + 1
+            elif probe > target:
+                hi = mid
+            else:
+                return mid
+        return -1
+
+    def digest(self) -> bytes:
+        """Return an 8-byte digest of the compiled buffer, used to match sidecar files to it."""
+        if self._digest is None:
+            self._digest = hashlib.blake2b(self._buf, digest_size=8).digest()
+        return self._digest
+
+    def codepoint_at(self, index: int) -> int:
+        """Return the codepoint stored at position *index* of the sorted table."""
+        return _U32.unpack_from(self._buf, self._codes_at + 4 * index)[0]
+
+    def name_at(self, index: int) -> str:
+        """Return the glyph name stored at position *index* of the sorted table."""
+        return self._name_bytes(index).decode("utf-8")
+
+    def __getitem__(self, name: str) -> int:
+        index = self._index_of(name)
+        if index < 0:
+            raise KeyError(name)
+        return self.codepoint_at(index)
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self._index_of(name) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._count):
+            yield self.name_at(index)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def chars(self) -> GlyphCharView:
+        """Return a view mapping glyph name -> glyph character."""
+        return GlyphCharView(self)
+
+
+class GlyphCharView(Mapping[str, str]):
+    """Read-only view of a `CompiledGlyphmap` returning glyph characters."""
+
+    __slots__ = ("_glyphmap",)
+
+    def __init__(self, glyphmap: CompiledGlyphmap):
+        self._glyphmap = glyphmap
+
+    def __getitem__(self, name: str) -> str:
+        return chr(self._glyphmap[name])
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._glyphmap
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._glyphmap)
+
+    def __len__(self) -> int:
+        return len(self._glyphmap)
+
+
+def open_compiled_glyphmap(resource: Any) -> Optional[CompiledGlyphmap]:
+    """Open a compiled glyph map from a package resource, or return `None`.
+
+    Regular files are memory-mapped; other resources (e.g. inside a zip) are
+    read into memory. `None` is returned when the resource is missing or is not
+    a valid compiled glyph map, so callers can fall back to the JSON file.
+    """
+    try:
+        if not resource.is_file():
+            return None
+        if isinstance(resource, Path):
+            with open(resource, "rb") as fh:
+                buffer: Any = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            buffer = resource.read_bytes()
+        return CompiledGlyphmap(buffer)
+    except (OSError, ValueError):
+        return None
@@ -1,46 +1,266 @@
 ﻿from __future__ import annotations
 
-import json
+import functools
 import os
-import tempfile
+import threading
+import tkinter
 from abc import ABC
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from tkinter import Misc, TclError
 from tkinter import PhotoImage as TkPhotoImage
-from typing import Any, ClassVar, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Iterable, Iterator, Mapping, Optional, Tuple
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageColor, ImageDraw, ImageFont
 from PIL.ImageTk import PhotoImage
 
+from .cache import _UNSET, LRUCache
+from .context import RenderContext, parse_icon_map
+from .disk_cache import DiskMaskCache
+from .name_index import load_provider, provider_id
 from .providers import BaseFontProvider
 from .stateful_icon_mixin import StatefulIconMixin
 
+if TYPE_CHECKING:
+    from .manifest import UsageRecorder
 
-def create_transparent_icon(size: int = 16) -> TkPhotoImage:
-    """Return or create a transparent placeholder image of given size."""
-    return Icon._get_transparent(size)
+
+# Rough memory of a FreeType face and size object, excluding the font data
+_FACE_OVERHEAD = 32 * 1024
+# Share of a style's glyphs that the uniform scale factor must fit
+_UNIFORM_QUANTILE = 0.98
+# Size at which glyph extents are measured for the uniform scale factor
+_EXTENT_SIZE = 256
+# Tcl command and bind tag that release an interpreter's images when its root is destroyed
+_RELEASE_COMMAND = "ttkbootstrap_icons_release"
+_RELEASE_TAG = "TtkbootstrapIconsRelease"
+
+
+# A glyph name, or `(name, size, color, style)` with optional trailing items
+IconSpec = str | tuple
+
+
+def _normalize_spec(
+        spec: IconSpec,
+        size: int = 24,
+        color: str = "black",
+        style: Optional[str] = None,
+) -> tuple[str, int, str, Optional[str]]:
+    """Expand an `IconSpec` to `(name, size, color, style)`, filling in the given defaults."""
+    if isinstance(spec, str):
+        return spec, size, color, style
+    return (*spec, *(size, color, style)[len(spec) - 1:])
+
+
+def _photo_nbytes(pm: PhotoImage) -> int:
+    """Approximate pixel memory of a rendered image (RGBA, 4 bytes per pixel)."""
+    return pm.width() * pm.height() * 4
+
+
+def _font_nbytes(entry: tuple[ImageFont.FreeTypeFont, threading.Lock]) -> int:
+    """Approximate memory of a pooled font.
+
+    Fonts opened from a file are streamed by FreeType; in-memory fonts hold
+    their own copy of the font data per size, so it is counted per entry.
+    """
+    return _FACE_OVERHEAD + len(getattr(entry[0], "font_bytes", b""))
+
+
+class _ImagePartition:
+    """Rendered images of one Tk interpreter.
+
+    A `PhotoImage` belongs to the interpreter it was created in, so images are
+    cached per interpreter and dropped when its root window is destroyed.
+    Glyph masks and fonts hold no Tk objects and stay shared.
+
+    Images rendered inside `Icon.cache_namespace` are also tagged with the
+    namespace, so `Icon.invalidate` can drop them without a full scan.
+    """
+
+    __slots__ = ("tk", "images", "transparent", "namespaces")
+
+    def __init__(self, tk: Any, limits: dict[str, Optional[int]]):
+        # Keeps the interpreter alive, so its id() cannot be reused while cached
+        self.tk = tk
+        # namespace -> keys of the cached images rendered in it
+        self.namespaces: dict[str, set[tuple]] = {}
+        # The eviction callback must not reference the partition: a cycle would keep
+        # its images alive after release until the cyclic collector runs
+        self.images: LRUCache[Tuple[str, int, str, str], PhotoImage] = LRUCache(
+            sizeof=_photo_nbytes, on_evict=functools.partial(_untag, self.namespaces), **limits)
+        self.transparent: dict[int, PhotoImage] = {}
+
+    def tag(self, namespace: str, key: tuple) -> None:
+        keys = self.namespaces.get(namespace)
+        if keys is None:
+            keys = self.namespaces[namespace] = set()
+        keys.add(key)
+
+    def drop(self, key: tuple) -> None:
+        """Remove one image from the cache and from every namespace."""
+        self.images.pop(key)
+        _untag(self.namespaces, key)
+
+    def release(self) -> None:
+        """Drop every image now, even while the partition itself is still referenced."""
+        self.images.clear()
+        self.transparent.clear()
+        self.namespaces.clear()
+
+
+def _untag(namespaces: dict[str, set[tuple]], key: tuple, _image: object = None) -> None:
+    """Remove `key` from every namespace of a partition, dropping namespaces left empty."""
+    for namespace, keys in list(namespaces.items()):
+        keys.discard(key)
+        if not keys:
+            del namespaces[namespace]
+
+
+def _interpreter(master: Optional[Misc]) -> Any:
+    """Return the Tk interpreter a `PhotoImage` created for `master` belongs to."""
+    if master is None:
+        master = tkinter._default_root or tkinter._get_default_root("create image")
+    return getattr(master, "tk", master)
+
+
+def create_transparent_icon(size: int = 16, master: Optional[Misc] = None) -> TkPhotoImage:
+    """Return or create a transparent placeholder image of given size.
+
+    Args:
+        size: Pixel size.
+        master: A widget of the Tk interpreter the image is for, or `None` for
+            the default root.
+    """
+    return Icon._get_transparent(size, master)
+
+
+def get_image(
+        provider: BaseFontProvider,
+        name: str,
+        size: int = 24,
+        color: str = "black",
+        style: Optional[str] = None,
+        master: Optional[Misc] = None,
+) -> TkPhotoImage:
+    """Return the image of an icon without creating an `Icon` instance.
+
+    The image is the same cached object an icon class (e.g. `BootstrapIcon`)
+    would expose as `.image`, and `str()` of it is the Tk image name. After
+    the first call for a `(name, style)`, this is a lookup in the render
+    cache, so hot loops that only need the image skip icon construction.
+
+    Example:
+        image = get_image(BootstrapFontProvider.shared(), "house", 16, "#333")
+        tree.insert("", "end", text="Home", image=image)
+
+    Args:
+        provider: Provider the glyph name belongs to.
+        name: Glyph name, as accepted by the provider's icon class.
+        size: Pixel size.
+        color: Foreground color.
+        style: Provider style, or `None` to infer it from the name.
+        master: A widget of the Tk interpreter the image is for, or `None` for
+            the default root.
+
+    Raises:
+        ValueError: If the name cannot be resolved for the style.
+    """
+    ctx, resolved = Icon._target(provider, name, style)
+    return Icon._render_image(ctx, resolved, size, color, master=master)
+
+
+def rasterize(
+        provider: BaseFontProvider,
+        name: str,
+        size: int = 24,
+        color: str = "black",
+        style: Optional[str] = None,
+) -> Image.Image:
+    """Render an icon into a PIL RGBA image. Safe to call from any thread.
+
+    This is the PIL half of `get_image`: it fills the shared glyph caches
+    but creates no Tk objects, so it can run in a thread pool while the Tk
+    thread only turns the results into `PhotoImage`s (see `Icon.render_many`
+    with an `executor`).
+
+    Args:
+        provider: Provider the glyph name belongs to.
+        name: Glyph name, as accepted by the provider's icon class.
+        size: Pixel size.
+        color: Foreground color.
+        style: Provider style, or `None` to infer it from the name.
+
+    Raises:
+        ValueError: If the name cannot be resolved for the style.
+    """
+    ctx, resolved = Icon._target(provider, name, style)
+    image = Icon._rasterize(ctx, resolved, size, color)
+    if image is None:
+        return Image.new("RGBA", (size, size), (255, 255, 255, 0))
+    return image
 
 
 class Icon(StatefulIconMixin, ABC):
     """Base class for rendered TTF-based icons (PIL -> PhotoImage).
 
     Performance features:
-      - Class-level caches for rendered images and PIL fonts.
-      - Class-level cache for transparent placeholders.
-      - Reuses a temporary font file per (provider, style).
+      - Class-level caches for rendered images and PIL fonts. Rendered images
+        are cached per Tk interpreter in bounded LRUs (see `set_cache_limits`)
+        that are released when the interpreter's root is destroyed, and fonts
+        are kept in a small LRU pool (see `set_font_pool_limits`).
+      - Glyphs are rasterized once into 8-bit alpha masks; each color is a
+        cheap fill-plus-alpha composite of the cached mask.
+      - Optional on-disk mask cache shared between processes (see
+        `enable_disk_cache`), so warm starts skip FreeType.
+      - Glyphs are placed from the bbox FreeType reports while rasterizing;
+        precomputed metrics, when the provider ships them, decide whether a
+        glyph must be scaled down without measuring it with FreeType.
+      - `render_many` and `get_image` return images without creating
+        instances.
+      - Targeted invalidation (see `invalidate`): images can be dropped by
+        provider, style, size, color or a user-defined namespace (see
+        `cache_namespace`) while unrelated icons stay cached.
+      - Per-interpreter cache for transparent placeholders.
+      - Immutable render contexts per (provider, style); each icon binds to
+        one, so alternating providers never re-parses a glyph map.
+      - Rasterization is thread-safe: caches are locked, each pooled font is
+        used by one thread at a time, and the active provider is tracked per
+        thread. Only `PhotoImage` creation must happen on the Tk thread.
+      - Fonts load straight from the provider package (path or in-memory
+        bytes); no temporary files are written.
       - __slots__ to reduce per-instance overhead.
     """
-    __slots__ = ("name", "size", "color", "_img", "_font_path", "_icon_set_id")
+    __slots__ = ("name", "size", "color", "_img", "_ctx")
 
-    _icon_map: ClassVar[dict[str, Any]] = {}
+    # Active context and read-only views of it (kept for backwards compatibility)
+    _context: ClassVar[Optional[RenderContext]] = None
+    _icon_map: ClassVar[Mapping[str, str]] = {}
     _current_font_path: ClassVar[Optional[str]] = None
     _initialized: ClassVar[bool] = False
     _icon_set: ClassVar[str] = ""
 
-    _cache: ClassVar[dict[Tuple[str, int, str, str], PhotoImage]] = {}
-    _font_cache: ClassVar[dict[Tuple[str, int], ImageFont.FreeTypeFont]] = {}
-    _transparent_cache: ClassVar[dict[int, PhotoImage]] = {}
-    _fontfile_cache: ClassVar[dict[str, str]] = {}
-    _icon_map_cache: ClassVar[dict[str, dict[str, Any]]] = {}
-    _render_params_cache: ClassVar[dict[str, dict[str, Any]]] = {}
+    # id(Tk interpreter) -> its rendered images
+    _partitions: ClassVar[dict[int, _ImagePartition]] = {}
+    # Limits of each interpreter's image cache
+    _cache_limits: ClassVar[dict[str, Optional[int]]] = {"max_entries": 4096, "max_bytes": 64 * 1024 * 1024}
+    _mask_cache: ClassVar[LRUCache[tuple, Image.Image]] = LRUCache(
+        max_entries=8192, max_bytes=32 * 1024 * 1024, sizeof=lambda m: m.width * m.height)
+    # Each font has a lock: a FreeType face must not be used by two threads at once
+    _font_cache: ClassVar[LRUCache[Tuple[str, int], tuple[ImageFont.FreeTypeFont, threading.Lock]]] = LRUCache(
+        max_entries=32, sizeof=_font_nbytes)
+    # (provider name, name, style, uniform scale) -> (render context, resolved glyph name)
+    _targets: ClassVar[LRUCache[tuple, tuple[RenderContext, str]]] = LRUCache(max_entries=4096)
+    _uniform_sizes: ClassVar[dict[tuple, int]] = {}
+    # (font key, glyph set) -> extents of the glyphs at `_EXTENT_SIZE`
+    _glyph_extents: ClassVar[dict[tuple[str, frozenset[str]], list[tuple[int, int]]]] = {}
+    # (icon set id, uniform scale) -> render context
+    _contexts: ClassVar[dict[tuple[str, bool], RenderContext]] = {}
+    _disk_cache: ClassVar[Optional[DiskMaskCache]] = None
+    _recorder: ClassVar[Optional[UsageRecorder]] = None
+    # Guards building shared state (contexts, fonts, uniform sizes) and the compat views
+    _lock: ClassVar[threading.RLock] = threading.RLock()
+    # Context activated by `initialize_with_provider` on the current thread
+    _local: ClassVar[threading.local] = threading.local()
 
     def __init__(self, name: str, size: int = 24, color: str = "black"):
         """Create a new icon.
@@ -50,14 +270,14 @@ class Icon(StatefulIconMixin, ABC):
             size: Pixel size.
             color: Foreground color.
         """
-        if not Icon._initialized:
+        ctx = getattr(Icon._local, "context", None) or Icon._context
+        if ctx is None:
             raise RuntimeError("Icon provider not initialized. Call initialize_with_provider() before creating icons.")
 
         self.name = name
         self.size = size
         self.color = color
-        self._font_path = Icon._current_font_path
-        self._icon_set_id = Icon._icon_set
+        self._ctx: RenderContext = ctx
         self._img: Optional[TkPhotoImage] = self._render()
         super().__init__()
         self._ensure_original_image()
@@ -67,196 +287,688 @@ class Icon(StatefulIconMixin, ABC):
         return self._img
 
     @classmethod
-    def _get_transparent(cls, size: int) -> PhotoImage:
-        pm = cls._transparent_cache.get(size)
+    def _get_transparent(cls, size: int, master: Optional[Misc] = None) -> PhotoImage:
+        part = Icon._partition(master)
+        pm = part.transparent.get(size)
         if pm is not None:
             return pm
         img = Image.new("RGBA", (size, size), (255, 255, 255, 0))
-        pm = PhotoImage(image=img)
-        cls._transparent_cache[size] = pm
+        pm = PhotoImage(image=img, master=part.tk)
+        part.transparent[size] = pm
         return pm
 
     @classmethod
-    def _configure(cls, font_path: str, icon_map: dict[str, Any] | list[dict[str, Any]]):
-        if not os.path.exists(font_path):
-            raise FileNotFoundError(f"Font not found: {font_path}")
+    def _partition(cls, master: Optional[Misc] = None, create: bool = True) -> Optional[_ImagePartition]:
+        """Return the image partition of `master`'s interpreter (default root when `None`).
 
-        mapping: dict[str, Any] = {}
-
-        if isinstance(icon_map, list):
-            # Lucide-style: list of dicts with fields like {"name": "...", "unicode": "EA01"}
-            for entry in icon_map:
-                if not isinstance(entry, dict):
-                    continue
-                name = str(entry.get("name", "")).strip()
-                if not name:
-                    continue
-                uni = entry.get("unicode")
-                if uni is None:
-                    continue
+        A new partition registers a `<Destroy>` binding on the interpreter's
+        root window that releases it. With `create` false, returns `None`
+        instead of creating one.
+        """
+        tk = _interpreter(master)
+        part = Icon._partitions.get(id(tk))
+        if part is not None or not create:
+            return part
+        with Icon._lock:
+            part = Icon._partitions.get(id(tk))
+            if part is None:
+                part = Icon._partitions[id(tk)] = _ImagePartition(tk, Icon._cache_limits)
                 try:
-                    codepoint = int(uni, 16) if isinstance(uni, str) else int(uni)
-                    mapping[name] = chr(codepoint)
-                except Exception:
-                    # Skip malformed entries
-                    continue
+                    # The command holds only the key: a reference to `tk` would keep the interpreter alive
+                    tk.createcommand(_RELEASE_COMMAND, functools.partial(Icon._release_partition, id(tk)))
+                    tags = tk.splitlist(tk.call("bindtags", "."))
+                    if _RELEASE_TAG not in tags:
+                        tk.call("bindtags", ".", (*tags, _RELEASE_TAG))
+                    tk.call("bind", _RELEASE_TAG, "<Destroy>", _RELEASE_COMMAND)
+                except TclError:
+                    # No root window to watch; the partition lives until `cleanup()`
+                    pass
+        return part
 
-        elif isinstance(icon_map, dict):
-            # Could be: {'house': 'EA01', ...} (Bootstrap) OR {'house': {'unicode': '...'}, ...} (Lucide dict-of-dicts)
-            # Detect dict-of-dicts by sampling the first value
-            try:
-                sample_val = next(iter(icon_map.values()))
-            except StopIteration:
-                sample_val = None
-
-            if isinstance(sample_val, dict):
-                # Lucide-style dict of dicts
-                for name, detail in icon_map.items():
-                    if not isinstance(detail, dict):
-                        continue
-                    uni = detail.get("unicode")
-                    if uni is None:
-                        continue
-                    try:
-                        codepoint = int(uni, 16) if isinstance(uni, str) else int(uni)
-                        mapping[str(name)] = chr(codepoint)
-                    except Exception:
-                        continue
-            else:
-                # Bootstrap flat dict
-                for name, code in icon_map.items():
-                    try:
-                        codepoint = int(code, 16) if isinstance(code, str) else int(code)
-                        mapping[str(name)] = chr(codepoint)
-                    except Exception:
-                        continue
-        else:
-            raise TypeError("icon_map must be a list[dict] or dict")
+    @classmethod
+    def _release_partition(cls, key: int) -> None:
+        """Drop the images of a destroyed interpreter."""
+        with Icon._lock:
+            part = Icon._partitions.pop(key, None)
+        if part is not None:
+            part.release()
 
-        Icon._icon_map = mapping
-        Icon._current_font_path = font_path
-        Icon._initialized = True
+    @classmethod
+    @contextmanager
+    def cache_namespace(cls, namespace: str) -> Iterator[None]:
+        """Tag the images requested on this thread inside the block with `namespace`.
+
+        Tagged images can later be dropped together with
+        `Icon.invalidate(namespace=...)`, e.g. everything one window or
+        component rendered, while other cached icons survive. An image used in
+        several namespaces is tagged with each; cache hits are tagged too.
+
+        Example:
+            with Icon.cache_namespace("preview"):
+                images = [get_image(provider, name, 48, color) for name in names]
+            ...
+            Icon.invalidate(namespace="preview")
+        """
+        previous = getattr(Icon._local, "namespace", None)
+        Icon._local.namespace = namespace
+        try:
+            yield
+        finally:
+            Icon._local.namespace = previous
+
+    @classmethod
+    def invalidate(
+            cls,
+            provider: Optional[BaseFontProvider] = None,
+            style: Optional[str] = None,
+            size: Optional[int] = None,
+            color: Optional[str] = None,
+            namespace: Optional[str] = None,
+            master: Optional[Misc] = None,
+    ) -> int:
+        """Drop the cached images that match every given criterion.
+
+        Omitted criteria match everything, so `invalidate(provider=p)` drops
+        all images of provider `p` and `invalidate(color="#ff0000")` every
+        image in that color, while other images stay cached. Glyph masks are
+        kept, so re-rendering a dropped image only costs the tint. Widgets and
+        icon instances that hold a dropped image keep displaying it.
+
+        Args:
+            provider: Only images of this provider.
+            style: Only images of this provider style. Requires `provider`.
+            size: Only images of this pixel size.
+            color: Only images of this color, as given when rendering.
+            namespace: Only images tagged with this namespace (see
+                `cache_namespace`).
+            master: Only images of this widget's Tk interpreter, or `None` for
+                every interpreter.
+
+        Returns:
+            The number of images dropped.
+
+        Raises:
+            ValueError: If `style` is given without `provider`.
+        """
+        font_keys: Optional[set[str]] = None
+        in_style: Optional[Callable[[str], bool]] = None
+        if provider is not None:
+            styles = (style,) if style is not None else (provider.style_list or (None,))
+            font_keys = {provider.font_key(s) for s in styles}
+            # Styles sharing a font file are told apart by the style's name predicate
+            in_style = provider._style_predicate(style)
+        elif style is not None:
+            raise ValueError("Invalidating a style requires its provider.")
+
+        if master is None:
+            with Icon._lock:
+                parts = list(Icon._partitions.values())
+        else:
+            part = Icon._partition(master, create=False)
+            parts = [part] if part is not None else []
+
+        dropped = 0
+        for part in parts:
+            keys = part.namespaces.get(namespace, ()) if namespace is not None else part.images.keys()
+            for key in list(keys):
+                name, key_size, key_color, font_key = key
+                if ((size is None or key_size == size)
+                        and (color is None or key_color == color)
+                        and (font_keys is None or font_key in font_keys)
+                        and (in_style is None or in_style(name))):
+                    part.drop(key)
+                    dropped += 1
+        return dropped
 
     def _render(self) -> PhotoImage:
         """Render the icon as a `PhotoImage`, using PIL and caching the result."""
-        fp = self._font_path
-        icon_map = Icon._icon_map_cache.get(self._icon_set_id, Icon._icon_map)
-
-        render_params = Icon._render_params_cache.get(
-            self._icon_set_id, {
-                "pad_factor": 0.10,
-                "y_bias": 0.0,
-                "scale_to_fit": True,
-            })
-        pad_factor = render_params["pad_factor"]
-        y_bias = render_params["y_bias"]
-        scale_to_fit = render_params["scale_to_fit"]
-
-        key = (self.name, self.size, self.color, fp or "")
-        cached = Icon._cache.get(key)
-        if cached is not None:
-            return cached
-
-        glyph_val = icon_map.get(self.name)
-        if glyph_val is None:
-            return Icon._get_transparent(self.size)
-        glyph = chr(glyph_val) if isinstance(glyph_val, int) else str(glyph_val)
-
-        if not fp:
-            return Icon._get_transparent(self.size)
-
-        canvas_size = self.size
-        pad = int(self.size * pad_factor)
+        return Icon._render_image(self._ctx, self.name, self.size, self.color)
+
+    def _render_themed_icons(
+            self, requests: list[tuple[str, Optional[str]]]
+    ) -> list[Optional[tuple[object, Optional[Callable[[Optional[str]], None]]]]]:
+        """Render private state images straight from the glyph masks, without sibling instances.
+
+        Each distinct name is resolved once and its mask fetched once for all
+        the requested colors. The images are not shared with the render cache,
+        so theme changes can recolor them in place. Rendered states are
+        recorded by an active `UsageRecorder`, like cached renders.
+        """
+        if type(self)._render_icon is not StatefulIconMixin._render_icon:
+            # A custom renderer knows nothing about masks
+            return super()._render_themed_icons(requests)
+
+        size = self.size
+        recorder = Icon._recorder
+        # name -> (ctx, resolved name, mask), `()` for an unknown glyph, `None` when unresolvable
+        masks: dict[str, Optional[tuple]] = {}
+        results: list[Optional[tuple]] = []
+        for name, color in requests:
+            if name not in masks:
+                try:
+                    ctx, resolved = self._state_target(name)
+                    glyph = ctx.glyph(resolved)
+                    masks[name] = (ctx, resolved, Icon._render_mask(ctx, glyph, size)) if glyph is not None else ()
+                except (ValueError, OSError):
+                    masks[name] = None
+            target = masks[name]
+            if target is None:
+                results.append(None)
+            elif not target:
+                # Unknown glyph: transparent, like an icon instance of it
+                results.append((Icon._get_transparent(size), None))
+            else:
+                ctx, resolved, mask = target
+                try:
+                    pm = PhotoImage(image=Icon._tint(mask, color))
+                except (ValueError, TypeError, AttributeError):
+                    # Invalid color
+                    results.append(None)
+                    continue
+                if recorder is not None:
+                    recorder.record(ctx, resolved, size, color)
+                results.append((pm, functools.partial(Icon._paste_tinted, pm, mask)))
+        return results
+
+    def _state_target(self, name: str) -> tuple[RenderContext, str]:
+        """Return the render context and resolved glyph name of state icon `name`.
+
+        Raises:
+            ValueError: If the name cannot be resolved by this icon's provider.
+        """
+        if name == self.name:
+            return self._ctx, self.name
+        try:
+            provider = load_provider(self._ctx.provider_id)
+        except ValueError:
+            # No shared provider instance: resolve the name the way the host class does
+            sibling = type(self)(name, self.size)
+            return sibling._ctx, sibling.name
+        return Icon._target(provider, name, None)
+
+    @staticmethod
+    def _paste_tinted(pm: PhotoImage, mask: Image.Image, color: Optional[str]) -> None:
+        """Rewrite the pixels of `pm` with `mask` tinted in `color`."""
+        pm.paste(Icon._tint(mask, color))
+
+    @classmethod
+    def _render_image(
+            cls,
+            ctx: RenderContext,
+            name: str,
+            size: int,
+            color: str,
+            image: Optional[Image.Image] = None,
+            master: Optional[Misc] = None,
+    ) -> PhotoImage:
+        """Return the cached image of glyph `name` in `ctx`, rendering it on a miss.
+
+        Creates a `PhotoImage` for `master`'s interpreter (default root when
+        `None`), so it must run on the Tk thread. `image` is the result of
+        `_rasterize` when it was already done elsewhere (e.g. on a worker
+        thread).
+        """
+        recorder = Icon._recorder
+        if recorder is not None:
+            recorder.record(ctx, name, size, color)
+
+        part = Icon._partition(master)
+        key = (name, size, color, ctx.font_key)
+        pm = part.images.get(key)
+        if pm is None:
+            if image is None:
+                image = Icon._rasterize(ctx, name, size, color)
+            if image is None:
+                return Icon._get_transparent(size, master)
+            pm = PhotoImage(image=image, master=part.tk)
+            part.images[key] = pm
+
+        namespace = getattr(Icon._local, "namespace", None)
+        if namespace is not None:
+            part.tag(namespace, key)
+        return pm
+
+    @classmethod
+    def _rasterize(cls, ctx: RenderContext, name: str, size: int, color: str) -> Optional[Image.Image]:
+        """Render glyph `name` of `ctx` into an RGBA image, or `None` when unknown. Thread-safe."""
+        glyph = ctx.glyph(name)
+        if glyph is None:
+            return None
+        return Icon._tint(Icon._render_mask(ctx, glyph, size), color)
+
+    @classmethod
+    def render_many(
+            cls,
+            provider: BaseFontProvider,
+            specs: Iterable[IconSpec],
+            size: int = 24,
+            color: str = "black",
+            style: Optional[str] = None,
+            executor: Optional[Executor] = None,
+            master: Optional[Misc] = None,
+    ) -> list[TkPhotoImage]:
+        """Render many icons of one provider in a single call.
+
+        Each spec is a glyph name or a `(name, size, color, style)` tuple whose
+        trailing items may be omitted; missing values default to the arguments
+        of this call. Names are resolved once per distinct `(name, style)`, and
+        images come from the same caches as `Icon` instances (so every color
+        and repeat of a glyph shares one rasterization), but no instances are
+        created and the active provider is left unchanged.
+
+        With an `executor` (e.g. a `ThreadPoolExecutor`), icons missing from
+        the image cache are rasterized on its workers and only the final
+        `PhotoImage` creation runs on the calling (Tk) thread.
+
+        Example:
+            images = Icon.render_many(BootstrapFontProvider.shared(), [
+                "house", ("gear", 16), ("trash", 16, "red"), ("star", 24, "gold", "fill"),
+            ])
+
+        Args:
+            provider: Provider the glyph names belong to.
+            specs: Icons to render.
+            size: Default pixel size.
+            color: Default foreground color.
+            style: Default provider style, or `None` to infer it from each name.
+            executor: Optional executor to rasterize uncached icons in parallel.
+            master: A widget of the Tk interpreter the images are for, or `None`
+                for the default root.
+
+        Returns:
+            The images, in the order of `specs`.
+
+        Raises:
+            ValueError: If a name cannot be resolved for its style.
+        """
+        jobs = []
+        for spec in specs:
+            name, icon_size, icon_color, icon_style = _normalize_spec(spec, size, color, style)
+            ctx, resolved = Icon._target(provider, name, icon_style)
+            jobs.append((ctx, resolved, icon_size, icon_color))
+
+        rasterized: dict[tuple, Optional[Image.Image]] = {}
+        if executor is not None:
+            images = Icon._partition(master).images
+            missing = {(n, s, c, ctx.font_key): (ctx, n, s, c) for ctx, n, s, c in jobs
+                       if (n, s, c, ctx.font_key) not in images}
+            results = executor.map(lambda job: Icon._rasterize(*job), missing.values())
+            rasterized = dict(zip(missing, results))
+
+        return [
+            Icon._render_image(ctx, n, s, c, rasterized.get((n, s, c, ctx.font_key)), master)
+            for ctx, n, s, c in jobs
+        ]
+
+    @classmethod
+    def _cached_image(
+            cls,
+            provider: BaseFontProvider,
+            name: str,
+            size: int,
+            color: str,
+            style: Optional[str],
+            master: Optional[Misc] = None,
+    ) -> Optional[PhotoImage]:
+        """Return the cached image for a user-supplied name, or `None` without rendering."""
+        target = Icon._targets.get((provider.name, name, style))
+        part = Icon._partition(master, create=False)
+        if target is None or part is None:
+            return None
+        ctx, resolved = target
+        return part.images.get((resolved, size, color, ctx.font_key))
+
+    @classmethod
+    def _target(cls, provider: BaseFontProvider, name: str, style: Optional[str]) -> tuple[RenderContext, str]:
+        """Return the render context and resolved glyph name for a user-supplied name and style."""
+        tkey = (provider.name, name, style, provider.uniform_scale)
+        target = Icon._targets.get(tkey)
+        if target is None:
+            ctx = Icon._context_for(provider, provider.resolve_icon_style(name, style))
+            target = (ctx, provider.resolve_icon_name(name, style))
+            Icon._targets[tkey] = target
+        return target
+
+    @classmethod
+    def _render_mask(cls, ctx: RenderContext, glyph: str, size: int) -> Image.Image:
+        """Rasterize a glyph once into an 8-bit alpha mask, caching the result.
+
+        The mask depends only on the font, glyph, size and render params, so every
+        color variant of the same glyph shares one FreeType rasterization.
+        """
+        pad_factor = ctx.pad_factor
+        y_bias = ctx.y_bias
+        scale_to_fit = ctx.scale_to_fit
+
+        # A uniform scale factor depends on every glyph of the style
+        scale_group = ctx.icon_set_id if scale_to_fit and ctx.uniform_scale else None
+        mkey = (ctx.font_key, glyph, size, pad_factor, y_bias, scale_to_fit, scale_group)
+        mask = Icon._mask_cache.get(mkey)
+        if mask is not None:
+            return mask
+
+        disk = Icon._disk_cache
+        if disk is not None:
+            mask = disk.get(ctx, glyph, size)
+            if mask is not None:
+                Icon._mask_cache[mkey] = mask
+                return mask
+
+        canvas_size = size
+        pad = int(size * pad_factor)
         inner_w = canvas_size - 2 * pad
         inner_h = canvas_size - 2 * pad
 
-        eff_size = max(1, int(self.size))
-        fkey = (fp, eff_size)
-        font = Icon._font_cache.get(fkey)
-        if font is None:
-            font = ImageFont.truetype(fp, eff_size)
-            Icon._font_cache[fkey] = font
-
-        ascent, descent = font.getmetrics()
-        bbox = font.getbbox(glyph)
+        font_size = max(1, int(size))
+        if scale_to_fit and ctx.uniform_scale:
+            font_size = Icon._uniform_font_size(ctx, font_size, inner_w, inner_h)
+        _, _, bbox = Icon._layout(ctx, glyph, font_size)
         glyph_w = bbox[2] - bbox[0]
         glyph_h = bbox[3] - bbox[1]
 
-        if scale_to_fit and (glyph_w > inner_w or glyph_h > inner_h):
-            scale = min(inner_w / max(glyph_w, 1), inner_h / max(glyph_h, 1)) * 0.95
-            scaled_size = max(1, int(eff_size * scale))
-            fkey_scaled = (fp, scaled_size)
-            font = Icon._font_cache.get(fkey_scaled)
-            if font is None:
-                font = ImageFont.truetype(fp, scaled_size)
-                Icon._font_cache[fkey_scaled] = font
-            ascent, descent = font.getmetrics()
-            bbox = font.getbbox(glyph)
+        # The scaled size is sensitive to a one-pixel error in the estimated
+        # bbox, so glyphs that may need scaling are measured exactly
+        if scale_to_fit and ctx.metrics is not None and (glyph_w >= inner_w or glyph_h >= inner_h):
+            _, _, bbox = Icon._measure(ctx, glyph, font_size)
             glyph_w = bbox[2] - bbox[0]
             glyph_h = bbox[3] - bbox[1]
 
+        if scale_to_fit and (glyph_w > inner_w or glyph_h > inner_h):
+            scale = min(inner_w / max(glyph_w, 1), inner_h / max(glyph_h, 1)) * 0.95
+            font_size = max(1, int(font_size * scale))
+
+        # Rasterizing also yields the exact bbox at the final size, so the glyph
+        # is placed from FreeType's own layout without measuring it again
+        font, lock = Icon._get_font(ctx, font_size)
+        with lock:
+            ascent, descent = font.getmetrics()
+            bitmap, (left, top) = font.getmask2(glyph, mode="L")
+        glyph_w, glyph_h = bitmap.size
         full_height = ascent + descent
 
-        img = Image.new("RGBA", (canvas_size, canvas_size), (255, 255, 255, 0))
-        draw = ImageDraw.Draw(img)
+        mask = Image.new("L", (canvas_size, canvas_size), 0)
+        draw = ImageDraw.Draw(mask)
 
-        dx = pad + (inner_w - glyph_w) // 2 - bbox[0]
-        dy = pad + (inner_h - full_height) // 2 + (ascent - bbox[3])
+        dx = pad + (inner_w - glyph_w) // 2 - left
+        dy = pad + (inner_h - full_height) // 2 + (ascent - top - glyph_h)
         if y_bias:
-            dy += int(self.size * y_bias)
+            dy += int(size * y_bias)
 
-        draw.text((dx, dy), glyph, font=font, fill=self.color)
+        # Same as `draw.text((dx, dy), glyph, ...)` with the bitmap at hand
+        draw.draw.draw_bitmap((dx + left, dy + top), bitmap, 255)
 
-        pm = PhotoImage(image=img)
-        Icon._cache[key] = pm
-        return pm
+        Icon._mask_cache[mkey] = mask
+        if disk is not None:
+            disk.put(ctx, glyph, size, mask)
+        return mask
+
+    @classmethod
+    def _uniform_font_size(cls, ctx: RenderContext, size: int, inner_w: int, inner_h: int) -> int:
+        """Return the font size that fits nearly all of the style's glyphs into the inner box.
+
+        Computed once per (style, size) from the extents of every glyph in the
+        context's icon map; glyphs beyond the quantile are scaled individually.
+        """
+        ukey = (ctx.icon_set_id, size, inner_w, inner_h)
+        font_size = Icon._uniform_sizes.get(ukey)
+        if font_size is not None:
+            return font_size
+
+        k = size / _EXTENT_SIZE
+        ratios = sorted(
+            max(w * k / max(inner_w, 1), h * k / max(inner_h, 1)) for w, h in Icon._extents(ctx))
+        font_size = size
+        if ratios:
+            ratio = ratios[int(_UNIFORM_QUANTILE * (len(ratios) - 1))]
+            if ratio > 1:
+                font_size = max(1, int(size * 0.95 / ratio))
+        return Icon._uniform_sizes.setdefault(ukey, font_size)
+
+    @classmethod
+    def _extents(cls, ctx: RenderContext) -> list[tuple[int, int]]:
+        """Return `(width, height)` of every glyph of the context at `_EXTENT_SIZE`.
+
+        Styles with the same font and glyphs (e.g. styles told apart only by a
+        name predicate) share one measurement. Extents come from the
+        provider's metrics sidecar when it has one and are measured with
+        FreeType otherwise. Measuring holds no global lock: threads racing on
+        the first measurement of a glyph set keep the first result.
+        """
+        ekey = (ctx.font_key, frozenset(ctx.icon_map.values()))
+        extents = Icon._glyph_extents.get(ekey)
+        if extents is None:
+            extents = []
+            for glyph in ekey[1]:
+                _, _, bbox = Icon._layout(ctx, glyph, _EXTENT_SIZE)
+                extents.append((bbox[2] - bbox[0], bbox[3] - bbox[1]))
+            extents = Icon._glyph_extents.setdefault(ekey, extents)
+        return extents
+
+    @classmethod
+    def _layout(cls, ctx: RenderContext, glyph: str, size: int) -> tuple[int, int, tuple[int, int, int, int]]:
+        """Return `(ascent, descent, bbox)` of `glyph` with the context's font at `size`.
+
+        Uses the provider's precomputed metrics when available, so measuring a
+        glyph needs neither FreeType nor the font at that size.
+        """
+        if ctx.metrics is not None:
+            layout = ctx.metrics.layout(glyph, size)
+            if layout is not None:
+                return layout
+        return Icon._measure(ctx, glyph, size)
+
+    @classmethod
+    def _measure(cls, ctx: RenderContext, glyph: str, size: int) -> tuple[int, int, tuple[int, int, int, int]]:
+        """Measure `(ascent, descent, bbox)` of `glyph` with FreeType at `size`."""
+        font, lock = Icon._get_font(ctx, size)
+        with lock:
+            ascent, descent = font.getmetrics()
+            return ascent, descent, font.getbbox(glyph)
+
+    @classmethod
+    def _get_font(cls, ctx: RenderContext, size: int) -> tuple[ImageFont.FreeTypeFont, threading.Lock]:
+        """Return the pooled `FreeTypeFont` for the context's font at `size` and its lock.
+
+        Pillow creates a separate FreeType face for every size, so the pool is
+        a bounded LRU that releases fonts at sizes no longer rendered. A face
+        is not thread-safe: hold the lock while using the font.
+        """
+        fkey = (ctx.font_key, size)
+        entry = Icon._font_cache.get(fkey)
+        if entry is None:
+            # FreeType faces share one library, so they are created one at a time
+            with Icon._lock:
+                # Another thread may have loaded it while this one waited
+                entry = Icon._font_cache.pop(fkey)
+                if entry is None:
+                    entry = (ImageFont.truetype(ctx.font_file(), size), threading.Lock())
+                Icon._font_cache[fkey] = entry
+        return entry
+
+    @staticmethod
+    def _tint(mask: Image.Image, color: Optional[str]) -> Image.Image:
+        """Composite a solid `color` through an alpha `mask` into an RGBA image.
+
+        A `None` color renders in opaque white, the default fill of `ImageDraw.text`.
+        """
+        r, g, b, a = (255, 255, 255, 255) if color is None else ImageColor.getcolor(color, "RGBA")
+        img = Image.new("RGBA", mask.size, (r, g, b, 0))
+        if a != 255:
+            mask = mask.point(lambda v: v * a // 255)
+        img.putalpha(mask)
+        return img
 
     @classmethod
     def initialize_with_provider(cls, provider: BaseFontProvider, style: str | None = None):
-        """Initialize icon rendering using an external provider."""
+        """Initialize icon rendering using an external provider.
+
+        The first call for a given (provider, style) loads its assets into an
+        immutable `RenderContext`; later calls only re-activate that context.
+        """
         icon_set_id = f"{provider.name}:{style or 'default'}"
-        if Icon._initialized and Icon._icon_set == icon_set_id:
+        ctx = getattr(Icon._local, "context", None)
+        if (ctx is not None and ctx.icon_set_id == icon_set_id and Icon._icon_set == icon_set_id
+                and ctx.uniform_scale == provider.uniform_scale):
             return
-        Icon._icon_set = icon_set_id
-
-        Icon._render_params_cache[icon_set_id] = {
-            "pad_factor": provider.pad_factor,
-            "y_bias": provider.y_bias,
-            "scale_to_fit": provider.scale_to_fit,
-        }
-
-        font_path = Icon._fontfile_cache.get(icon_set_id)
-        if not font_path or not os.path.exists(font_path):
-            font_bytes, json_text = provider.load_assets(style=style)
-            suffix = ".otf" if len(font_bytes) > 4 and font_bytes[:4] == b'OTTO' else ".ttf"
-            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_font:
-                tmp_font.write(font_bytes)
-                font_path = tmp_font.name
-            Icon._fontfile_cache[icon_set_id] = font_path
-        else:
-            _, json_text = provider.load_assets(style=style)
+        Icon._activate(Icon._context_for(provider, style))
+
+    @classmethod
+    def _context_for(cls, provider: BaseFontProvider, style: str | None) -> RenderContext:
+        """Return the render context of a provider style, building it on first use.
 
-        icon_map_data = json.loads(json_text)
-        cls._configure(font_path=font_path, icon_map=icon_map_data)
-        Icon._icon_map_cache[icon_set_id] = Icon._icon_map.copy()
+        Contexts are keyed by the provider's `uniform_scale` as well, so
+        `set_uniform_scale` takes effect for contexts built earlier.
+        """
+        icon_set_id = f"{provider.name}:{style or 'default'}"
+        ckey = (icon_set_id, provider.uniform_scale)
+        ctx = Icon._contexts.get(ckey)
+        if ctx is None:
+            with Icon._lock:
+                ctx = Icon._contexts.get(ckey)
+                if ctx is None:
+                    ctx = Icon._build_context(provider, style, icon_set_id)
+                    Icon._contexts[ckey] = ctx
+        return ctx
 
     @classmethod
-    def cleanup(cls):
-        """Remove all temporary font files and reset internal icon state."""
-        for font_path in Icon._fontfile_cache.values():
-            if font_path and os.path.exists(font_path):
-                try:
-                    os.remove(font_path)
-                except Exception:
-                    pass
+    def _build_context(cls, provider: BaseFontProvider, style: str | None, icon_set_id: str) -> RenderContext:
+        """Load a provider style's font and glyph map into a new `RenderContext`."""
+        return RenderContext(
+            icon_set_id=icon_set_id,
+            provider_name=provider.name,
+            style=style,
+            font_key=provider.font_key(style),
+            font=provider.load_font_source(style),
+            icon_map=parse_icon_map(provider.load_glyphmap(style)),
+            provider_id=provider_id(provider),
+            pad_factor=provider.pad_factor,
+            y_bias=provider.y_bias,
+            scale_to_fit=provider.scale_to_fit,
+            uniform_scale=provider.uniform_scale,
+            metrics=provider.load_glyph_metrics(style),
+        )
+
+    @classmethod
+    def _activate(cls, ctx: RenderContext) -> None:
+        """Make `ctx` the context bound by icons created on this thread.
+
+        The class-level views (`_context`, `_icon_map`, ...) follow the most
+        recent activation on any thread and are kept for backwards compatibility.
+        """
+        Icon._local.context = ctx
+        with Icon._lock:
+            Icon._context = ctx
+            Icon._icon_set = ctx.icon_set_id
+            Icon._icon_map = ctx.icon_map
+            Icon._current_font_path = ctx.font if isinstance(ctx.font, str) else None
+            Icon._initialized = True
+
+    @classmethod
+    def set_cache_limits(cls, max_entries: Optional[int] = _UNSET, max_bytes: Optional[int] = _UNSET) -> None:
+        """Change the limits of the rendered image cache at runtime.
+
+        The limits apply to each Tk interpreter's images separately.
+        Least-recently-used images are evicted immediately when a cache is
+        above the new limits. An evicted image's Tk image is deleted as soon as
+        no icon instance or widget holds a reference to it.
+
+        Args:
+            max_entries: Maximum number of cached images, or `None` for no limit.
+                Omit to keep the current limit.
+            max_bytes: Maximum approximate pixel memory in bytes (4 bytes per
+                pixel), or `None` for no limit. Omit to keep the current limit.
+        """
+        with Icon._lock:
+            if max_entries is not _UNSET:
+                Icon._cache_limits["max_entries"] = max_entries
+            if max_bytes is not _UNSET:
+                Icon._cache_limits["max_bytes"] = max_bytes
+            for part in Icon._partitions.values():
+                part.images.set_limits(max_entries=max_entries, max_bytes=max_bytes)
+
+    @classmethod
+    def set_font_pool_limits(cls, max_entries: Optional[int] = _UNSET, max_bytes: Optional[int] = _UNSET) -> None:
+        """Change the limits of the pool of loaded fonts (one per font file and size).
 
-        Icon._initialized = False
-        Icon._icon_map.clear()
-        Icon._icon_map_cache.clear()
-        Icon._cache.clear()
-        Icon._font_cache.clear()
-        Icon._fontfile_cache.clear()
-        Icon._current_font_path = None
+        Args:
+            max_entries: Maximum number of pooled fonts, or `None` for no limit.
+                Omit to keep the current limit.
+            max_bytes: Maximum approximate font memory in bytes, or `None` for no
+                limit. Omit to keep the current limit.
+        """
+        Icon._font_cache.set_limits(max_entries=max_entries, max_bytes=max_bytes)
+
+    @classmethod
+    def cache_info(cls) -> dict:
+        """Return entry count, approximate bytes, limits and hit/miss counters of the image cache.
+
+        Counts are summed over the images of every Tk interpreter, whose number
+        is given as `"interpreters"`; the limits apply per interpreter. The
+        statistics of the glyph mask cache and the font pool are included under
+        the `"masks"` and `"fonts"` keys, and `"total_bytes"` sums the
+        approximate memory of all three.
+        """
+        info: dict = {"entries": 0, "bytes": 0, **Icon._cache_limits, "hits": 0, "misses": 0, "evictions": 0}
+        with Icon._lock:
+            parts = list(Icon._partitions.values())
+        for part in parts:
+            for field, value in part.images.info().items():
+                if field not in Icon._cache_limits:
+                    info[field] += value
+        info["interpreters"] = len(parts)
+        info["masks"] = Icon._mask_cache.info()
+        info["fonts"] = Icon._font_cache.info()
+        info["total_bytes"] = info["bytes"] + info["masks"]["bytes"] + info["fonts"]["bytes"]
+        return info
+
+    @classmethod
+    def enable_disk_cache(
+            cls,
+            directory: Optional[str | os.PathLike] = None,
+            max_bytes: Optional[int] = 64 * 1024 * 1024,
+    ) -> DiskMaskCache:
+        """Persist rasterized glyph masks on disk so later processes skip FreeType.
+
+        Masks are keyed by the font's content hash, glyph, size and render
+        params, so entries stay valid across processes and installs and are
+        shared by every color of a glyph. Several processes may use the same
+        directory at once.
+
+        Args:
+            directory: Cache directory, or `None` for the per-user cache
+                directory of the platform.
+            max_bytes: Approximate size limit of the cache, or `None` for no limit.
+
+        Returns:
+            The active `DiskMaskCache`.
+        """
+        Icon._disk_cache = DiskMaskCache(directory, max_bytes=max_bytes)
+        return Icon._disk_cache
+
+    @classmethod
+    def disable_disk_cache(cls) -> None:
+        """Stop reading and writing the on-disk mask cache. Existing files are kept."""
+        Icon._disk_cache = None
+
+    @classmethod
+    def cleanup(cls):
+        """Reset internal icon state and release cached images and fonts."""
+        with Icon._lock:
+            Icon._local.context = None
+            Icon._initialized = False
+            Icon._context = None
+            Icon._icon_set = ""
+            Icon._icon_map = {}
+            Icon._contexts.clear()
+            Icon._targets.clear()
+            for part in Icon._partitions.values():
+                part.release()
+            Icon._partitions.clear()
+            Icon._mask_cache.clear()
+            Icon._font_cache.clear()
+            Icon._uniform_sizes.clear()
+            Icon._glyph_extents.clear()
+            Icon._current_font_path = None
 
     def __str__(self):
         return str(self._img)
@@ -0,0 +1,247 @@
+"""Record the icons an application renders and preload them at startup.
+
+The first time an icon is shown, its font is loaded and its glyph rasterized
+by FreeType, which can stall the first click on a menu or toolbar. A usage
+manifest lists every `(provider, style, name, size, color)` an application
+rendered in an earlier session so `preload` can do that work up front, on a
+background thread and, when given a Tk widget, by creating the final images
+in small slices while the event loop is idle.
+
+Example:
+    # While exercising the app (e.g. in development): record what it renders
+    start_recording("icons.manifest.json")  # written at interpreter exit
+
+    # At startup: warm the caches without blocking the UI
+    preload("icons.manifest.json", root)
+
+File layout (JSON):
+
+    {"version": 1, "icons": [[provider, style, name, size, color], ...]}
+
+`provider` is the `module:qualname` of the provider class, `style` is the
+provider style or `null` for its default, and `name` is the resolved glyph
+name.
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import os
+import tempfile
+import threading
+from concurrent.futures import Executor, Future
+from pathlib import Path
+from tkinter import Misc
+from typing import Iterable, Optional
+
+from .context import RenderContext
+from .icon import Icon
+from .name_index import load_provider
+from .prerender import PrerenderQueue
+
+MANIFEST_VERSION = 1
+
+# (provider id, style, glyph name, size, color)
+ManifestEntry = tuple[str, Optional[str], str, int, str]
+
+
+class UsageRecorder:
+    """Collects the icons requested from the renderer while it is active.
+
+    Every icon image request is recorded, including those served from the
+    cache, so the manifest covers everything the session showed.
+
+    Args:
+        path: Default manifest path for `save()`.
+    """
+
+    __slots__ = ("path", "_entries", "_lock")
+
+    def __init__(self, path: Optional[str | os.PathLike] = None):
+        self.path = Path(path) if path is not None else None
+        # Insertion-ordered set of entries
+        self._entries: dict[ManifestEntry, None] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def record(self, ctx: RenderContext, name: str, size: int, color: str) -> None:
+        """Record a request for glyph `name` of `ctx` at `size` in `color`."""
+        entry = (ctx.provider_id, ctx.style, name, size, color)
+        if entry not in self._entries:
+            with self._lock:
+                self._entries[entry] = None
+
+    def entries(self) -> list[ManifestEntry]:
+        """Return the recorded entries in first-use order."""
+        with self._lock:
+            return list(self._entries)
+
+    def save(self, path: Optional[str | os.PathLike] = None) -> Path:
+        """Write the recorded entries as a manifest to `path` (default: the recorder's path).
+
+        The file is replaced atomically, so a reader never sees a partial manifest.
+
+        Raises:
+            ValueError: If neither `path` nor the recorder's path is set.
+        """
+        target = Path(path) if path is not None else self.path
+        if target is None:
+            raise ValueError("No manifest path given.")
+        data = json.dumps({"version": MANIFEST_VERSION, "icons": self.entries()}, indent=0)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=".tmp-", dir=target.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(data)
+            os.replace(tmp, target)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return target
+
+
+def start_recording(path: Optional[str | os.PathLike] = None, save_at_exit: bool = True) -> UsageRecorder:
+    """Start recording the icons the renderer is asked for.
+
+    Args:
+        path: Manifest path. When given and `save_at_exit` is true, the
+            manifest is written when the interpreter exits.
+        save_at_exit: Whether to save to `path` at interpreter exit.
+
+    Returns:
+        The active `UsageRecorder`.
+    """
+    recorder = UsageRecorder(path)
+    if path is not None and save_at_exit:
+        atexit.register(recorder.save)
+    Icon._recorder = recorder
+    return recorder
+
+
+def stop_recording() -> Optional[UsageRecorder]:
+    """Stop recording and return the recorder that was active, if any."""
+    recorder = Icon._recorder
+    Icon._recorder = None
+    return recorder
+
+
+def load_manifest(path: str | os.PathLike) -> list[ManifestEntry]:
+    """Read the entries of a manifest written by `UsageRecorder.save`.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not a manifest of a supported version.
+    """
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        if data.get("version") != MANIFEST_VERSION:
+            raise ValueError("Unsupported manifest version.")
+        return [(str(p), s if s is None else str(s), str(n), int(z), str(c)) for p, s, n, z, c in data["icons"]]
+    except (TypeError, KeyError, AttributeError, json.JSONDecodeError) as exc:
+        raise ValueError(f"Not an icon usage manifest: {path}") from exc
+
+
+def _entry_target(entry: ManifestEntry) -> tuple[RenderContext, str]:
+    """Return the render context and glyph name of a manifest entry.
+
+    Raises:
+        ValueError: If the entry's provider is not available or no longer has the glyph.
+    """
+    provider_id, style, name, _, _ = entry
+    ctx = Icon._context_for(load_provider(provider_id), style)
+    if ctx.glyph(name) is None:
+        raise ValueError(f"'{name}' is not a glyph of {ctx.icon_set_id}.")
+    return ctx, name
+
+
+def _warm_masks(entries: list[ManifestEntry], future: Future) -> None:
+    """Rasterize the glyph masks of `entries` and complete `future` with their count."""
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        done: set[tuple] = set()
+        for entry in entries:
+            try:
+                ctx, name = _entry_target(entry)
+            except ValueError:
+                continue
+            # Masks are shared by every color of a glyph
+            key = (ctx.icon_set_id, name, entry[3])
+            if key not in done:
+                Icon._render_mask(ctx, ctx.glyph(name), entry[3])
+                done.add(key)
+        future.set_result(len(done))
+    except Exception as exc:
+        future.set_exception(exc)
+
+
+def preload(
+        manifest: str | os.PathLike | UsageRecorder | Iterable[ManifestEntry],
+        master: Optional[Misc] = None,
+        executor: Optional[Executor] = None,
+) -> Future:
+    """Warm the render caches with the icons listed in a usage manifest.
+
+    Without `master`, glyph masks (the FreeType work) are rendered on a
+    background thread; the images themselves are created on first use,
+    which then costs only a tint. With `master`, the `PhotoImage`s are also
+    created, on the Tk thread in frame-budgeted slices (see `PrerenderQueue`),
+    so later requests are plain cache hits.
+
+    Entries whose provider is not installed or whose glyph no longer exists
+    are skipped.
+
+    Args:
+        manifest: Manifest path, a `UsageRecorder`, or manifest entries.
+        master: A widget of the Tk interpreter to create images for, or `None`
+            to only warm the glyph masks.
+        executor: Executor for the background work, or `None` for a private
+            thread.
+
+    Returns:
+        A future resolving to the number of icons (with `master`) or glyph
+        masks (without) that were warmed. With `master`, it completes on the
+        Tk thread.
+    """
+    if isinstance(manifest, UsageRecorder):
+        entries = manifest.entries()
+    elif isinstance(manifest, (str, os.PathLike)):
+        entries = load_manifest(manifest)
+    else:
+        entries = list(manifest)
+
+    future: Future = Future()
+    if master is None:
+        if executor is not None:
+            executor.submit(_warm_masks, entries, future)
+        else:
+            threading.Thread(target=_warm_masks, args=(entries, future), daemon=True,
+                             name="ttkbootstrap-icons-preload").start()
+        return future
+
+    queue = PrerenderQueue(master, executor=executor, max_workers=1)
+    future.set_running_or_notify_cancel()
+    if not entries:
+        future.set_result(0)
+        return future
+
+    remaining = len(entries)
+    warmed = 0
+
+    def finished(done: Future) -> None:
+        nonlocal remaining, warmed
+        remaining -= 1
+        if not done.cancelled() and done.exception() is None:
+            warmed += 1
+        if remaining == 0:
+            queue.close()
+            future.set_result(warmed)
+
+    for entry in entries:
+        size, color = entry[3], entry[4]
+        queue._enqueue(entry, functools.partial(_entry_target, entry), size, color).add_done_callback(finished)
+    return future
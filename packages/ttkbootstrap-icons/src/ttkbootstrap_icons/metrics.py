@@ -0,0 +1,164 @@
+"""Precomputed glyph metrics.
+
+Centering a glyph needs the font's ascent/descent and the glyph's bounding
+box at the requested size, and `scale_to_fit` needs them twice when a glyph
+has to shrink. Asking FreeType for them costs about a third of a glyph's
+rasterization. The asset tools therefore measure every glyph once at a large
+reference size and ship the results in a `<font>.metrics.bin` sidecar next to
+the font. At render time the metrics for any size are derived by scaling, and
+the font is loaded only at the size that is finally drawn.
+
+File layout (integers little-endian, 32-bit):
+
+    magic         4 bytes  b"TBFM"
+    version       u16
+    reserved      u16
+    font digest   16 bytes (`font_digest` of the font the metrics belong to)
+    ref_size      u32      reference pixel size the metrics were measured at
+    ascent        i32      font ascent at ref_size
+    descent       i32      font descent at ref_size
+    count         u32      number of glyphs
+    codepoints    count u32, ascending
+    bboxes        4 * count i32, (left, top, right, bottom) per codepoint, as
+                  returned by `FreeTypeFont.getbbox` at ref_size
+
+Scaled values are rounded outwards like FreeType's own size metrics, so the
+result matches a direct measurement to within the hinting of the glyph
+outline (at most one pixel).
+"""
+
+from __future__ import annotations
+
+import math
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+MAGIC = b"TBFM"
+VERSION = 1
+REF_SIZE = 2048
+
+_HEADER = struct.Struct("<4sHH16sIiiI")
+# Absorbs float error so exact products are not pushed to the next integer
+_EPS = 1e-6
+
+Layout = tuple[int, int, tuple[int, int, int, int]]
+
+
+def glyph_metrics_filename(font_filename: str) -> str:
+    """Return the metrics sidecar name for a packaged font (`fonts/x.ttf` -> `fonts/x.metrics.bin`)."""
+    return str(Path(font_filename).with_suffix(".metrics.bin").as_posix())
+
+
+def _int_array(typecode: str, data: Any) -> array:
+    values = array(typecode)
+    values.frombytes(bytes(data))
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+def _to_bytes(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+class GlyphMetrics:
+    """Glyph bounding boxes and font ascent/descent of one font at a reference size.
+
+    Args:
+        buffer: Bytes of a metrics sidecar.
+
+    Raises:
+        ValueError: If the buffer is not a metrics sidecar of a supported version.
+    """
+
+    __slots__ = ("font_digest", "_ref_size", "_ascent", "_descent", "_codepoints", "_bboxes")
+
+    def __init__(self, buffer: Any):
+        if len(buffer) < _HEADER.size:
+            raise ValueError("Glyph metrics are truncated.")
+        magic, version, _, digest, ref_size, ascent, descent, count = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != VERSION or ref_size <= 0:
+            raise ValueError("Not a glyph metrics file of a supported version.")
+        codes_at = _HEADER.size
+        bboxes_at = codes_at + 4 * count
+        if len(buffer) != bboxes_at + 16 * count:
+            raise ValueError("Glyph metrics are truncated.")
+
+        self.font_digest: bytes = digest
+        self._ref_size = ref_size
+        self._ascent = ascent
+        self._descent = descent
+        self._codepoints = _int_array("I", buffer[codes_at:bboxes_at])
+        self._bboxes = _int_array("i", buffer[bboxes_at:])
+        if self._codepoints.itemsize != 4 or self._bboxes.itemsize != 4:
+            raise ValueError("Unsupported platform integer size.")
+
+    def __len__(self) -> int:
+        return len(self._codepoints)
+
+    def layout(self, glyph: str, size: int) -> Optional[Layout]:
+        """Return `(ascent, descent, bbox)` of `glyph` at `size`, or `None` when not measured.
+
+        The values correspond to `font.getmetrics()` and `font.getbbox(glyph)`
+        of the font loaded at `size`.
+        """
+        if len(glyph) != 1:
+            return None
+        codepoint = ord(glyph)
+        i = bisect_left(self._codepoints, codepoint)
+        if i >= len(self._codepoints) or self._codepoints[i] != codepoint:
+            return None
+
+        k = size / self._ref_size
+        ascent = math.ceil(self._ascent * k - _EPS)
+        descent = math.ceil(self._descent * k - _EPS)
+        left, top, right, bottom = self._bboxes[4 * i:4 * i + 4]
+        # Top and bottom are measured from the ascender line; scale them from the baseline
+        y_max = self._ascent - top
+        y_min = self._ascent - bottom
+        bbox = (
+            math.floor(left * k + _EPS),
+            ascent - math.ceil(y_max * k - _EPS),
+            math.ceil(right * k - _EPS),
+            ascent - math.floor(y_min * k + _EPS),
+        )
+        return ascent, descent, bbox
+
+
+def encode_glyph_metrics(
+        font_digest: bytes,
+        ascent: int,
+        descent: int,
+        bboxes: Iterable[tuple[int, tuple[int, int, int, int]]],
+        ref_size: int = REF_SIZE,
+) -> bytes:
+    """Serialize `(codepoint, bbox)` pairs measured at `ref_size` into a metrics sidecar."""
+    entries = sorted(dict(bboxes).items())
+    codepoints = array("I", (code for code, _ in entries))
+    boxes = array("i", (v for _, bbox in entries for v in bbox))
+    header = _HEADER.pack(MAGIC, VERSION, 0, font_digest, ref_size, ascent, descent, len(entries))
+    return header + _to_bytes(codepoints) + _to_bytes(boxes)
+
+
+def open_glyph_metrics(resource: Any, font_digest: bytes) -> Optional[GlyphMetrics]:
+    """Load a metrics sidecar from a package resource, or return `None`.
+
+    `None` is returned when the resource is missing, invalid, or was measured
+    for a different font than the one with digest *font_digest*.
+    """
+    try:
+        if not resource.is_file():
+            return None
+        metrics = GlyphMetrics(resource.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if metrics.font_digest != font_digest:
+        return None
+    return metrics
@@ -0,0 +1,352 @@
+"""Compact name indexes used by providers to resolve icon names.
+
+A provider style accepts three spellings for each glyph: the raw glyph name,
+its formatted ("friendly") name, and `<name>-<style>`. Storing all three as
+separate dictionary keys per style costs tens of thousands of string objects
+for large sets. Instead:
+
+- `GlyphTable` assigns an integer id to every raw glyph name of a glyph map
+  (its position in the map) and finds ids by binary search over a sorted
+  `array` of ids. Names are the glyph map's own key strings, so each name is
+  held once. A table built from a `CompiledGlyphmap` holds no per-glyph
+  objects at all and searches the mapped file instead.
+- `StyleIndex` marks which ids belong to a style in a one-byte-per-glyph
+  bitmap. Formatted names that differ from the raw name are kept in a sorted
+  tuple with a parallel `array` of ids. The `-<style>` variants are derived
+  during lookup rather than stored.
+
+Running the style predicates and `format_glyph_name` over every glyph is the
+bulk of building a `StyleIndex`. The asset tools therefore precompile each
+style's index into a `nameindex*.bin` sidecar next to the compiled glyph map;
+providers load it directly and only fall back to the predicates when the
+sidecar is missing, stale, or was built for a different provider class.
+
+Sidecar layout (integers little-endian unsigned 32-bit unless noted):
+
+    magic           4 bytes  b"TBNI"
+    version         u16
+    reserved        u16
+    glyphmap        8 bytes  digest of the compiled glyph map it indexes
+    count           number of glyphs in that glyph map
+    alias_count     number of aliases
+    provider_size   size of the provider id in bytes
+    aliases_size    size of the alias names blob in bytes
+    provider        UTF-8 provider id, `module:qualname` of the provider class
+    members         count bytes, non-zero for glyphs in the style
+    alias_ids       alias_count glyph ids
+    aliases         UTF-8 alias names, sorted, separated by NUL bytes
+"""
+
+from __future__ import annotations
+
+import importlib
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import Any, Optional
+
+from .glyphmap import CompiledGlyphmap
+
+INDEX_MAGIC = b"TBNI"
+INDEX_VERSION = 1
+
+_INDEX_HEADER = struct.Struct("<4sHH8sIIII")
+
+
+def name_index_filename(style: Optional[str]) -> str:
+    """Return the sidecar file name of the precompiled index for *style* (`None` for unstyled providers)."""
+    return f"nameindex-{style}.bin" if style else "nameindex.bin"
+
+
+def _ids_from_bytes(data: Any) -> array:
+    ids = array("i")
+    ids.frombytes(bytes(data))
+    if sys.byteorder != "little":
+        ids.byteswap()
+    return ids
+
+
+def _ids_to_bytes(ids: array) -> bytes:
+    if sys.byteorder != "little":
+        ids = array("i", ids)
+        ids.byteswap()
+    return ids.tobytes()
+
+
+class GlyphTable:
+    """Integer ids for the raw glyph names of one glyph map."""
+
+    __slots__ = ("_names", "_order", "_compiled")
+
+    def __init__(self, names: Iterable[str] = (), compiled: Optional[CompiledGlyphmap] = None):
+        self._compiled = compiled
+        if compiled is not None:
+            self._names: tuple[str, ...] = ()
+            self._order = array("i")
+        else:
+            self._names = tuple(str(n) for n in names)
+            self._order = array("i", sorted(range(len(self._names)), key=self._names.__getitem__))
+
+    @classmethod
+    def for_glyphmap(cls, glyphmap: Mapping) -> GlyphTable:
+        """Build a table for a parsed or compiled glyph map."""
+        if isinstance(glyphmap, CompiledGlyphmap):
+            return cls(compiled=glyphmap)
+        return cls(glyphmap.keys())
+
+    def __len__(self) -> int:
+        if self._compiled is not None:
+            return len(self._compiled)
+        return len(self._names)
+
+    def id_of(self, name: str) -> int:
+        """Return the id of raw glyph *name*, or -1 when unknown."""
+        if self._compiled is not None:
+            return self._compiled._index_of(name)
+        names = self._names
+        i = bisect_left(self._order, name, key=names.__getitem__)
+        if i < len(self._order) and names[self._order[i]] == name:
+            return self._order[i]
+        return -1
+
+    def name_of(self, glyph_id: int) -> str:
+        """Return the raw glyph name for *glyph_id*."""
+        if self._compiled is not None:
+            return self._compiled.name_at(glyph_id)
+        return self._names[glyph_id]
+
+
+def _sorted_index(names: tuple[str, ...], name: str) -> int:
+    i = bisect_left(names, name)
+    if i < len(names) and names[i] == name:
+        return i
+    return -1
+
+
+class StyleIndex(Mapping[str, str]):
+    """Read-only mapping of accepted spellings -> raw glyph name for one style.
+
+    Lookup order: raw glyph name, formatted name, then `<raw>-<style>` (only
+    for raw names that do not already contain `-<style>`).
+
+    Args:
+        table: Glyph table of the style's glyph map.
+        style: Style key, or `None` when suffixed variants are not accepted.
+        members: One byte per glyph id; non-zero when the glyph belongs to the style.
+        alias_names: Sorted formatted names that differ from their raw glyph name.
+        alias_ids: Glyph id of each entry of `alias_names`.
+    """
+
+    __slots__ = ("_table", "_style", "_suffix", "_members", "_alias_names", "_alias_ids", "_count")
+
+    def __init__(
+            self,
+            table: GlyphTable,
+            style: Optional[str],
+            members: bytearray,
+            alias_names: tuple[str, ...],
+            alias_ids: array,
+    ):
+        self._table = table
+        self._style = style
+        self._suffix = f"-{style}" if style else None
+        self._members = members
+        self._alias_names = alias_names
+        self._alias_ids = alias_ids
+        self._count = len(members) - members.count(0)
+
+    @classmethod
+    def build(
+            cls,
+            table: GlyphTable,
+            style: Optional[str],
+            format_name: Callable[[str], str],
+            predicate: Optional[Callable[[str], bool]] = None,
+    ) -> StyleIndex:
+        """Build the index for *style* by running *predicate* and *format_name* over the table."""
+        members = bytearray(len(table))
+        aliases: dict[str, int] = {}
+        for glyph_id in range(len(table)):
+            name = table.name_of(glyph_id)
+            if predicate is not None and not predicate(name):
+                continue
+            members[glyph_id] = 1
+            formatted = format_name(name)
+            if formatted != name:
+                aliases[formatted] = glyph_id
+        alias_names = tuple(sorted(aliases))
+        return cls(table, style, members, alias_names, array("i", (aliases[a] for a in alias_names)))
+
+    @classmethod
+    def from_bytes(
+            cls,
+            data: Any,
+            table: GlyphTable,
+            style: Optional[str],
+            glyphmap_digest: bytes,
+            provider_id: str,
+    ) -> StyleIndex:
+        """Load an index precompiled by `to_bytes` for the given glyph map and provider.
+
+        Raises:
+            ValueError: If *data* is not a supported index, or was built for a
+                different glyph map or provider.
+        """
+        if len(data) < _INDEX_HEADER.size:
+            raise ValueError("Name index is truncated.")
+        magic, version, _, digest, count, alias_count, provider_size, aliases_size = _INDEX_HEADER.unpack_from(data, 0)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            raise ValueError("Not a name index of a supported version.")
+        if digest != glyphmap_digest or count != len(table):
+            raise ValueError("Name index was built for a different glyph map.")
+
+        provider_at = _INDEX_HEADER.size
+        members_at = provider_at + provider_size
+        ids_at = members_at + count
+        aliases_at = ids_at + 4 * alias_count
+        if len(data) < aliases_at + aliases_size:
+            raise ValueError("Name index is truncated.")
+        if bytes(data[provider_at:members_at]).decode("utf-8") != provider_id:
+            raise ValueError("Name index was built for a different provider.")
+
+        members = bytearray(data[members_at:ids_at])
+        alias_ids = _ids_from_bytes(data[ids_at:aliases_at])
+        blob = bytes(data[aliases_at:aliases_at + aliases_size]).decode("utf-8")
+        alias_names = tuple(blob.split("\0")) if alias_count else ()
+        if len(alias_names) != alias_count or any(not 0 <= i < count for i in alias_ids):
+            raise ValueError("Name index is corrupt.")
+        return cls(table, style, members, alias_names, alias_ids)
+
+    def to_bytes(self, glyphmap_digest: bytes, provider_id: str) -> bytes:
+        """Serialize the index for the glyph map with digest *glyphmap_digest*."""
+        provider = provider_id.encode("utf-8")
+        aliases = "\0".join(self._alias_names).encode("utf-8")
+        header = _INDEX_HEADER.pack(
+            INDEX_MAGIC, INDEX_VERSION, 0, glyphmap_digest, len(self._members),
+            len(self._alias_names), len(provider), len(aliases),
+        )
+        return b"".join((header, provider, bytes(self._members), _ids_to_bytes(self._alias_ids), aliases))
+
+    def _member_id(self, name: str) -> int:
+        glyph_id = self._table.id_of(name)
+        if glyph_id >= 0 and self._members[glyph_id]:
+            return glyph_id
+        return -1
+
+    def _derives_suffix(self, raw: str) -> bool:
+        return self._suffix is not None and self._suffix not in raw.lower()
+
+    def _suffixed(self, raw: str) -> Optional[str]:
+        """Return the `-<style>` spelling of *raw*, unless it is not derived or names another glyph."""
+        if not self._derives_suffix(raw):
+            return None
+        variant = f"{raw}{self._suffix}"
+        if self._member_id(variant) >= 0:
+            return None
+        return variant
+
+    def _lookup_id(self, key: str) -> int:
+        glyph_id = self._member_id(key)
+        if glyph_id >= 0:
+            return glyph_id
+        alias_at = _sorted_index(self._alias_names, key)
+        if alias_at >= 0:
+            return self._alias_ids[alias_at]
+        if self._suffix is not None and key.endswith(self._suffix):
+            base = key[:-len(self._suffix)]
+            glyph_id = self._member_id(base)
+            if glyph_id >= 0 and self._derives_suffix(base):
+                return glyph_id
+        return -1
+
+    def __getitem__(self, key: str) -> str:
+        glyph_id = self._lookup_id(key) if isinstance(key, str) else -1
+        if glyph_id < 0:
+            raise KeyError(key)
+        return self._table.name_of(glyph_id)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._lookup_id(key) >= 0
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def __iter__(self) -> Iterator[str]:
+        for name in self.glyph_names():
+            yield name
+            variant = self._suffixed(name)
+            if variant is not None:
+                yield variant
+        for alias in self._alias_names:
+            if self._member_id(alias) < 0:
+                yield alias
+
+    def glyph_names(self) -> Iterator[str]:
+        """Yield the raw glyph names of this style, in glyph map order."""
+        for glyph_id, member in enumerate(self._members):
+            if member:
+                yield self._table.name_of(glyph_id)
+
+    def alias_items(self) -> Iterator[tuple[str, str]]:
+        """Yield `(alias, raw_name)` pairs for every spelling that differs from the raw name."""
+        for name in self.glyph_names():
+            variant = self._suffixed(name)
+            if variant is not None:
+                yield variant, name
+        for alias, glyph_id in zip(self._alias_names, self._alias_ids):
+            if self._member_id(alias) < 0:
+                yield alias, self._table.name_of(glyph_id)
+
+
+def provider_id(provider: Any) -> str:
+    """Return the id recorded in precompiled indexes for *provider* (its class path)."""
+    cls = type(provider)
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def load_provider(provider_id: str) -> Any:
+    """Return the shared instance of the provider class whose `provider_id` is *provider_id*.
+
+    Raises:
+        ValueError: If the class cannot be imported or has no shared instance.
+    """
+    module_name, _, qualname = provider_id.partition(":")
+    try:
+        obj = importlib.import_module(module_name)
+        for part in qualname.split("."):
+            obj = getattr(obj, part)
+        return obj.shared()
+    except (ImportError, AttributeError, TypeError) as exc:
+        raise ValueError(f"Provider '{provider_id}' is not available.") from exc
+
+
+def write_name_index(path: Path, index: StyleIndex, glyphmap: CompiledGlyphmap, provider: Any) -> None:
+    """Write *index*, built over *glyphmap* by *provider*, as a precompiled sidecar."""
+    Path(path).write_bytes(index.to_bytes(glyphmap.digest(), provider_id(provider)))
+
+
+def open_name_index(
+        resource: Any,
+        table: GlyphTable,
+        glyphmap: CompiledGlyphmap,
+        style: Optional[str],
+        provider: Any,
+) -> Optional[StyleIndex]:
+    """Load a precompiled index from a package resource, or return `None`.
+
+    `None` is returned when the resource is missing, invalid, or was built for
+    another glyph map or provider class, so callers can build the index at
+    runtime instead.
+    """
+    try:
+        if not resource.is_file():
+            return None
+        return StyleIndex.from_bytes(resource.read_bytes(), table, style, glyphmap.digest(), provider_id(provider))
+    except (OSError, ValueError):
+        return None
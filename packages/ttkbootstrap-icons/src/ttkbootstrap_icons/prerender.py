@@ -0,0 +1,261 @@
+"""Asynchronous icon rendering integrated with the Tk event loop.
+
+Rendering hundreds of icons synchronously blocks the event loop while a
+screen is built. `PrerenderQueue` rasterizes icons on worker threads (see
+`rasterize`) and creates the final `PhotoImage`s on the Tk thread from
+`after()` callbacks, spending at most a frame budget per callback so the UI
+keeps responding. Widgets can show a transparent placeholder until their icon
+arrives.
+
+Example:
+    queue = PrerenderQueue(root)
+    provider = BootstrapFontProvider.shared()
+
+    # Placeholder now, real icon as soon as it is rendered
+    for name in names:
+        queue.attach(ttk.Label(frame, text=name, compound="left"), provider, name, 16)
+
+    # A future per icon; done callbacks run on the Tk thread
+    future = queue.submit(provider, "house", 24)
+    future.add_done_callback(lambda f: button.configure(image=f.result()))
+
+    # From asyncio code
+    image = await asyncio.wrap_future(queue.submit(provider, "gear", 24))
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import weakref
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from tkinter import Misc, TclError
+from typing import Callable, Iterable, Optional
+
+from .context import RenderContext
+from .icon import Icon, IconSpec, _normalize_spec
+from .providers import BaseFontProvider
+
+
+class PrerenderQueue:
+    """Render icons on worker threads and deliver them on the Tk thread.
+
+    Call every method from the Tk thread. Futures are completed on the Tk
+    thread, so their done callbacks may update widgets directly. Requests for
+    an icon that is already pending share one future, and icons already in
+    the render cache complete immediately.
+
+    Args:
+        master: A widget of the Tk interpreter that uses the icons; its
+            `after()` schedules the deliveries.
+        executor: Executor used for rasterization, or `None` for a private
+            thread pool that `close()` shuts down.
+        max_workers: Number of threads of the private pool (default: up to 4,
+            bounded by the CPU count).
+        frame_budget: Milliseconds a delivery callback may spend creating
+            images before yielding to the event loop.
+        poll_interval: Milliseconds between checks for finished icons while
+            requests are pending.
+    """
+
+    __slots__ = (
+        "_master", "_executor", "_owns_executor", "_frame_budget", "_poll_interval",
+        "_ready", "_pending", "_attached", "_after_id",
+    )
+
+    def __init__(
+            self,
+            master: Misc,
+            executor: Optional[Executor] = None,
+            max_workers: Optional[int] = None,
+            frame_budget: float = 8.0,
+            poll_interval: int = 10,
+    ):
+        self._master = master
+        self._owns_executor = executor is None
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers or min(4, os.cpu_count() or 1),
+                thread_name_prefix="ttkbootstrap-icons",
+            )
+        self._executor = executor
+        self._frame_budget = frame_budget / 1000
+        self._poll_interval = poll_interval
+        # Finished rasterizations, appended by workers and drained on the Tk thread
+        self._ready: deque[tuple[tuple, Future, object]] = deque()
+        self._pending: dict[tuple, Future] = {}
+        # Latest request per attached widget; holds the delivered image alive
+        self._attached: weakref.WeakKeyDictionary[Misc, Future] = weakref.WeakKeyDictionary()
+        self._after_id: Optional[str] = None
+
+    @property
+    def pending(self) -> int:
+        """Number of requested icons not yet delivered."""
+        return len(self._pending)
+
+    def submit(
+            self,
+            provider: BaseFontProvider,
+            name: str,
+            size: int = 24,
+            color: str = "black",
+            style: Optional[str] = None,
+    ) -> Future:
+        """Request an icon and return a future resolving to its `PhotoImage`.
+
+        The future fails with `ValueError` when the name cannot be resolved.
+        Use `asyncio.wrap_future` to await it from asyncio code.
+        """
+        key = (provider.name, name, size, color, style)
+        future = self._pending.get(key)
+        if future is not None:
+            return future
+
+        image = Icon._cached_image(provider, name, size, color, style, self._master)
+        if image is not None:
+            future = Future()
+            future.set_result(image)
+            return future
+        return self._enqueue(key, lambda: Icon._target(provider, name, style), size, color)
+
+    def submit_many(
+            self,
+            provider: BaseFontProvider,
+            specs: Iterable[IconSpec],
+            size: int = 24,
+            color: str = "black",
+            style: Optional[str] = None,
+    ) -> list[Future]:
+        """Request many icons of one provider; specs are as for `Icon.render_many`."""
+        return [self.submit(provider, *_normalize_spec(spec, size, color, style)) for spec in specs]
+
+    def attach(
+            self,
+            widget: Misc,
+            provider: BaseFontProvider,
+            name: str,
+            size: int = 24,
+            color: str = "black",
+            style: Optional[str] = None,
+            option: str = "image",
+    ) -> Future:
+        """Show a transparent placeholder on `widget` until the icon is rendered.
+
+        The widget's `option` is configured with the icon when it arrives. A
+        later `attach` to the same widget supersedes an earlier one still in
+        flight. The queue keeps the delivered image alive while the widget
+        exists.
+        """
+        future = self.submit(provider, name, size, color, style)
+        self._attached[widget] = future
+        if not future.done():
+            widget.configure({option: Icon._get_transparent(size, self._master)})
+
+        widget_ref = weakref.ref(widget)
+
+        def apply(done: Future) -> None:
+            target = widget_ref()
+            if target is None or self._attached.get(target) is not done:
+                return
+            if done.cancelled() or done.exception() is not None:
+                return
+            try:
+                target.configure({option: done.result()})
+            except TclError:
+                # Widget destroyed before its icon arrived
+                pass
+
+        future.add_done_callback(apply)
+        return future
+
+    def close(self) -> None:
+        """Cancel pending requests and stop delivering. Shuts down a private thread pool."""
+        if self._after_id is not None:
+            try:
+                self._master.after_cancel(self._after_id)
+            except TclError:
+                pass
+            self._after_id = None
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        self._ready.clear()
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _enqueue(
+            self,
+            key: tuple,
+            target: Callable[[], tuple[RenderContext, str]],
+            size: int,
+            color: str,
+    ) -> Future:
+        """Rasterize the glyph returned by `target()` (called on a worker) and deliver it under `key`."""
+        future = self._pending.get(key)
+        if future is None:
+            future = self._pending[key] = Future()
+            self._executor.submit(self._rasterize, key, future, target, size, color)
+            self._schedule(self._poll_interval)
+        return future
+
+    # -----------------------------
+    # Worker side
+    # -----------------------------
+    def _rasterize(
+            self,
+            key: tuple,
+            future: Future,
+            target: Callable[[], tuple[RenderContext, str]],
+            size: int,
+            color: str,
+    ) -> None:
+        result: object = None
+        if not future.cancelled():
+            try:
+                ctx, name = target()
+                result = (ctx, name, size, color, Icon._rasterize(ctx, name, size, color))
+            except Exception as exc:
+                result = exc
+        self._ready.append((key, future, result))
+
+    # -----------------------------
+    # Tk side
+    # -----------------------------
+    def _schedule(self, delay: int) -> None:
+        if self._after_id is not None:
+            return
+        try:
+            self._after_id = self._master.after(delay, self._deliver)
+        except TclError:
+            # The interpreter is gone; nothing can be delivered anymore
+            self.close()
+
+    def _deliver(self) -> None:
+        """Turn finished rasterizations into images until the frame budget is spent."""
+        self._after_id = None
+        deadline = time.perf_counter() + self._frame_budget
+        ready = self._ready
+        while ready:
+            key, future, result = ready.popleft()
+            if self._pending.get(key) is future:
+                del self._pending[key]
+            if future.cancelled():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                try:
+                    image = Icon._render_image(*result, master=self._master)
+                except Exception as exc:
+                    # e.g. TclError from a destroyed interpreter; the rest of the queue still drains
+                    future.set_exception(exc)
+                else:
+                    future.set_result(image)
+            if time.perf_counter() >= deadline:
+                break
+
+        if ready:
+            self._schedule(1)
+        elif self._pending:
+            self._schedule(self._poll_interval)
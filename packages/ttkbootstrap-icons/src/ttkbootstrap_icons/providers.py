@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import threading
 from abc import ABC
 from collections.abc import Callable
 from copy import deepcopy
 from importlib.resources import files
+from pathlib import Path
 from types import MappingProxyType
 from typing import ClassVar, Mapping, Optional
 
+from .cache import LRUCache
+from .context import font_digest
+from .glyphmap import CompiledGlyphmap, compiled_glyphmap_name, open_compiled_glyphmap
+from .metrics import GlyphMetrics, glyph_metrics_filename, open_glyph_metrics
+from .name_index import GlyphTable, StyleIndex, name_index_filename, open_name_index
+
 try:  # Prefer stdlib typing (Py 3.11+) and fall back to typing_extensions
     from typing import NotRequired, TypedDict, Unpack  # type: ignore[attr-defined]
 except Exception:  # pragma: no cover
@@ -28,21 +37,37 @@ class FontProviderOptions(TypedDict):
     pad_factor: NotRequired[float]
     y_bias: NotRequired[float]
     scale_to_fit: NotRequired[bool]
+    uniform_scale: NotRequired[bool]
 
 
 class BaseFontProvider(ABC):
-    """Base class for icon providers with class-level caches."""
+    """Base class for icon providers with class-level caches.
+
+    Providers are immutable after construction, so one instance per provider
+    class can be shared by every icon; use `shared()` to obtain it.
+    """
 
     __slots__ = (
         "_name", "_package", "_display_name", "_filename", "_homepage",
         "_license_url", "_default_style", "_styles", "_styles_view",
-        "_name_lookup", "_pad_factor", "_y_bias", "_scale_to_fit", "_icon_version"
+        "_name_lookup", "_pad_factor", "_y_bias", "_scale_to_fit", "_uniform_scale", "_icon_version"
     )
 
     # Global caches shared per provider class
-    _glyphmap_cache_global: ClassVar[dict[tuple[type, str], dict]] = {}
+    _glyphmap_cache_global: ClassVar[dict[tuple[type, str], Mapping]] = {}
+    # Parsed glyphmaps keyed by content digest, so identical files are parsed once
+    _glyphmap_by_digest_global: ClassVar[dict[bytes, dict]] = {}
     _font_bytes_cache_global: ClassVar[dict[tuple[type, str], bytes]] = {}
-    _name_lookup_global: ClassVar[dict[type, dict[str, dict[str, str]]]] = {}
+    _glyph_metrics_global: ClassVar[dict[tuple[type, str], Optional[GlyphMetrics]]] = {}
+    _name_lookup_global: ClassVar[dict[type, dict[str, StyleIndex]]] = {}
+    _glyph_table_global: ClassVar[dict[int, tuple[Mapping, GlyphTable]]] = {}
+    # (name, style) -> resolved glyph name, or the ValueError arguments of a name that fails
+    _resolve_cache_global: ClassVar[dict[type, LRUCache[tuple[str, Optional[str]], str | tuple]]] = {}
+    _resolve_cache_size: ClassVar[int] = 4096
+    _shared_instances: ClassVar[dict[type, BaseFontProvider]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+    # Provider class -> uniform scale chosen with `set_uniform_scale`, overriding the constructor option
+    _uniform_scale_global: ClassVar[dict[type, bool]] = {}
 
     _name: str
     _package: str
@@ -54,10 +79,11 @@ class BaseFontProvider(ABC):
     _icon_version: Optional[str]
     _styles: Mapping[str, Mapping[str, str | Callable[[str], bool]]]
     _styles_view: Mapping[str, Mapping[str, str | Callable[[str], bool]]]
-    _name_lookup: dict[str, dict[str, str]]
+    _name_lookup: dict[str, StyleIndex]
     _pad_factor: float
     _y_bias: float
     _scale_to_fit: bool
+    _uniform_scale: bool
 
     def __init__(self, **kwargs: Unpack[FontProviderOptions]):
         self._name = kwargs.get('name')  # required
@@ -75,11 +101,30 @@ class BaseFontProvider(ABC):
         self._pad_factor = kwargs.get('pad_factor', 0.10)
         self._y_bias = kwargs.get('y_bias', 0.0)
         self._scale_to_fit = kwargs.get('scale_to_fit', True)
+        self._uniform_scale = kwargs.get('uniform_scale', False)
 
         if self.has_styles and (not self._default_style or self._default_style not in self._styles):
             self._default_style = next(iter(self._styles.keys()))
 
-        self._name_lookup = self.build_name_lookup()
+        # Per-style lookups are built on first use (see `_style_lookup`)
+        self._name_lookup = self._name_lookup_global.setdefault(type(self), {})
+
+    @classmethod
+    def shared(cls):
+        """Return the shared instance of this provider class, creating it on first use.
+
+        The instance is created lazily under a lock, so concurrent first calls
+        still construct the provider only once. Subclasses whose constructor
+        requires arguments cannot be shared and should be instantiated directly.
+        """
+        inst = cls._shared_instances.get(cls)
+        if inst is None:
+            with cls._shared_lock:
+                inst = cls._shared_instances.get(cls)
+                if inst is None:
+                    inst = cls()
+                    cls._shared_instances[cls] = inst
+        return inst
 
     # -----------------------------
     # Properties
@@ -156,18 +201,53 @@ class BaseFontProvider(ABC):
         """Whether to scale down glyphs that exceed the available space."""
         return self._scale_to_fit
 
+    @property
+    def uniform_scale(self) -> bool:
+        """Whether `scale_to_fit` uses one scale factor per icon size instead of one per glyph.
+
+        The factor is chosen so nearly all glyphs of the style fit; glyphs that
+        still do not fit are scaled individually. This keeps icons of a set at
+        a consistent scale and needs far fewer distinct font sizes. Off unless
+        the provider enables it or it is turned on with `set_uniform_scale`.
+        """
+        return self._uniform_scale_global.get(type(self), self._uniform_scale)
+
+    @classmethod
+    def set_uniform_scale(cls, enabled: bool = True) -> None:
+        """Turn `uniform_scale` on or off for every instance of this provider class.
+
+        Applies to the shared instance used by the icon classes as well, e.g.
+        `MaterialDesignFontProvider.set_uniform_scale()` before creating
+        `MatIcon`s. Computing the scale measures every glyph of a style once,
+        so the first icon of each style renders more slowly. Images already
+        cached for the provider are dropped and re-rendered at the new scale.
+        """
+        from .icon import Icon
+
+        cls._uniform_scale_global[cls] = enabled
+        shared = cls._shared_instances.get(cls)
+        if shared is not None:
+            Icon.invalidate(provider=shared)
+
     # -----------------------------
     # Asset Loading
     # -----------------------------
-    def _read_glyphmap_for_style(self, style: Optional[str]) -> dict:
+    def glyphmap_filename(self, style: Optional[str] = None) -> str:
+        """Return the JSON glyph map file name used by *style*.
+
+        This is `glyphmap.json` for single-file providers, otherwise
+        `glyphmap-<style>.json`.
+        """
         if self.uses_single_file:
-            glyphmap_name = "glyphmap.json"
-            style_key = "single"
-        else:
-            style_key = style or self._default_style
-            if not style_key:
-                raise ValueError(f"No style specified and no default_style configured for provider '{self._name}'.")
-            glyphmap_name = f"glyphmap-{style_key}.json"
+            return "glyphmap.json"
+        style_key = style or self._default_style
+        if not style_key:
+            raise ValueError(f"No style specified and no default_style configured for provider '{self._name}'.")
+        return f"glyphmap-{style_key}.json"
+
+    def _read_glyphmap_for_style(self, style: Optional[str]) -> Mapping:
+        glyphmap_name = self.glyphmap_filename(style)
+        style_key = "single" if self.uses_single_file else (style or self._default_style)
 
         gkey = (type(self), style_key)
         cached = self._glyphmap_cache_global.get(gkey)
@@ -175,19 +255,28 @@ class BaseFontProvider(ABC):
             return cached
 
         pkg = files(self.package)
+
+        # Prefer the compiled (memory-mapped) glyphmap emitted by the asset tools
+        compiled = open_compiled_glyphmap(pkg.joinpath(compiled_glyphmap_name(glyphmap_name)))
+        if compiled is not None:
+            self._glyphmap_cache_global[gkey] = compiled
+            return compiled
+
         glyphmap_path = pkg.joinpath(glyphmap_name)
         try:
-            glyphmap_text = glyphmap_path.read_text(encoding="utf-8")
-            glyphmap = json.loads(glyphmap_text)
+            glyphmap_data = glyphmap_path.read_bytes()
+            digest = hashlib.blake2b(glyphmap_data, digest_size=16).digest()
+            glyphmap = self._glyphmap_by_digest_global.get(digest)
+            if glyphmap is None:
+                glyphmap = json.loads(glyphmap_data.decode("utf-8"))
+                self._glyphmap_by_digest_global[digest] = glyphmap
         except Exception as e:
             raise FileNotFoundError(f"Glyphmap not accessible for provider '{self.name}': {glyphmap_path}") from e
 
         self._glyphmap_cache_global[gkey] = glyphmap
         return glyphmap
 
-    def load_assets(self, style: Optional[str] = None) -> tuple[bytes, str]:
-        pkg = files(self.package)
-
+    def _font_filename_for_style(self, style: Optional[str]) -> str:
         if self.has_styles:
             style_key = style or self._default_style
             if not style_key:
@@ -198,22 +287,69 @@ class BaseFontProvider(ABC):
 
         if not filename:
             raise FileNotFoundError(f"Font filename not set for provider '{self.name}'.")
+        return filename
 
-        # font bytes cache
+    def _read_font_bytes(self, filename: str) -> bytes:
         fkey = (type(self), filename)
         font_bytes = self._font_bytes_cache_global.get(fkey)
         if font_bytes is None:
-            font_bytes = pkg.joinpath(filename).read_bytes()
+            font_bytes = files(self.package).joinpath(filename).read_bytes()
             self._font_bytes_cache_global[fkey] = font_bytes
+        return font_bytes
 
-        # glyphmap name
-        if self.uses_single_file:
-            glyphmap_filename = "glyphmap.json"
-        else:
-            style_key = style or self._default_style
-            glyphmap_filename = f"glyphmap-{style_key}.json"
+    def font_key(self, style: Optional[str] = None) -> str:
+        """Return a stable identifier for the font file used by *style*.
+
+        Styles that share a font file share a key, so fonts and rasterized glyphs
+        can be cached once per file.
+        """
+        return f"{self.package}/{self._font_filename_for_style(style)}"
+
+    def load_font_source(self, style: Optional[str] = None) -> str | bytes:
+        """Return the font for *style* in a form `ImageFont.truetype` can load.
+
+        When the provider package is installed as regular files (including
+        frozen apps that unpack data files), this is the path of the packaged
+        font itself. For zipped installs the font bytes are returned for loading
+        from memory. No temporary files are written in either case.
+        """
+        filename = self._font_filename_for_style(style)
+        resource = files(self.package).joinpath(filename)
+        if isinstance(resource, Path) and resource.is_file():
+            return str(resource)
+        return self._read_font_bytes(filename)
+
+    def load_glyph_metrics(self, style: Optional[str] = None) -> Optional[GlyphMetrics]:
+        """Return the precomputed glyph metrics of the font used by *style*, if packaged.
+
+        The asset tools write a `<font>.metrics.bin` sidecar next to each font.
+        `None` is returned when it is missing or was measured for a different
+        font file; glyphs are then measured with FreeType at render time.
+        """
+        filename = self._font_filename_for_style(style)
+        mkey = (type(self), filename)
+        if mkey not in self._glyph_metrics_global:
+            resource = files(self.package).joinpath(glyph_metrics_filename(filename))
+            metrics = None
+            if resource.is_file():
+                digest = font_digest(self.font_key(style), self.load_font_source(style))
+                metrics = open_glyph_metrics(resource, digest)
+            self._glyph_metrics_global[mkey] = metrics
+        return self._glyph_metrics_global[mkey]
+
+    def load_glyphmap(self, style: Optional[str] = None) -> Mapping:
+        """Return the glyph map for *style* (cached per provider class).
+
+        This is a `CompiledGlyphmap` (name -> codepoint) when the package ships a
+        compiled `glyphmap*.bin`, otherwise the parsed JSON glyph map.
+        """
+        return self._read_glyphmap_for_style(style)
+
+    def load_assets(self, style: Optional[str] = None) -> tuple[bytes, str]:
+        pkg = files(self.package)
+        font_bytes = self._read_font_bytes(self._font_filename_for_style(style))
 
-        glyphmap_json = pkg.joinpath(glyphmap_filename).read_text(encoding="utf-8")
+        glyphmap_json = pkg.joinpath(self.glyphmap_filename(style)).read_text(encoding="utf-8")
         return font_bytes, glyphmap_json
 
     # -----------------------------
@@ -238,6 +374,10 @@ class BaseFontProvider(ABC):
     def resolve_icon_name(self, name: str, style: Optional[str] = None) -> str:
         """Resolve a user-supplied icon name to the actual glyph name.
 
+        Results are memoized per provider class in a bounded LRU cache, including
+        names that fail to resolve (the same `ValueError` message is raised again).
+        See `resolve_cache_info()` for hit and miss counters.
+
         Rules:
         - If *style* is explicitly provided, we resolve within that style only. If the *name*
           clearly encodes a conflicting style suffix (e.g., "-fill" vs requested "outline"),
@@ -245,6 +385,36 @@ class BaseFontProvider(ABC):
         - If *style* is not provided, infer the style from a "-<style>" suffix when present;
           otherwise use the provider's default style (or "base" when no styles).
         """
+        cache = self._resolve_cache()
+        key = (name, style)
+        result = cache.get(key)
+        if result is None:
+            try:
+                result = self._resolve_icon_name_uncached(name, style)
+            except ValueError as exc:
+                # Only the arguments: the exception would keep its traceback's frames alive
+                result = exc.args
+            cache[key] = result
+        if isinstance(result, tuple):
+            raise ValueError(*result)
+        return result
+
+    def _resolve_cache(self) -> LRUCache[tuple[str, Optional[str]], str | tuple]:
+        cache = self._resolve_cache_global.get(type(self))
+        if cache is None:
+            cache = LRUCache(max_entries=self._resolve_cache_size)
+            self._resolve_cache_global[type(self)] = cache
+        return cache
+
+    @classmethod
+    def resolve_cache_info(cls) -> dict[str, Optional[int]]:
+        """Return size, limit and hit/miss counters of this class's name-resolution cache."""
+        cache = cls._resolve_cache_global.get(cls)
+        if cache is None:
+            return LRUCache(max_entries=cls._resolve_cache_size).info()
+        return cache.info()
+
+    def _resolve_icon_name_uncached(self, name: str, style: Optional[str] = None) -> str:
         if name == "none":
             return "none"
 
@@ -261,7 +431,7 @@ class BaseFontProvider(ABC):
                 )
 
             lookup_style = style or inferred_style or self.default_style or "base"
-            lookup = self._name_lookup.get(lookup_style, {})
+            lookup = self._style_lookup(lookup_style)
             if not lookup:
                 raise ValueError(f"Style '{lookup_style}' is not valid for {self.name}. Available: {self.style_list}")
 
@@ -287,7 +457,7 @@ class BaseFontProvider(ABC):
             raise ValueError(f"{name} not found in lookup for {self.name} in {lookup_style} style.")
 
         # no styles
-        lookup = self._name_lookup.get("base", {})
+        lookup = self._style_lookup("base")
         formatted = self.format_glyph_name(name)
         if name in lookup:
             return lookup[name]
@@ -296,79 +466,111 @@ class BaseFontProvider(ABC):
         raise ValueError(f"{name} is not a valid icon for {self.name}.")
 
     def get_icons_names_for_display(self) -> dict[str, dict[str, str]]:
-        if self.has_styles:
-            return {s: {k: v for k, v in d.items() if k != v} for s, d in self._name_lookup.items() if s != "base"}
-        base = self._name_lookup.get("base", {})
-        return {"base": {k: v for k, v in base.items() if k != v}}
+        """Return `{style: {alias: raw_name}}` for every spelling that differs from the raw name.
 
-    def build_name_lookup(self) -> dict[str, dict[str, str]]:
-        cached = self._name_lookup_global.get(type(self))
-        if cached is not None:
-            return cached
+        Per style, the `-<style>` suffixed spellings come first in glyph map
+        order, followed by the formatted names that are not glyph names
+        themselves.
+        """
+        self.build_name_lookup()
+        if self.has_styles:
+            return {s: dict(d.alias_items()) for s, d in self._name_lookup.items() if s != "base"}
+        return {"base": dict(self._style_lookup("base").alias_items())}
 
-        lookup: dict[str, dict[str, str]] = {}
+    def _style_lookup(self, style: str) -> StyleIndex | dict:
+        """Return the name lookup for *style*, building it on first use.
 
-        def fallback_predicate(_: str) -> bool:
-            return True
+        Only the glyphmap for the requested style is read, so an app that uses
+        one style of a multi-style provider never loads the others. Unknown
+        styles return an empty dict.
+        """
+        lookup = self._name_lookup.get(style)
+        if lookup is not None:
+            return lookup
 
         if self.has_styles:
-            for style in self.style_list:
-                cfg = self._styles.get(style, {})
-                pred = cfg.get("predicate", fallback_predicate)
-                if not callable(pred):
-                    pred = fallback_predicate
-                style_lookup: dict[str, str] = {}
-                glyphmap = self._read_glyphmap_for_style(style)
-                for n in glyphmap.keys():
-                    if pred(n):
-                        formatted = self.format_glyph_name(n)
-                        style_lookup[formatted] = n
-                        style_lookup[n] = n
-                        # Only add the style suffix if it's not already present anywhere in the name
-                        # This handles both cases like "archive-fill" and "shield-fill-check"
-                        if f"-{style}" not in n.lower():
-                            style_lookup[f"{n}-{style}"] = n
-                lookup[style] = style_lookup
+            if style not in self._styles:
+                return {}
+            lookup = self._build_style_lookup(style)
+        elif style == "base":
+            lookup = self._build_base_lookup()
         else:
-            glyphmap = self._read_glyphmap_for_style(None)
-            base_lookup: dict[str, str] = {}
-            for n in glyphmap.keys():
-                formatted = self.format_glyph_name(n)
-                base_lookup[formatted] = n
-                base_lookup[n] = n
-            lookup["base"] = base_lookup
-
-        self._name_lookup_global[type(self)] = lookup
+            return {}
+
+        self._name_lookup[style] = lookup
         return lookup
 
+    def _glyph_table(self, glyphmap: Mapping) -> GlyphTable:
+        # Keyed by glyphmap identity so styles sharing a glyphmap share a table
+        entry = self._glyph_table_global.get(id(glyphmap))
+        if entry is None or entry[0] is not glyphmap:
+            entry = (glyphmap, GlyphTable.for_glyphmap(glyphmap))
+            self._glyph_table_global[id(glyphmap)] = entry
+        return entry[1]
+
+    def index_style(self, style: Optional[str], glyphmap: Mapping) -> StyleIndex:
+        """Build the name index of *style* (`None` when unstyled) over *glyphmap*.
+
+        Runs the style predicate and `format_glyph_name` over every glyph. The
+        asset tools call this to precompile `nameindex*.bin` sidecars, so at
+        runtime it is only needed when no matching sidecar is packaged.
+        """
+        return StyleIndex.build(
+            GlyphTable.for_glyphmap(glyphmap), style, self.format_glyph_name, self._style_predicate(style))
+
+    def _style_predicate(self, style: Optional[str]) -> Optional[Callable[[str], bool]]:
+        pred = self._styles.get(style, {}).get("predicate") if style else None
+        return pred if callable(pred) else None
+
+    def _load_style_index(self, style: Optional[str]) -> StyleIndex:
+        glyphmap = self._read_glyphmap_for_style(style)
+        table = self._glyph_table(glyphmap)
+        # Precompiled indexes are only emitted alongside compiled glyph maps
+        if isinstance(glyphmap, CompiledGlyphmap):
+            resource = files(self.package).joinpath(name_index_filename(style))
+            index = open_name_index(resource, table, glyphmap, style, self)
+            if index is not None:
+                return index
+        return StyleIndex.build(table, style, self.format_glyph_name, self._style_predicate(style))
+
+    def _build_style_lookup(self, style: str) -> StyleIndex:
+        return self._load_style_index(style)
+
+    def _build_base_lookup(self) -> StyleIndex:
+        return self._load_style_index(None)
+
+    def build_name_lookup(self) -> dict[str, StyleIndex]:
+        """Build the lookups for every style (or "base") and return them.
+
+        Resolution builds lookups lazily per style; this is only needed when all
+        styles are required at once, e.g. for the icon browser.
+        """
+        for style in (self.style_list if self.has_styles else ("base",)):
+            self._style_lookup(style)
+        return self._name_lookup
+
     def build_display_index(self) -> dict:
-        # Ensure lookup exists
-        if type(self) not in self._name_lookup_global:
-            self.build_name_lookup()
+        """Return the glyph names of every style for the icon browser.
+
+        `names_by_style` lists each style's raw glyph names in the order of the
+        loaded glyph map: file order for a JSON map, sorted by name for a
+        compiled `glyphmap*.bin`. Before the compact name indexes, a glyph whose name equals another
+        glyph's `-<style>` spelling (e.g. Material Design's `basket-fill` and
+        `basket`) was listed next to that glyph instead.
+        """
+        # Ensure lookups exist for every style
+        self.build_name_lookup()
 
-        # Get unique glyph names (values) for each style for display in browser
-        # Preserve a stable, insertion-based order instead of using an unordered set.
+        # Unique glyph names for each style for display in browser, in glyphmap order
         if self.has_styles:
             names_by_style: dict[str, dict[str, str]] = {}
             for style, lookup in self._name_lookup.items():
                 if style == "base":
                     continue
-                seen: set[str] = set()
-                ordered: list[str] = []
-                for v in lookup.values():
-                    if v not in seen:
-                        seen.add(v)
-                        ordered.append(v)
-                names_by_style[style] = {name: name for name in ordered}
+                names_by_style[style] = {name: name for name in lookup.glyph_names()}
         else:
-            base_lookup = self._name_lookup.get("base", {})
-            seen: set[str] = set()
-            ordered: list[str] = []
-            for v in base_lookup.values():
-                if v not in seen:
-                    seen.add(v)
-                    ordered.append(v)
-            names_by_style = {"base": {name: name for name in ordered}}
+            base_lookup = self._style_lookup("base")
+            names_by_style = {"base": {name: name for name in base_lookup.glyph_names()}}
 
         return {
             "names_by_style": names_by_style,
@@ -30,7 +30,10 @@ def load_external_providers(registry: ProviderRegistry) -> None:
     for ep in entry_points(group="ttkbootstrap_icons.providers"):
         try:
             ProviderCls = ep.load()
-            provider_instance = ProviderCls()
+            if isinstance(ProviderCls, type) and issubclass(ProviderCls, BaseFontProvider):
+                provider_instance = ProviderCls.shared()
+            else:
+                provider_instance = ProviderCls()
             registry.register_provider(provider_instance.name, provider_instance)
         except Exception as exc:
             # Print a lightweight warning to help debug bad entry points
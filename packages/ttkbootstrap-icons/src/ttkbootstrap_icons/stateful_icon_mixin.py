@@ -23,6 +23,20 @@ Key behaviors:
     overwrites incoming states, preserves order for existing entries, and
     appends new states.
   * `mode="replace"` sets a fresh `image` map for that child style.
+- State images are owned by the mixin (one per icon, parent style, statespec
+  and state) rather than shared with the render cache, so a theme switch can
+  recolor them in place: widgets and styles refer to images by name and pick
+  up the new pixels without touching the style database.
+- On `<<ThemeChanged>>`, mapped widgets are regenerated from idle callbacks in
+  time-budgeted steps, visible widgets first. Widgets that share an icon,
+  parent style and options are handled once. When a child style's states and
+  icons are unchanged, its images are recolored in place; otherwise its map is
+  rebuilt. A newer theme switch cancels a regeneration that is still running.
+- Mapped widgets are forgotten when they are destroyed. Child styles are
+  reference counted by the widgets using them; when the last one goes, the
+  style's image map is cleared and state images no other style uses are
+  released, so their Tk images are deleted. ttk cannot delete a style name, so
+  the emptied style itself remains. See `mapping_info()` for live counts.
 
 Nuances:
 - Merging only applies when the derived child style name is the same across
@@ -35,10 +49,13 @@ Nuances:
 
 from __future__ import annotations
 
+from collections import deque
+from tkinter import Misc
 from tkinter.ttk import Style, Widget
-from typing import Literal, Optional, ClassVar
+from typing import Callable, Literal, Optional, ClassVar
 import weakref
 import hashlib
+import time
 
 StateMapMode = Literal["replace", "merge"]
 # Accepted statespec entries:
@@ -48,6 +65,22 @@ StateMapMode = Literal["replace", "merge"]
 #   ('pressed', {'name': 'house-fill', 'color': '#0af'})
 IconStateSpec = tuple[str, str | dict[str, str]]
 
+# Cache namespace of the state images rendered by `map()`
+STATE_IMAGE_NAMESPACE = "ttkbootstrap_icons.state-images"
+# Bind tag of mapped widgets and the Tcl command its <Destroy> binding runs
+_MAPPED_TAG = "TtkbootstrapIconsMapped"
+_UNMAP_COMMAND = "ttkbootstrap_icons_unmap"
+
+
+def _freeze_statespec(statespec: Optional[list[IconStateSpec]]) -> Optional[tuple]:
+    """Return a hashable equivalent of `statespec`."""
+    if statespec is None:
+        return None
+    return tuple(
+        (state, tuple(sorted(spec.items())) if isinstance(spec, dict) else spec)
+        for state, spec in statespec
+    )
+
 
 class StatefulIconMixin:
     """Mixin that maps per-state ttk `image` onto a child style.
@@ -77,6 +110,24 @@ class StatefulIconMixin:
     _original_image: Optional[object] = None
     _widget_mappings: ClassVar[dict[str, tuple]] = {}
     _is_regenerating: ClassVar[bool] = False
+    # Widget whose event loop runs theme-change regeneration
+    _theme_owner: ClassVar[Optional[Misc]] = None
+    # (owner, after id) of the scheduled regeneration step
+    _regen_after: ClassVar[Optional[tuple[Misc, str]]] = None
+    # Whether a regeneration is scheduled but has not started yet
+    _regen_pending: ClassVar[bool] = False
+    # Milliseconds a regeneration step may run before yielding to the event loop
+    _regen_budget_ms: ClassVar[float] = 8.0
+    # (host class, icon name, size, parent style, statespec, state) -> [image, color, recolor]
+    _themed_images: ClassVar[dict[tuple, list]] = {}
+    # Child style -> keys of the state images its map was built from
+    _child_maps: ClassVar[dict[str, list[tuple]]] = {}
+    # (theme, host class, name, size, parent style, subclass, statespec, mode) -> (child style, its map keys)
+    _style_memo: ClassVar[dict[tuple, tuple[str, list[tuple]]]] = {}
+    # Widget id -> child style it was configured with
+    _widget_styles: ClassVar[dict[str, str]] = {}
+    # Child style -> [number of mapped widgets using it, `Style` of its interpreter]
+    _child_refs: ClassVar[dict[str, list]] = {}
 
     # ---------------- Rendering ----------------
 
@@ -100,6 +151,74 @@ class StatefulIconMixin:
         inst = type(self)(name, size, color)  # type: ignore[misc]
         return inst.image
 
+    def _render_themed_icon(
+            self, name: str, size: int, color: Optional[str]
+    ) -> tuple[object, Optional[Callable[[Optional[str]], None]]]:
+        """Render a state image that the mixin owns, for recoloring on theme changes.
+
+        Hosts that can rewrite an image's pixels override this to return a
+        private image (not shared with other icons) and a callable that
+        recolors it in place. The default returns `_render_icon()` and `None`,
+        so theme changes rebuild the style map instead.
+
+        Returns:
+            The image and its in-place recolor callable, or `None` when the
+            image cannot be recolored.
+        """
+        return self._render_icon(name, size, color), None
+
+    def _render_themed_icons(
+            self, requests: list[tuple[str, Optional[str]]]
+    ) -> list[Optional[tuple[object, Optional[Callable[[Optional[str]], None]]]]]:
+        """Render the owned state images for `(name, color)` pairs in one call.
+
+        Hosts override this to share work between the states of a style
+        (e.g. one name resolution and one glyph mask per icon). The default
+        calls `_render_themed_icon()` per pair.
+
+        Returns:
+            Per request, the result of `_render_themed_icon()`, or `None` when
+            the image could not be rendered.
+        """
+        results = []
+        for name, color in requests:
+            try:
+                results.append(self._render_themed_icon(name, self.size, color))  # type: ignore[attr-defined]
+            except Exception:
+                results.append(None)
+        return results
+
+    def _themed_images_for(self, wanted: list[tuple[tuple, str, Optional[str]]]) -> dict[tuple, object]:
+        """Return the owned state images for `(key, name, color)` items.
+
+        Existing images are reused, recolored in place when their color
+        changed, and the missing ones are rendered in one batch. Items that
+        fail to render are left out.
+        """
+        themed = StatefulIconMixin._themed_images
+        images: dict[tuple, object] = {}
+        missing: list[tuple[tuple, str, Optional[str]]] = []
+        for key, name, color in wanted:
+            entry = themed.get(key)
+            if entry is None or (entry[1] != color and entry[2] is None):
+                missing.append((key, name, color))
+                continue
+            if entry[1] != color:
+                try:
+                    entry[2](color)
+                except Exception:
+                    continue
+                entry[1] = color
+            images[key] = entry[0]
+
+        if missing:
+            results = self._render_themed_icons([(name, color) for _, name, color in missing])
+            for (key, _, color), result in zip(missing, results):
+                if result is not None:
+                    themed[key] = [result[0], color, result[1]]
+                    images[key] = result[0]
+        return images
+
     # ---------------- Helpers ----------------
 
     @staticmethod
@@ -212,34 +331,197 @@ class StatefulIconMixin:
 
     @classmethod
     def _on_theme_changed(cls, event) -> None:
-        """Handle <<ThemeChanged>> event by regenerating all mapped icons."""
-        from .icon import Icon
+        """Handle <<ThemeChanged>> by scheduling the regeneration of all mapped icons.
 
-        cls._is_regenerating = True
+        The event reaches every widget of the bound toplevel, so the work is
+        deferred to one idle callback per theme switch. A switch that arrives
+        while a regeneration is still running cancels it and starts over.
+        """
+        if cls._regen_pending:
+            return
+        cls._cancel_regeneration()
+        owner = cls._theme_owner
+        if owner is None:
+            return
         try:
-            Icon._cache.clear()
-            mappings_copy = list(cls._widget_mappings.items())
+            cls._regen_after = (owner, owner.after_idle(cls._start_regeneration))
+            cls._regen_pending = True
+        except Exception:
+            cls._regen_after = None
 
-            for widget_id, mapping_data in mappings_copy:
-                try:
-                    icon, widget_ref, parent_style, subclass, statespec, mode = mapping_data
-                    widget = widget_ref()
+    @classmethod
+    def _cancel_regeneration(cls) -> None:
+        """Cancel a scheduled or running regeneration."""
+        pending = cls._regen_after
+        cls._regen_after = None
+        cls._regen_pending = False
+        if pending is not None:
+            owner, after_id = pending
+            try:
+                owner.after_cancel(after_id)
+            except Exception:
+                pass
+
+    @classmethod
+    def _start_regeneration(cls) -> None:
+        """Group the live mappings by signature and regenerate them, visible widgets first.
 
-                    if widget is None:
-                        del cls._widget_mappings[widget_id]
-                        continue
+        Widgets mapped from icons with the same class, name and size onto the
+        same parent style with the same options share one child style, so each
+        group is rendered and mapped once and then applied to all its widgets.
+        """
+        from .icon import Icon
+
+        cls._regen_after = None
+        cls._regen_pending = False
+        # Only the state images follow the theme; other cached icons stay valid
+        Icon.invalidate(namespace=STATE_IMAGE_NAMESPACE)
+
+        groups: dict[tuple, list] = {}
+        for widget_id, mapping_data in list(cls._widget_mappings.items()):
+            icon, widget_ref, parent_style, subclass, statespec, mode = mapping_data
+            if widget_ref() is None:
+                cls._release_widget(widget_id)
+                continue
+            signature = (
+                type(icon), icon.name, icon.size,  # type: ignore[attr-defined]
+                parent_style, subclass, _freeze_statespec(statespec), mode,
+            )
+            group = groups.get(signature)
+            if group is None:
+                group = groups[signature] = [icon, parent_style, subclass, statespec, mode, []]
+            group[5].append((widget_id, widget_ref))
+
+        def visible(group: list) -> bool:
+            for _, widget_ref in group[5]:
+                widget = widget_ref()
+                try:
+                    if widget is not None and widget.winfo_viewable():
+                        return True
+                except Exception:
+                    continue
+            return False
 
-                    # Temporarily restore the original parent style
-                    widget.configure(style=parent_style)
+        # Stable sort: visible groups first, otherwise in mapping order
+        jobs = deque(sorted(groups.values(), key=lambda group: not visible(group)))
+        cls._regenerate(jobs)
 
-                    # Re-map with the original parent style
-                    icon.map(widget, subclass=subclass, statespec=statespec, mode=mode)
+    @classmethod
+    def _regenerate(cls, jobs: deque) -> None:
+        """Regenerate groups until the frame budget is spent, then yield to the event loop."""
+        style = Style()
+        deadline = time.perf_counter() + cls._regen_budget_ms / 1000
+        cls._is_regenerating = True
+        try:
+            while jobs:
+                icon, parent_style, subclass, statespec, mode, members = jobs.popleft()
+                try:
+                    # Same images, new pixels: widgets and the style map are already up to date
+                    recolored = icon._recolor_style_map(style, parent_style, subclass, statespec) is not None
+                    new_style = None if recolored else icon._apply_style_map(
+                        style, parent_style, subclass, statespec, mode)
                 except Exception:
-                    if widget_id in cls._widget_mappings:
-                        del cls._widget_mappings[widget_id]
+                    recolored, new_style = False, None
+                if not recolored:
+                    for widget_id, widget_ref in members:
+                        widget = widget_ref()
+                        if new_style is not None and widget is not None:
+                            try:
+                                widget.configure(style=new_style)
+                                cls._use_child_style(widget_id, new_style, style)
+                                continue
+                            except Exception:
+                                pass
+                        cls._release_widget(widget_id)
+                if time.perf_counter() >= deadline:
+                    break
         finally:
             cls._is_regenerating = False
 
+        owner = cls._theme_owner
+        if jobs and owner is not None:
+            try:
+                cls._regen_after = (owner, owner.after_idle(cls._regenerate, jobs))
+            except Exception:
+                cls._regen_after = None
+
+    # ---------------- Lifecycle ----------------
+
+    @staticmethod
+    def _watch_destroy(widget: Widget) -> None:
+        """Release the widget's mapping when it is destroyed.
+
+        Uses a bind tag shared by all mapped widgets, so one Tcl command per
+        interpreter serves every widget and no binding of the app is replaced.
+        """
+        tk = widget.tk
+        if not tk.call("bind", _MAPPED_TAG, "<Destroy>"):
+            tk.createcommand(_UNMAP_COMMAND, StatefulIconMixin._release_widget)
+            tk.call("bind", _MAPPED_TAG, "<Destroy>", f"{_UNMAP_COMMAND} %W")
+        path = str(widget)
+        tags = tk.splitlist(tk.call("bindtags", path))
+        if _MAPPED_TAG not in tags:
+            tk.call("bindtags", path, (*tags, _MAPPED_TAG))
+
+    @classmethod
+    def _use_child_style(cls, widget_id: str, child_style: str, style: Style) -> None:
+        """Record that `widget_id` now uses `child_style`, releasing the style it used before."""
+        previous = cls._widget_styles.get(widget_id)
+        if previous == child_style:
+            return
+        ref = cls._child_refs.get(child_style)
+        if ref is None:
+            cls._child_refs[child_style] = [1, style]
+        else:
+            ref[0] += 1
+        cls._widget_styles[widget_id] = child_style
+        if previous is not None:
+            cls._unref_child_style(previous)
+
+    @classmethod
+    def _release_widget(cls, widget_id: str) -> None:
+        """Forget a destroyed (or failed) widget and release its child style."""
+        cls._widget_mappings.pop(widget_id, None)
+        child_style = cls._widget_styles.pop(widget_id, None)
+        if child_style is not None:
+            cls._unref_child_style(child_style)
+
+    @classmethod
+    def _unref_child_style(cls, child_style: str) -> None:
+        """Drop one use of `child_style`; reclaim it and its images when unused."""
+        ref = cls._child_refs.get(child_style)
+        if ref is None:
+            return
+        ref[0] -= 1
+        if ref[0] > 0:
+            return
+        del cls._child_refs[child_style]
+
+        keys = cls._child_maps.pop(child_style, [])
+        for memo_key in [k for k, (name, _) in cls._style_memo.items() if name == child_style]:
+            del cls._style_memo[memo_key]
+        # Images may be shared with other child styles built from the same parent and statespec
+        in_use = {key for child_keys in cls._child_maps.values() for key in child_keys}
+        for key in keys:
+            if key not in in_use:
+                cls._themed_images.pop(key, None)
+        try:
+            # ttk cannot delete a style; an empty map keeps it from naming released images
+            ref[1].map(child_style, image=[])
+        except Exception:
+            pass
+
+    @classmethod
+    def mapping_info(cls) -> dict[str, int]:
+        """Return live counts for monitoring: mapped widgets, child styles in use,
+        owned state images and memoized mappings."""
+        return {
+            "widgets": len(cls._widget_mappings),
+            "child_styles": len(cls._child_refs),
+            "state_images": len(cls._themed_images),
+            "memo": len(cls._style_memo),
+        }
+
     # ---------------- Public API ----------------
 
     def map(
@@ -275,34 +557,71 @@ class StatefulIconMixin:
 
         Returns:
             None
+
+        Note:
+            Results are memoized per theme, icon, parent style and options, so
+            mapping many widgets the same way builds the child style once and
+            later calls only configure the widget.
         """
         style = Style()
         parent_style = widget.cget("style") or widget.winfo_class()
-
-        # Build (state, icon_name, color) triples
-        triples = self._parse_statespec(style, parent_style, statespec)
-
-        # Determine child style name
-        used_names = {self.name} | {nm for _, nm, _ in triples}  # type: ignore[attr-defined]
-        if subclass:
-            child_prefix = subclass
+        memo_key = (
+            style.theme_use(), type(self), self.name, self.size,  # type: ignore[attr-defined]
+            parent_style, subclass, _freeze_statespec(statespec), mode,
+        )
+        memo = StatefulIconMixin._style_memo.get(memo_key)
+        # Valid while no later map() rebuilt the same child style
+        if memo is not None and StatefulIconMixin._child_maps.get(memo[0]) is memo[1]:
+            new_style = memo[0]
         else:
-            # Hash the concatenated icon names and size to avoid style naming conflicts
-            names_token = "-".join(sorted(used_names))
-            hash_input = f"{names_token}-{self.size}"  # type: ignore[attr-defined]
-            hash_digest = hashlib.sha256(hash_input.encode()).hexdigest()[:12]
-            child_prefix = hash_digest
-        new_style = f"{child_prefix}.{parent_style}"
+            new_style = self._apply_style_map(style, parent_style, subclass, statespec, mode)
+            StatefulIconMixin._style_memo[memo_key] = (new_style, StatefulIconMixin._child_maps[new_style])
+        widget.configure(style=new_style)
 
-        # Render images
-        incoming_pairs: list[tuple[str, object]] = []
-        for st, icon_name, color in triples:
+        if not StatefulIconMixin._is_regenerating:
+            widget_id = str(widget)
+            StatefulIconMixin._widget_mappings[widget_id] = (
+                self,
+                weakref.ref(widget),
+                parent_style,
+                subclass,
+                statespec,
+                mode,
+            )
+            StatefulIconMixin._use_child_style(widget_id, new_style, style)
             try:
-                img = self._render_icon(icon_name, self.size, color)  # type: ignore[attr-defined]
-                incoming_pairs.append((st, img))
+                StatefulIconMixin._watch_destroy(widget)
             except Exception:
-                # Skip invalid name/color safely
-                continue
+                pass
+
+            try:
+                if not hasattr(StatefulIconMixin, '_theme_bind_done'):
+                    toplevel = widget.winfo_toplevel()
+                    toplevel.bind("<<ThemeChanged>>", StatefulIconMixin._on_theme_changed, add=True)
+                    StatefulIconMixin._theme_bind_done = True
+                    StatefulIconMixin._theme_owner = toplevel
+            except Exception:
+                pass
+
+    def _apply_style_map(
+            self,
+            style: Style,
+            parent_style: str,
+            subclass: Optional[str],
+            statespec: Optional[list[IconStateSpec]],
+            mode: StateMapMode,
+    ) -> str:
+        """Render the state images and map them onto the child style of `parent_style`.
+
+        Returns:
+            The name of the child style.
+        """
+        from .icon import Icon
+
+        # Build (state, icon_name, color) triples
+        triples = self._parse_statespec(style, parent_style, statespec)
+        new_style = self._child_style_name(parent_style, subclass, triples)
+        frozen = _freeze_statespec(statespec)
 
         # Merge/replace with deterministic order
         if mode == "replace":
@@ -321,6 +640,19 @@ class StatefulIconMixin:
                 existing_pairs = []
 
         existing_dict = dict(existing_pairs) if existing_pairs else {}
+
+        # Render all state images (and the '' fallback when no map provides one) in one batch
+        wanted = [(self._themed_key(nm, parent_style, frozen, st), nm, color) for st, nm, color in triples]
+        fallback_key = self._themed_key(self.name, parent_style, frozen, "")  # type: ignore[attr-defined]
+        if "" not in existing_dict and all(st != "" for st, _, _ in triples):
+            # Fallback for the '' state with the normal foreground color
+            normal_color = style.lookup(parent_style, "foreground") or None
+            wanted.append((fallback_key, self.name, normal_color))  # type: ignore[attr-defined]
+        with Icon.cache_namespace(STATE_IMAGE_NAMESPACE):
+            images = self._themed_images_for(wanted)
+        # Invalid names/colors are skipped
+        owned = [key for key, _, _ in wanted if key in images]
+        incoming_pairs = [(st, images[key]) for (key, _, _), (st, _, _) in zip(wanted, triples) if key in images]
         incoming_dict = dict(incoming_pairs)
         merged = {**existing_dict, **incoming_dict}
 
@@ -330,22 +662,27 @@ class StatefulIconMixin:
             if st not in existing_dict:
                 ordered.append((st, merged[st]))
 
-        # Create fallback image for '' state with normal foreground color
-        # If we don't have an explicit '' state already, render one with the normal color
-        fallback_img = merged.get("")
+        # Fallback image for the '' state: rendered above with the normal foreground color
+        fallback_img = merged.get("", images.get(fallback_key))
         if fallback_img is None:
-            # Get the normal state foreground color
-            normal_color = style.lookup(parent_style, "foreground") or None
-            try:
-                fallback_img = self._render_icon(self.name, self.size, normal_color)  # type: ignore[attr-defined]
-            except Exception:
-                # Fall back to original untinted image if rendering fails
-                self._ensure_original_image()
-                fallback_img = self._original_image
+            # Fall back to original untinted image if rendering fails
+            self._ensure_original_image()
+            fallback_img = self._original_image
 
         image_map = [(st, img) for st, img in ordered if st != ""]
         image_map.append(("", fallback_img))
 
+        # Entries kept from an earlier map of this child style still name owned images;
+        # record them so releasing a sibling style that shares them cannot delete them
+        themed = StatefulIconMixin._themed_images
+        previous = {
+            str(themed[key][0]): key for key in StatefulIconMixin._child_maps.get(new_style, ()) if key in themed
+        }
+        for st, img in image_map:
+            key = previous.get(str(img))
+            if st not in incoming_dict and key is not None and key not in owned:
+                owned.append(key)
+
         # Configure compound and apply map
         try:
             style.configure(new_style, compound="left")
@@ -353,23 +690,58 @@ class StatefulIconMixin:
             pass
 
         style.map(new_style, image=image_map)
-        widget.configure(style=new_style)
+        StatefulIconMixin._child_maps[new_style] = owned
+        return new_style
 
-        if not StatefulIconMixin._is_regenerating:
-            widget_id = str(widget)
-            StatefulIconMixin._widget_mappings[widget_id] = (
-                self,
-                weakref.ref(widget),
-                parent_style,
-                subclass,
-                statespec,
-                mode,
-            )
+    def _recolor_style_map(
+            self,
+            style: Style,
+            parent_style: str,
+            subclass: Optional[str],
+            statespec: Optional[list[IconStateSpec]],
+    ) -> Optional[str]:
+        """Recolor the state images of an existing child style in place for the current theme.
 
-            try:
-                toplevel = widget.winfo_toplevel()
-                if not hasattr(StatefulIconMixin, '_theme_bind_done'):
-                    toplevel.bind("<<ThemeChanged>>", StatefulIconMixin._on_theme_changed, add=True)
-                    StatefulIconMixin._theme_bind_done = True
-            except Exception:
-                pass
+        Only possible when the child style's map was built from the same
+        states and icons it would get now and every image can be recolored;
+        each image is rewritten at most once however many styles share it.
+
+        Returns:
+            The name of the child style, or `None` when its map must be rebuilt.
+        """
+        triples = self._parse_statespec(style, parent_style, statespec)
+        new_style = self._child_style_name(parent_style, subclass, triples)
+        frozen = _freeze_statespec(statespec)
+
+        wanted = [(self._themed_key(nm, parent_style, frozen, st), nm, color) for st, nm, color in triples]
+        if all(st != "" for st, _, _ in triples):
+            normal_color = style.lookup(parent_style, "foreground") or None
+            wanted.append((self._themed_key(self.name, parent_style, frozen, ""), self.name, normal_color))  # type: ignore[attr-defined]
+        if [key for key, _, _ in wanted] != StatefulIconMixin._child_maps.get(new_style):
+            return None
+
+        themed = StatefulIconMixin._themed_images
+        if any(themed.get(key) is None or (themed[key][1] != color and themed[key][2] is None)
+               for key, _, color in wanted):
+            return None
+        self._themed_images_for(wanted)
+        return new_style
+
+    def _themed_key(self, name: str, parent_style: str, frozen_statespec: Optional[tuple], state: str) -> tuple:
+        """Return the key of the owned image of icon `name` for `state` of a child style."""
+        return type(self), name, self.size, parent_style, frozen_statespec, state  # type: ignore[attr-defined]
+
+    def _child_style_name(
+            self, parent_style: str, subclass: Optional[str], triples: list[tuple[str, str, Optional[str]]]
+    ) -> str:
+        """Return the child style name for the icons used by `triples`."""
+        used_names = {self.name} | {nm for _, nm, _ in triples}  # type: ignore[attr-defined]
+        if subclass:
+            child_prefix = subclass
+        else:
+            # Hash the concatenated icon names and size to avoid style naming conflicts
+            names_token = "-".join(sorted(used_names))
+            hash_input = f"{names_token}-{self.size}"  # type: ignore[attr-defined]
+            hash_digest = hashlib.sha256(hash_input.encode()).hexdigest()[:12]
+            child_prefix = hash_digest
+        return f"{child_prefix}.{parent_style}"
@@ -13,7 +13,15 @@ import re
 import sys
 import urllib.request
 from pathlib import Path
-from typing import Dict, Iterable, Tuple
+from typing import TYPE_CHECKING, Dict, Iterable, Tuple
+
+from .context import font_digest
+from .glyphmap import CompiledGlyphmap, compiled_glyphmap_name, write_compiled_glyphmap
+from .metrics import REF_SIZE, encode_glyph_metrics, glyph_metrics_filename
+from .name_index import name_index_filename, write_name_index
+
+if TYPE_CHECKING:
+    from .providers import BaseFontProvider
 
 
 def download_to(url: str, dest: Path) -> None:
@@ -242,6 +250,86 @@ def write_glyphmap(path: Path, mapping: Dict[str, int]) -> None:
     # Write as a flat dict of name -> hex codepoint string
     data = {name: f"{code:04x}" for name, code in sorted(mapping.items())}
     path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    # Also emit the compiled sidecar that is memory-mapped at runtime
+    write_compiled_glyphmap(path.with_name(compiled_glyphmap_name(path.name)), mapping)
+
+
+def compile_glyphmap(json_path: Path) -> Path:
+    """Compile an existing `glyphmap*.json` into its `glyphmap*.bin` sidecar.
+
+    Returns the path of the compiled file.
+    """
+    mapping = glyphmap_from_metadata(load_json(str(json_path)))
+    out = json_path.with_name(compiled_glyphmap_name(json_path.name))
+    write_compiled_glyphmap(out, mapping)
+    return out
+
+
+def compile_glyphmaps(package_dir: Path) -> list[Path]:
+    """Compile every `glyphmap*.json` found directly in *package_dir*."""
+    return [compile_glyphmap(p) for p in sorted(package_dir.glob("glyphmap*.json"))]
+
+
+def write_name_indexes(provider: BaseFontProvider, package_dir: Path) -> list[Path]:
+    """Precompile *provider*'s per-style name indexes into `nameindex*.bin` sidecars.
+
+    Each style is indexed over the compiled glyph map in *package_dir* (compiled
+    from its JSON first when missing; styles without a glyph map are skipped), so the provider can load the index at
+    runtime instead of running its style predicates over every glyph.
+
+    Returns the paths of the written files.
+    """
+    written = []
+    for style in (provider.style_list if provider.has_styles else (None,)):
+        json_path = package_dir / provider.glyphmap_filename(style)
+        bin_path = json_path.with_name(compiled_glyphmap_name(json_path.name))
+        if not bin_path.is_file():
+            if not json_path.is_file():
+                # Style assets not generated (yet); it is indexed at runtime
+                continue
+            compile_glyphmap(json_path)
+        glyphmap = CompiledGlyphmap(bin_path.read_bytes())
+        out = package_dir / name_index_filename(style)
+        write_name_index(out, provider.index_style(style, glyphmap), glyphmap, provider)
+        written.append(out)
+    return written
+
+
+def write_glyph_metrics(provider: BaseFontProvider, package_dir: Path) -> list[Path]:
+    """Measure every glyph of *provider*'s fonts into `<font>.metrics.bin` sidecars.
+
+    Bounding boxes and font ascent/descent are measured once with Pillow at a
+    large reference size, covering every codepoint of the glyph maps in
+    *package_dir* that use the font. The renderer scales them to center glyphs
+    without measuring them at render time. Styles without a glyph map are
+    skipped.
+
+    Returns the paths of the written files.
+    """
+    from PIL import ImageFont
+
+    codepoints_by_font: dict[str, set[int]] = {}
+    for style in (provider.style_list if provider.has_styles else (None,)):
+        json_path = package_dir / provider.glyphmap_filename(style)
+        if not json_path.is_file():
+            continue
+        mapping = glyphmap_from_metadata(load_json(str(json_path)))
+        filename = provider._font_filename_for_style(style)
+        codepoints_by_font.setdefault(filename, set()).update(mapping.values())
+
+    written = []
+    for filename, codepoints in codepoints_by_font.items():
+        font_path = package_dir / filename
+        if not font_path.is_file():
+            continue
+        font = ImageFont.truetype(str(font_path), REF_SIZE)
+        ascent, descent = font.getmetrics()
+        bboxes = [(code, tuple(font.getbbox(chr(code)))) for code in codepoints]
+        digest = font_digest(str(font_path), str(font_path))
+        out = package_dir / glyph_metrics_filename(filename)
+        out.write_bytes(encode_glyph_metrics(digest, ascent, descent, bboxes))
+        written.append(out)
+    return written
 
 
 def ensure_dir(p: Path) -> None:
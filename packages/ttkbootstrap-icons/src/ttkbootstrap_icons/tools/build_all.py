@@ -3,8 +3,11 @@ from __future__ import annotations
 import argparse
 import importlib
 from importlib.metadata import entry_points
+from pathlib import Path
 from typing import Iterable, List, Tuple
 
+from ttkbootstrap_icons.tooling import compile_glyphmaps, write_glyph_metrics, write_name_indexes
+
 
 def discover_provider_packages() -> List[Tuple[str, str]]:
     """Return list of (name, base_package) for installed providers.
@@ -44,6 +47,41 @@ def run_quick_for(base_pkg: str) -> bool:
         return False
 
 
+def load_provider(name: str):
+    """Return the shared provider instance registered under entry point *name*, or None."""
+    try:
+        if name == "bootstrap":
+            from ttkbootstrap_icons.bootstrap import BootstrapFontProvider
+            return BootstrapFontProvider.shared()
+        for ep in entry_points(group="ttkbootstrap_icons.providers", name=name):
+            return ep.load().shared()
+    except Exception:
+        pass
+    return None
+
+
+def compile_for(base_pkg: str, provider=None) -> bool:
+    """Compile the existing glyph maps of `<base_pkg>` into `glyphmap*.bin` sidecars.
+
+    When *provider* is given, its per-style name indexes and glyph metrics are
+    precompiled into `nameindex*.bin` and `<font>.metrics.bin` sidecars as well.
+
+    Returns True if at least one glyph map was compiled, False otherwise.
+    """
+    try:
+        mod = importlib.import_module(base_pkg)
+        package_dir = Path(mod.__file__).resolve().parent
+        written = compile_glyphmaps(package_dir)
+        if written and provider is not None:
+            written += write_name_indexes(provider, package_dir)
+            written += write_glyph_metrics(provider, package_dir)
+    except Exception:
+        return False
+    for path in written:
+        print(f"  Wrote: {path}")
+    return bool(written)
+
+
 def main(argv: Iterable[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         description="Build assets for all installed ttkbootstrap-icons providers using recommended presets.")
@@ -53,6 +91,11 @@ def main(argv: Iterable[str] | None = None) -> int:
         help="Provider names to include (match entry point names, e.g., 'fa', 'ion', 'remix').",
     )
     parser.add_argument("--dry-run", action="store_true", help="List providers without running them.")
+    parser.add_argument(
+        "--compile-only",
+        action="store_true",
+        help="Only compile existing glyphmap*.json files into glyphmap*.bin, nameindex*.bin and *.metrics.bin (no downloads).",
+    )
     args = parser.parse_args(list(argv) if argv is not None else None)
 
     found = discover_provider_packages()
@@ -60,6 +103,18 @@ def main(argv: Iterable[str] | None = None) -> int:
         names = set(args.only)
         found = [(name, base) for (name, base) in found if name in names]
 
+    if args.compile_only:
+        # The built-in Bootstrap assets ship with the base package
+        if not args.only or "bootstrap" in args.only:
+            found.insert(0, ("bootstrap", "ttkbootstrap_icons.assets"))
+        ok = True
+        for name, base in found:
+            print(f"\n[{name}] Compiling glyph maps, name indexes and glyph metrics...")
+            if not compile_for(base, load_provider(name)):
+                print(f"[{name}] Failed (no glyph maps found or error)")
+                ok = False
+        return 0 if ok else 2
+
     if not found:
         print("No external providers discovered. Ensure provider packages are installed.")
         return 1
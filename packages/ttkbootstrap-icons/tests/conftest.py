@@ -0,0 +1,136 @@
+"""Shared fixtures.
+
+Tk needs a display, so the tests run against a minimal stand-in interpreter
+and a `PhotoImage` that keeps its PIL image, which is enough for the cache,
+lifecycle and recolor logic under test.
+"""
+
+import itertools
+import tkinter
+from concurrent.futures import Executor, Future
+
+import pytest
+
+import ttkbootstrap_icons.icon as icon_module
+from ttkbootstrap_icons import Icon
+from ttkbootstrap_icons.stateful_icon_mixin import StatefulIconMixin
+
+
+class FakePhotoImage:
+    """`ImageTk.PhotoImage` stand-in holding the PIL image it shows."""
+
+    _ids = itertools.count()
+
+    def __init__(self, image=None, master=None, **kw):
+        self.image = image
+        self.master = master
+        self._name = f"pyimage{next(self._ids)}"
+
+    def width(self):
+        return self.image.width
+
+    def height(self):
+        return self.image.height
+
+    def paste(self, image):
+        self.image = image
+
+    def __str__(self):
+        return self._name
+
+
+class FakeInterpreter:
+    """Tcl interpreter stand-in for commands, bind tags and `<Destroy>` bindings."""
+
+    def __init__(self):
+        self.commands = {}
+        self.bindings = {}
+        self.tags = {".": (".", "Tk", "all")}
+
+    def createcommand(self, name, func):
+        self.commands[name] = func
+
+    def splitlist(self, value):
+        return tuple(value)
+
+    def call(self, *args):
+        if args[0] == "bindtags":
+            if len(args) == 2:
+                return self.tags.get(args[1], (args[1], "TButton", ".", "all"))
+            self.tags[args[1]] = tuple(args[2])
+        elif args[0] == "bind":
+            if len(args) == 3:
+                return self.bindings.get((args[1], args[2]), "")
+            self.bindings[(args[1], args[2])] = args[3]
+        return ""
+
+    def destroy(self, path="."):
+        """Run the `<Destroy>` bindings of the window at `path`."""
+        for tag in self.tags.get(path, ()):
+            script = self.bindings.get((tag, "<Destroy>"))
+            if script:
+                command, *rest = script.split()
+                self.commands[command](*(arg.replace("%W", path) for arg in rest))
+
+
+class FakeRoot:
+    def __init__(self):
+        self.tk = FakeInterpreter()
+
+
+class FakeMaster:
+    """Widget stand-in whose `after()` callbacks run when `run_pending()` is called."""
+
+    def __init__(self, tk):
+        self.tk = tk
+        self.callbacks = {}
+        self._next = 0
+
+    def after(self, delay, callback):
+        self._next += 1
+        self.callbacks[f"after#{self._next}"] = callback
+        return f"after#{self._next}"
+
+    def after_cancel(self, after_id):
+        self.callbacks.pop(after_id, None)
+
+    def run_pending(self):
+        while self.callbacks:
+            self.callbacks.pop(next(iter(self.callbacks)))()
+
+
+class InlineExecutor(Executor):
+    """Runs submitted work immediately on the calling thread."""
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+@pytest.fixture(autouse=True)
+def fake_tk(monkeypatch):
+    """Install a fake default root and `PhotoImage`; reset the icon caches around each test."""
+    Icon.cleanup()
+    StatefulIconMixin._widget_mappings.clear()
+    StatefulIconMixin._themed_images.clear()
+    StatefulIconMixin._child_maps.clear()
+    StatefulIconMixin._style_memo.clear()
+    StatefulIconMixin._widget_styles.clear()
+    StatefulIconMixin._child_refs.clear()
+    root = FakeRoot()
+    monkeypatch.setattr(tkinter, "_default_root", root)
+    monkeypatch.setattr(icon_module, "PhotoImage", FakePhotoImage)
+    yield root
+    Icon.cleanup()
+
+
+@pytest.fixture
+def master(fake_tk):
+    """A widget of the fake root whose scheduled callbacks run on `run_pending()`."""
+    return FakeMaster(fake_tk.tk)
+
+
+@pytest.fixture
+def inline_executor():
+    return InlineExecutor()
@@ -0,0 +1,157 @@
+import gc
+import shutil
+import sys
+import weakref
+from importlib.resources import files
+
+import pytest
+
+from ttkbootstrap_icons import BootstrapIcon, Icon
+from ttkbootstrap_icons.bootstrap import BootstrapFontProvider
+from ttkbootstrap_icons.cache import LRUCache
+
+
+class OtherProvider(BootstrapFontProvider):
+    """Bootstrap glyphs served from another package, i.e. another provider and font file."""
+
+    def __init__(self):
+        super().__init__()
+        self._name = "other"
+        self._package = "other_assets"
+
+
+@pytest.fixture
+def other_provider(tmp_path, monkeypatch):
+    package_dir = tmp_path / "other_assets"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text("")
+    assets = files("ttkbootstrap_icons.assets")
+    for name in ("glyphmap.json", "bootstrap.ttf"):
+        shutil.copy(assets.joinpath(name), package_dir)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield OtherProvider()
+    sys.modules.pop("other_assets", None)
+    for cache in (OtherProvider._name_lookup_global, OtherProvider._resolve_cache_global):
+        cache.pop(OtherProvider, None)
+    for key in [key for key in OtherProvider._glyphmap_cache_global if key[0] is OtherProvider]:
+        del OtherProvider._glyphmap_cache_global[key]
+
+
+def cached_keys():
+    return set(Icon._partition().images.keys())
+
+
+def test_lru_evicts_least_recently_used_by_entries():
+    evicted = []
+    cache = LRUCache(max_entries=2, on_evict=lambda key, value: evicted.append(key))
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.get("a") == 1
+    cache["c"] = 3
+    assert evicted == ["b"]
+    assert cache.keys() == ["a", "c"]
+    assert cache.info()["evictions"] == 1
+
+
+def test_lru_evicts_by_bytes_and_on_new_limits():
+    cache = LRUCache(max_bytes=10, sizeof=len)
+    cache["a"] = "xxxx"
+    cache["b"] = "xxxx"
+    cache["a"] = "xxxxxxx"
+    assert cache.keys() == ["a"]
+    assert cache.total_bytes == 7
+    cache.set_limits(max_bytes=5)
+    assert len(cache) == 0 and cache.total_bytes == 0
+
+
+def test_lru_pop_and_clear_keep_byte_total():
+    cache = LRUCache(sizeof=len)
+    cache["a"] = "xxx"
+    cache["b"] = "xx"
+    assert cache.pop("a") == "xxx"
+    assert cache.pop("a", "missing") == "missing"
+    assert cache.total_bytes == 2
+    cache.clear()
+    assert cache.total_bytes == 0
+
+
+@pytest.fixture
+def no_gc():
+    gc.disable()
+    yield
+    gc.enable()
+
+
+def test_destroying_root_releases_its_images_immediately(fake_tk, no_gc):
+    image = weakref.ref(BootstrapIcon("house", 16, "red").image)
+    placeholder = weakref.ref(Icon._get_transparent(16))
+    assert Icon.cache_info()["interpreters"] == 1
+
+    fake_tk.tk.destroy(".")
+    assert Icon.cache_info()["interpreters"] == 0
+    assert image() is None
+    assert placeholder() is None
+
+
+@pytest.mark.parametrize("criteria, dropped", [
+    ({"provider": "bootstrap"}, {"panel", "large", "blue", "fill"}),
+    ({"provider": "bootstrap", "style": "fill"}, {"fill"}),
+    ({"provider": "other", "size": 16}, {"other"}),
+    ({"size": 24}, {"large"}),
+    ({"color": "blue"}, {"blue"}),
+    ({"namespace": "panel"}, {"panel"}),
+    ({"namespace": "unused"}, set()),
+])
+def test_invalidate_drops_only_matching_images(fake_tk, other_provider, criteria, dropped):
+    bootstrap = BootstrapFontProvider.shared()
+    font_key = bootstrap.font_key()
+    images = {
+        "large": ("house", 24, "red", font_key),
+        "blue": ("house", 16, "blue", font_key),
+        "fill": ("house-fill", 16, "red", font_key),
+        "other": ("house", 16, "red", other_provider.font_key()),
+        "panel": ("house", 16, "red", font_key),
+    }
+    with Icon.cache_namespace("panel"):
+        BootstrapIcon("house", 16, "red")
+    BootstrapIcon("house", 24, "red")
+    BootstrapIcon("house", 16, "blue")
+    BootstrapIcon("house", 16, "red", style="fill")
+    Icon.initialize_with_provider(other_provider)
+    Icon("house", 16, "red")
+    assert cached_keys() == set(images.values())
+
+    providers = {"bootstrap": bootstrap, "other": other_provider}
+    if "provider" in criteria:
+        criteria = dict(criteria, provider=providers[criteria["provider"]])
+    assert Icon.invalidate(**criteria) == len(dropped)
+    assert cached_keys() == {key for label, key in images.items() if label not in dropped}
+    if "panel" in dropped:
+        assert "panel" not in Icon._partition().namespaces
+
+
+def test_evicted_images_are_untagged(fake_tk):
+    font_key = BootstrapFontProvider.shared().font_key()
+    with Icon.cache_namespace("panel"):
+        BootstrapIcon("house", 16, "red")
+        BootstrapIcon("gear", 16, "red")
+    Icon.set_cache_limits(max_entries=1)
+    try:
+        assert Icon._partition().namespaces == {"panel": {("gear", 16, "red", font_key)}}
+        BootstrapIcon("star", 16, "red")
+        assert Icon._partition().namespaces == {}
+        assert Icon.invalidate(namespace="panel") == 0
+    finally:
+        Icon.set_cache_limits(max_entries=4096)
+
+
+def test_image_cache_limit_applies_to_rendered_icons(fake_tk):
+    Icon.set_cache_limits(max_entries=2)
+    try:
+        for color in ("red", "green", "blue"):
+            BootstrapIcon("house", 16, color)
+        info = Icon.cache_info()
+        assert info["entries"] == 2
+        assert info["evictions"] == 1
+    finally:
+        Icon.set_cache_limits(max_entries=4096)
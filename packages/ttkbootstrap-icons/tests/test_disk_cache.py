@@ -0,0 +1,56 @@
+import os
+
+import pytest
+from PIL import Image
+
+from ttkbootstrap_icons import BootstrapIcon
+from ttkbootstrap_icons.disk_cache import DiskMaskCache
+
+
+@pytest.fixture
+def ctx():
+    return BootstrapIcon("house", 16)._ctx
+
+
+def test_hit_protects_entry_from_pruning(tmp_path, ctx):
+    cache = DiskMaskCache(tmp_path, max_bytes=None)
+    mask = Image.new("L", (16, 16), 255)
+    for glyph in "abc":
+        cache.put(ctx, glyph, 16, mask)
+    # Written oldest first: a, b, c
+    for age, glyph in zip((300, 200, 100), "abc"):
+        path = cache._path(ctx, glyph, 16)
+        stamp = path.stat().st_mtime - age
+        os.utime(path, (stamp, stamp))
+
+    assert cache.get(ctx, "a", 16) is not None
+    entry_size = cache._path(ctx, "a", 16).stat().st_size
+    cache.set_limit(entry_size * 5 // 2)
+
+    assert cache.get(ctx, "a", 16) is not None
+    assert cache.get(ctx, "b", 16) is None
+    assert cache.get(ctx, "c", 16) is not None
+
+
+def test_directory_is_scanned_and_pruned_without_the_lock(tmp_path, ctx, monkeypatch):
+    cache = DiskMaskCache(tmp_path, max_bytes=None)
+    mask = Image.new("L", (16, 16), 255)
+    cache.put(ctx, "a", 16, mask)
+    entry_size = cache._path(ctx, "a", 16).stat().st_size
+
+    scans = []
+    entries = DiskMaskCache._entries
+
+    def checked_entries(self):
+        scans.append(self._lock.locked())
+        return entries(self)
+
+    monkeypatch.setattr(DiskMaskCache, "_entries", checked_entries)
+    cache.set_limit(entry_size * 5 // 2)
+    for glyph in "bcd":
+        cache.put(ctx, glyph, 16, mask)
+    cache.clear()
+
+    assert scans and not any(scans)
+    assert cache.evictions == 2
+    assert cache.info()["bytes"] == 0
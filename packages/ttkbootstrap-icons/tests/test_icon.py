@@ -0,0 +1,81 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ttkbootstrap_icons import BootstrapIcon, Icon, get_image
+from ttkbootstrap_icons.bootstrap import BootstrapFontProvider
+
+
+def test_none_color_renders_default_fill():
+    image = BootstrapIcon("house", 24, None).image.image
+    # Opaque white glyph on a transparent white background, as `ImageDraw.text(fill=None)` draws it
+    assert image.getextrema() == ((255, 255), (255, 255), (255, 255), (0, 255))
+    assert image.getpixel((12, 12)) == (255, 255, 255, 0)
+
+
+def test_none_color_state_images_are_rendered():
+    icon = BootstrapIcon("house", 16)
+    results = icon._render_themed_icons([("house", None), ("house", "#ff0000")])
+    assert all(result is not None for result in results)
+    assert results[0][0].image.getpixel((8, 4))[:3] == (255, 255, 255)
+
+
+def test_get_image_returns_the_icon_image():
+    provider = BootstrapFontProvider.shared()
+    assert get_image(provider, "house", 16, "red") is BootstrapIcon("house", 16, "red").image
+    # Either path may render first
+    icon = BootstrapIcon("house", 20, "blue", style="fill")
+    assert get_image(provider, "house", 20, "blue", style="fill") is icon.image
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_render_many_keeps_order_and_per_spec_options(workers):
+    specs = ["house", ("gear", 16), ("trash", 20, "red"), ("star", 24, "#00ff00", "fill"), "house"]
+    executor = ThreadPoolExecutor(workers) if workers else None
+    try:
+        images = Icon.render_many(BootstrapFontProvider.shared(), specs, 32, "blue", executor=executor)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    expected = [
+        BootstrapIcon("house", 32, "blue").image,
+        BootstrapIcon("gear", 16, "blue").image,
+        BootstrapIcon("trash", 20, "red").image,
+        BootstrapIcon("star", 24, "#00ff00", style="fill").image,
+        BootstrapIcon("house", 32, "blue").image,
+    ]
+    assert all(image is want for image, want in zip(images, expected, strict=True))
+
+
+@pytest.fixture
+def uniform_bootstrap():
+    BootstrapFontProvider.set_uniform_scale()
+    yield
+    BootstrapFontProvider._uniform_scale_global.pop(BootstrapFontProvider, None)
+
+
+def test_uniform_extents_are_shared_and_measured_without_the_global_lock(uniform_bootstrap, monkeypatch):
+    layout = Icon._layout
+    lock_free = []
+
+    def probe():
+        acquired = Icon._lock.acquire(timeout=1)
+        if acquired:
+            Icon._lock.release()
+        lock_free.append(acquired)
+
+    def checked_layout(ctx, glyph, size):
+        # The global lock is reentrant, so it is probed from another thread
+        thread = threading.Thread(target=probe)
+        thread.start()
+        thread.join()
+        monkeypatch.setattr(Icon, "_layout", layout)
+        return layout(ctx, glyph, size)
+
+    monkeypatch.setattr(Icon, "_layout", checked_layout)
+    BootstrapIcon("house", 16, "red")
+    BootstrapIcon("house-fill", 16, "red")
+    assert lock_free == [True]
+    # Both styles use the same font and glyph map
+    assert len(Icon._glyph_extents) == 1
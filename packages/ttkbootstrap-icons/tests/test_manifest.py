@@ -0,0 +1,44 @@
+import pytest
+
+from ttkbootstrap_icons import BootstrapIcon, Icon
+from ttkbootstrap_icons.bootstrap import BootstrapFontProvider
+from ttkbootstrap_icons.manifest import preload, start_recording, stop_recording
+from ttkbootstrap_icons.name_index import provider_id
+
+
+def test_state_images_are_recorded():
+    icon = BootstrapIcon("house", 16, "black")
+    recorder = start_recording(save_at_exit=False)
+    try:
+        icon._render_themed_icons([("house", "#0000ff"), ("gear", "#888888"), ("no-such-icon", "red")])
+    finally:
+        stop_recording()
+    recorded = {(name, size, color) for _, _, name, size, color in recorder.entries()}
+    assert recorded == {("house", 16, "#0000ff"), ("gear", 16, "#888888")}
+
+
+@pytest.fixture
+def entries():
+    bootstrap = provider_id(BootstrapFontProvider.shared())
+    return [
+        (bootstrap, None, "house", 16, "red"),
+        (bootstrap, None, "house", 16, "blue"),
+        (bootstrap, None, "gear", 24, "red"),
+        ("ttkbootstrap_icons_missing.provider:MissingFontProvider", None, "house", 16, "red"),
+        (bootstrap, None, "no-such-icon", 16, "red"),
+    ]
+
+
+def test_preload_without_master_warms_masks_and_skips_unavailable_entries(entries, inline_executor):
+    # Both colors of the house share one mask
+    assert preload(entries, executor=inline_executor).result(timeout=0) == 2
+
+
+def test_preload_with_master_creates_images_and_skips_unavailable_entries(entries, master, inline_executor):
+    future = preload(entries, master=master, executor=inline_executor)
+    master.run_pending()
+    assert future.result(timeout=0) == 3
+
+    font_key = BootstrapFontProvider.shared().font_key()
+    assert set(Icon._partition().images.keys()) == {
+        ("house", 16, "red", font_key), ("house", 16, "blue", font_key), ("gear", 24, "red", font_key)}
@@ -0,0 +1,46 @@
+from tkinter import TclError
+
+import pytest
+
+import ttkbootstrap_icons.icon as icon_module
+from ttkbootstrap_icons.bootstrap import BootstrapFontProvider
+from ttkbootstrap_icons.prerender import PrerenderQueue
+
+
+@pytest.fixture
+def queue(master, inline_executor):
+    queue = PrerenderQueue(master, executor=inline_executor)
+    yield queue
+    queue.close()
+
+
+def test_delivers_icons(queue):
+    future = queue.submit(BootstrapFontProvider.shared(), "house", 16, "red")
+    queue._master.run_pending()
+    assert future.result().width() == 16
+    assert queue.pending == 0
+
+
+def test_image_creation_error_fails_only_its_future(queue, monkeypatch):
+    photo_image = icon_module.PhotoImage
+
+    def failing(image=None, **kw):
+        if image.getpixel((8, 4))[:3] == (0, 0, 255):
+            raise TclError("interpreter is gone")
+        return photo_image(image=image, **kw)
+
+    monkeypatch.setattr(icon_module, "PhotoImage", failing)
+    provider = BootstrapFontProvider.shared()
+    failed = queue.submit(provider, "house", 16, "blue")
+    delivered = queue.submit(provider, "house", 16, "red")
+    queue._master.run_pending()
+
+    assert isinstance(failed.exception(timeout=0), TclError)
+    assert delivered.result(timeout=0).width() == 16
+    assert queue.pending == 0
+
+
+def test_unknown_name_fails_future(queue):
+    future = queue.submit(BootstrapFontProvider.shared(), "no-such-icon", 16)
+    queue._master.run_pending()
+    assert isinstance(future.exception(timeout=0), ValueError)
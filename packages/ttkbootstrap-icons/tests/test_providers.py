@@ -0,0 +1,122 @@
+import json
+import shutil
+import sys
+from importlib.resources import files
+
+import pytest
+
+from ttkbootstrap_icons import BootstrapIcon, Icon
+from ttkbootstrap_icons.bootstrap import BootstrapFontProvider
+from ttkbootstrap_icons.glyphmap import CompiledGlyphmap, write_compiled_glyphmap
+from ttkbootstrap_icons.name_index import StyleIndex
+from ttkbootstrap_icons.metrics import GlyphMetrics
+from ttkbootstrap_icons.tooling import glyphmap_from_metadata, write_name_indexes
+
+
+class CompiledBootstrapProvider(BootstrapFontProvider):
+    """Bootstrap provider reading compiled assets from the `parity_assets` package."""
+
+    def __init__(self):
+        super().__init__()
+        self._package = "parity_assets"
+
+
+@pytest.fixture
+def compiled_provider(tmp_path, monkeypatch):
+    package_dir = tmp_path / "parity_assets"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text("")
+    shutil.copy(files("ttkbootstrap_icons.assets").joinpath("glyphmap.json"), package_dir)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    provider = CompiledBootstrapProvider()
+    write_name_indexes(provider, package_dir)
+    yield provider
+    sys.modules.pop("parity_assets", None)
+    # Class-keyed caches would otherwise keep the removed package's mapped files
+    CompiledBootstrapProvider._name_lookup_global.pop(CompiledBootstrapProvider, None)
+    CompiledBootstrapProvider._resolve_cache_global.pop(CompiledBootstrapProvider, None)
+    for style_key in ("single", "fill", "outline"):
+        CompiledBootstrapProvider._glyphmap_cache_global.pop((CompiledBootstrapProvider, style_key), None)
+
+
+def resolve_all(provider, requests):
+    results = []
+    for name, style in requests:
+        try:
+            results.append(provider.resolve_icon_name(name, style))
+        except ValueError as exc:
+            results.append(exc.args)
+    return results
+
+
+def test_cached_resolve_failure_raises_fresh_errors():
+    provider = BootstrapFontProvider.shared()
+    errors = []
+    for _ in range(2):
+        with pytest.raises(ValueError) as info:
+            provider.resolve_icon_name("no-such-icon")
+        errors.append(info.value)
+    assert errors[0] is not errors[1]
+    assert errors[0].args == errors[1].args
+    assert provider._resolve_cache().get(("no-such-icon", None)) == errors[0].args
+
+
+def test_compiled_and_json_resolution_agree(compiled_provider, monkeypatch):
+    raw_names = list(json.loads(files("ttkbootstrap_icons.assets").joinpath("glyphmap.json").read_text()))
+    names = raw_names + [name.removesuffix("-fill") for name in raw_names] + [
+        name.upper() for name in raw_names[:50]] + ["none", "no-such-icon", "house-outline", "house-fill"]
+    requests = [(name, style) for name in names for style in (None, "fill", "outline")]
+
+    expected = resolve_all(BootstrapFontProvider(), requests)
+    assert any(isinstance(result, tuple) for result in expected)
+    assert any(isinstance(result, str) for result in expected)
+
+    def not_precompiled(*args, **kwargs):
+        raise AssertionError("name index was not loaded from the compiled sidecar")
+
+    monkeypatch.setattr(StyleIndex, "build", not_precompiled)
+    assert resolve_all(compiled_provider, requests) == expected
+    assert isinstance(compiled_provider._read_glyphmap_for_style("fill"), CompiledGlyphmap)
+
+
+def test_set_uniform_scale_applies_to_shared_provider(fake_tk):
+    provider = BootstrapFontProvider.shared()
+    assert not provider.uniform_scale
+    BootstrapIcon("house", 16, "red")
+    try:
+        BootstrapFontProvider.set_uniform_scale()
+        assert provider.uniform_scale
+        # Cached images were rendered at the old scale
+        assert Icon.cache_info()["entries"] == 0
+        assert BootstrapIcon("house", 16, "red")._ctx.uniform_scale
+    finally:
+        BootstrapFontProvider._uniform_scale_global.pop(BootstrapFontProvider, None)
+    assert not BootstrapIcon("house", 16, "red")._ctx.uniform_scale
+
+
+def test_display_index_lists_glyph_names_in_glyph_map_order():
+    provider = BootstrapFontProvider()
+    names_by_style = provider.build_display_index()["names_by_style"]
+    for style in provider.style_list:
+        in_style = provider._style_predicate(style)
+        assert list(names_by_style[style]) == [name for name in provider.load_glyphmap(style) if in_style(name)]
+
+
+def test_installed_provider_loads_the_shipped_sidecars(tmp_path, monkeypatch):
+    # Start from empty class caches so the provider reads its package resources
+    for cache in ("_glyphmap_cache_global", "_glyph_metrics_global", "_name_lookup_global", "_resolve_cache_global"):
+        monkeypatch.setattr(BootstrapFontProvider, cache, {})
+
+    def not_precompiled(*args, **kwargs):
+        raise AssertionError("name index was not loaded from the compiled sidecar")
+
+    monkeypatch.setattr(StyleIndex, "build", not_precompiled)
+    provider = BootstrapFontProvider()
+    assert provider.resolve_icon_name("house", "fill") == "house-fill"
+    assert isinstance(provider.load_glyphmap("fill"), CompiledGlyphmap)
+    assert isinstance(provider.load_glyph_metrics("fill"), GlyphMetrics)
+
+    # The shipped compiled glyph map is up to date with the JSON it was compiled from
+    assets = files("ttkbootstrap_icons.assets")
+    write_compiled_glyphmap(tmp_path / "glyphmap.bin", glyphmap_from_metadata(json.loads(assets.joinpath("glyphmap.json").read_text())))
+    assert assets.joinpath("glyphmap.bin").read_bytes() == (tmp_path / "glyphmap.bin").read_bytes()
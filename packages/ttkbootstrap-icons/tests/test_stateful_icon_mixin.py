@@ -0,0 +1,240 @@
+import itertools
+
+import pytest
+
+import ttkbootstrap_icons.stateful_icon_mixin as stateful
+from ttkbootstrap_icons import BootstrapIcon
+from ttkbootstrap_icons.stateful_icon_mixin import StatefulIconMixin
+
+
+PALETTES = {
+    "light": {None: "#111111", "hover": "#0000ff", "disabled": "#888888"},
+    "dark": {None: "#eeeeee", "hover": "#ffaa00", "disabled": "#555555"},
+}
+
+
+class FakeStyle:
+    """`ttk.Style` stand-in with a hover/disabled foreground map per theme."""
+
+    theme = "light"
+    maps: dict = {}
+    map_calls = 0
+
+    def theme_use(self):
+        return FakeStyle.theme
+
+    def lookup(self, style, option, state=None):
+        palette = PALETTES[FakeStyle.theme]
+        return palette.get(state[0] if state else None, palette[None])
+
+    def map(self, style, query_opt=None, **kw):
+        if kw:
+            FakeStyle.map_calls += 1
+            FakeStyle.maps[style] = list(kw["image"])
+        elif query_opt == "foreground":
+            palette = PALETTES[FakeStyle.theme]
+            return [("hover", palette["hover"]), ("disabled", palette["disabled"])]
+        else:
+            return list(FakeStyle.maps.get(style, []))
+
+    def configure(self, style, **kw):
+        pass
+
+
+class FakeWidget:
+    _ids = itertools.count()
+
+    def __init__(self, tk, style="TButton"):
+        self.tk = tk
+        self.style = style
+        self.configured = 0
+        self._path = f".button{next(self._ids)}"
+
+    def __str__(self):
+        return self._path
+
+    def cget(self, option):
+        return self.style
+
+    def winfo_class(self):
+        return "TButton"
+
+    def configure(self, style=None, **kw):
+        self.style = style
+        self.configured += 1
+
+    def winfo_toplevel(self):
+        return self
+
+    def bind(self, *args, **kw):
+        pass
+
+    def winfo_viewable(self):
+        return True
+
+
+class FakeOwner:
+    """Toplevel stand-in that queues idle callbacks until they are run."""
+
+    def __init__(self):
+        self.idle = {}
+        self._ids = itertools.count()
+
+    def after_idle(self, func, *args):
+        after_id = f"after#{next(self._ids)}"
+        self.idle[after_id] = (func, args)
+        return after_id
+
+    def after_cancel(self, after_id):
+        self.idle.pop(after_id, None)
+
+    def run_one(self):
+        func, args = self.idle.pop(next(iter(self.idle)))
+        func(*args)
+
+    def run_idle(self):
+        while self.idle:
+            self.run_one()
+
+
+@pytest.fixture
+def interp(fake_tk, monkeypatch):
+    FakeStyle.theme = "light"
+    FakeStyle.maps = {}
+    FakeStyle.map_calls = 0
+    monkeypatch.setattr(stateful, "Style", FakeStyle)
+    return fake_tk.tk
+
+
+@pytest.fixture
+def owner(interp, monkeypatch):
+    owner = FakeOwner()
+    monkeypatch.setattr(StatefulIconMixin, "_theme_owner", owner)
+    monkeypatch.setattr(StatefulIconMixin, "_theme_bind_done", True, raising=False)
+    monkeypatch.setattr(StatefulIconMixin, "_regen_after", None)
+    monkeypatch.setattr(StatefulIconMixin, "_regen_pending", False)
+    return owner
+
+
+def live_images(style_name):
+    return {str(image) for _, image in FakeStyle.maps[style_name]}
+
+
+def owned_images():
+    return {str(entry[0]) for entry in StatefulIconMixin._themed_images.values()}
+
+
+def state_colors():
+    return {key[-1]: entry[1] for key, entry in StatefulIconMixin._themed_images.items()}
+
+
+def ink(image):
+    """Return the colors of the drawn pixels of a state image."""
+    return {pixel[:3] for pixel in image.image.get_flattened_data() if pixel[3]}
+
+
+def test_destroy_releases_mapping_and_unused_style(interp):
+    icon = BootstrapIcon("house", 16)
+    first, second = FakeWidget(interp), FakeWidget(interp)
+    icon.map(first)
+    icon.map(second)
+    assert first.style == second.style
+    assert StatefulIconMixin.mapping_info() == {"widgets": 2, "child_styles": 1, "state_images": 3, "memo": 1}
+
+    interp.destroy(str(first))
+    assert StatefulIconMixin.mapping_info()["child_styles"] == 1
+
+    interp.destroy(str(second))
+    assert StatefulIconMixin.mapping_info() == {"widgets": 0, "child_styles": 0, "state_images": 0, "memo": 0}
+    assert FakeStyle.maps[second.style] == []
+
+
+def test_release_keeps_images_of_sibling_style(interp):
+    icon = BootstrapIcon("house", 16)
+    merged, pressed, sibling = FakeWidget(interp), FakeWidget(interp), FakeWidget(interp)
+    icon.map(merged, subclass="x")
+    # Merges a pressed state into the same child style; hover/disabled/'' stay mapped
+    icon.map(pressed, subclass="x", statespec=[("pressed", "#123456")])
+    # Same parent style and states as the first map: shares its images
+    icon.map(sibling, subclass="y")
+    assert live_images("y.TButton") <= live_images("x.TButton")
+
+    interp.destroy(str(sibling))
+    assert live_images("x.TButton") <= owned_images()
+
+    interp.destroy(str(merged))
+    interp.destroy(str(pressed))
+    assert StatefulIconMixin.mapping_info()["state_images"] == 0
+
+
+def test_theme_change_events_coalesce_into_one_idle_job(owner):
+    widgets = [FakeWidget(owner) for _ in range(3)]
+    for widget in widgets:
+        BootstrapIcon("house", 16).map(widget)
+
+    FakeStyle.theme = "dark"
+    # <<ThemeChanged>> reaches every widget of the toplevel
+    for _ in widgets:
+        StatefulIconMixin._on_theme_changed(None)
+    assert len(owner.idle) == 1
+
+    owner.run_idle()
+    assert state_colors() == {"hover": "#ffaa00", "disabled": "#555555", "": "#eeeeee"}
+    assert not StatefulIconMixin._regen_pending
+
+
+def test_newer_theme_change_restarts_a_running_regeneration(owner, monkeypatch):
+    # One group per icon; a zero budget yields to the event loop after each group
+    monkeypatch.setattr(StatefulIconMixin, "_regen_budget_ms", 0.0)
+    widgets = {name: FakeWidget(owner) for name in ("house", "gear", "star")}
+    for name, widget in widgets.items():
+        BootstrapIcon(name, 16).map(widget)
+
+    FakeStyle.theme = "dark"
+    StatefulIconMixin._on_theme_changed(None)
+    owner.run_one()
+    assert [func for func, _ in owner.idle.values()] == [StatefulIconMixin._regenerate]
+
+    FakeStyle.theme = "light"
+    StatefulIconMixin._on_theme_changed(None)
+    assert [func for func, _ in owner.idle.values()] == [StatefulIconMixin._start_regeneration]
+
+    owner.run_idle()
+    assert set(state_colors().items()) == {("hover", "#0000ff"), ("disabled", "#888888"), ("", "#111111")}
+
+
+def test_theme_change_recolors_state_images_in_place(owner):
+    icon = BootstrapIcon("house", 16)
+    widgets = [FakeWidget(owner), FakeWidget(owner)]
+    for widget in widgets:
+        icon.map(widget)
+    child_style = widgets[0].style
+    images = {key: entry[0] for key, entry in StatefulIconMixin._themed_images.items()}
+    map_calls = FakeStyle.map_calls
+
+    FakeStyle.theme = "dark"
+    StatefulIconMixin._on_theme_changed(None)
+    owner.run_idle()
+
+    assert FakeStyle.map_calls == map_calls
+    assert [(widget.style, widget.configured) for widget in widgets] == [(child_style, 1)] * 2
+    themed = StatefulIconMixin._themed_images
+    assert {key: entry[0] for key, entry in themed.items()} == images
+    hover = next(entry[0] for key, entry in themed.items() if key[-1] == "hover")
+    assert ink(hover) == {(0xff, 0xaa, 0x00)}
+
+
+def test_memo_is_bypassed_after_a_merge_rebuilds_the_child_style(interp):
+    icon = BootstrapIcon("house", 16)
+    icon.map(FakeWidget(interp), subclass="x")
+    icon.map(FakeWidget(interp), subclass="x", statespec=[("pressed", "#123456")])
+    map_calls = FakeStyle.map_calls
+
+    # Same options as the first call, but the merge above rebuilt x.TButton
+    icon.map(FakeWidget(interp), subclass="x")
+    assert FakeStyle.map_calls == map_calls + 1
+    assert [state for state, _ in FakeStyle.maps["x.TButton"]] == ["hover", "disabled", "pressed", ""]
+
+    # The rebuilt map is memoized again
+    icon.map(FakeWidget(interp), subclass="x")
+    assert FakeStyle.map_calls == map_calls + 1